@@ -2,18 +2,121 @@
 """Analyze cribbage simulation data."""
 
 import argparse
+import csv
+import importlib.util
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional
+
+# pandas, matplotlib and the analysis modules are imported where they are
+# used, so --help and single-analysis runs skip loading what they don't need
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Separator line for the analysis header
+_SEP80 = "=" * 80
+
+# Column types for the hand details CSV; columns not listed are inferred.
+# A single hand or crib scores at most 29, so every per-hand score and
+# category column fits in int8 (hand + crib totals stay below 127 too).
+HANDS_SCHEMA = {
+    "game_number": "int32",
+    "hand_number": "int16",
+    "dealer": "category",
+    "p1_dealt_cards": "string[pyarrow]",
+    "p1_kept_cards": "string[pyarrow]",
+    "p1_discards": "string[pyarrow]",
+    "p1_hand_score": "int8",
+    "p1_hand_fifteens": "int8",
+    "p1_hand_pairs": "int8",
+    "p1_hand_runs": "int8",
+    "p1_hand_flush": "int8",
+    "p1_hand_nobs": "int8",
+    "p1_score_before": "int16",
+    "p1_score_after": "int16",
+    "p2_dealt_cards": "string[pyarrow]",
+    "p2_kept_cards": "string[pyarrow]",
+    "p2_discards": "string[pyarrow]",
+    "p2_hand_score": "int8",
+    "p2_hand_fifteens": "int8",
+    "p2_hand_pairs": "int8",
+    "p2_hand_runs": "int8",
+    "p2_hand_flush": "int8",
+    "p2_hand_nobs": "int8",
+    "p2_score_before": "int16",
+    "p2_score_after": "int16",
+    "crib_cards": "string[pyarrow]",
+    "crib_score": "int8",
+    "crib_fifteens": "int8",
+    "crib_pairs": "int8",
+    "crib_runs": "int8",
+    "crib_flush": "int8",
+    "crib_nobs": "int8",
+    "starter_card": "string[pyarrow]",
+}
+
+# Hand details columns each report reads; game_number is always loaded
+REQUIRED_COLS = {
+    "best_hands": [
+        "dealer",
+        "crib_score",
+        "p1_dealt_cards",
+        "p1_kept_cards",
+        "p1_discards",
+        "p1_hand_score",
+        "p2_dealt_cards",
+        "p2_kept_cards",
+        "p2_discards",
+        "p2_hand_score",
+    ],
+    "scoring_dist": [
+        "crib_score",
+        "p1_hand_score",
+        "p1_hand_fifteens",
+        "p1_hand_pairs",
+        "p1_hand_runs",
+        "p1_hand_flush",
+        "p1_hand_nobs",
+        "p2_hand_score",
+        "p2_hand_fifteens",
+        "p2_hand_pairs",
+        "p2_hand_runs",
+        "p2_hand_flush",
+        "p2_hand_nobs",
+    ],
+    "dealer_adv": [
+        "hand_number",
+        "dealer",
+        "crib_score",
+        "p1_hand_score",
+        "p1_score_before",
+        "p2_hand_score",
+        "p2_score_before",
+    ],
+    "card_values": [
+        "p1_kept_cards",
+        "p1_hand_score",
+        "p2_kept_cards",
+        "p2_hand_score",
+    ],
+}
+
+
+def existing_file(path: str) -> str:
+    """Argparse type that rejects paths which are not existing files.
 
-import pandas as pd
+    Args:
+        path: Path given on the command line
+
+    Returns:
+        The path, unchanged
 
-from src.analysis.best_hands import print_best_hands_report
-from src.analysis.card_values import print_card_values_report
-from src.analysis.dealer_advantage import print_dealer_advantage_report
-from src.analysis.scoring_distribution import (
-    plot_score_distribution,
-    print_scoring_distribution_report,
-)
+    Raises:
+        argparse.ArgumentTypeError: If the file does not exist
+    """
+    if not Path(path).is_file():
+        raise argparse.ArgumentTypeError(f"file not found: {path}")
+    return path
 
 
 def parse_args():
@@ -29,7 +132,7 @@ def parse_args():
 
     parser.add_argument(
         "hands_csv",
-        type=str,
+        type=existing_file,
         help="Path to hand details CSV file (e.g., logs/YYYY-MM-DD/HH-MM-SS_hands.csv)",
     )
 
@@ -75,12 +178,35 @@ def parse_args():
         help="Generate comprehensive markdown report with all plots and analysis",
     )
 
+    parser.add_argument(
+        "--plot-workers",
+        type=int,
+        default=1,
+        help="Processes to render report plots in; each worker receives a copy "
+        "of the hand details (default: 1)",
+    )
+
     parser.add_argument(
         "--all",
         action="store_true",
         help="Run all analyses",
     )
 
+    parser.add_argument(
+        "--io-backend",
+        choices=["pyarrow", "c"],
+        default="pyarrow",
+        help="CSV parser engine (default: pyarrow, falls back to c if not installed)",
+    )
+
+    parser.add_argument(
+        "--cache-parquet",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Cache the hand details as a Parquet file next to the CSV "
+        "and read it on later runs (default: on)",
+    )
+
     parser.add_argument(
         "--top-n",
         type=int,
@@ -90,6 +216,9 @@ def parse_args():
 
     args = parser.parse_args()
 
+    if args.plot_workers <= 0:
+        parser.error("--plot-workers must be greater than 0")
+
     # If no specific analysis requested, run all
     if not any(
         [
@@ -105,23 +234,165 @@ def parse_args():
     return args
 
 
-def load_data(hands_csv: str, summary_csv: str = None) -> tuple:
+def read_hands_csv(
+    hands_path: Path, io_backend: str = "pyarrow", columns: Optional[List[str]] = None
+) -> "pd.DataFrame":
+    """Read a hand details CSV with a known schema.
+
+    Args:
+        hands_path: Path to hand details CSV
+        io_backend: CSV parser engine ("pyarrow" or "c")
+        columns: Columns to parse, or None for all
+
+    Returns:
+        Hand details dataframe
+    """
+    import pandas as pd
+
+    if io_backend == "pyarrow":
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            print("Warning: pyarrow not installed, falling back to the C CSV parser")
+            io_backend = "c"
+
+    if io_backend == "pyarrow":
+        return pd.read_csv(
+            hands_path, engine="pyarrow", dtype=HANDS_SCHEMA, usecols=columns
+        )
+
+    # Arrow-backed strings need pyarrow; use plain Python strings instead
+    dtype = {
+        col: "object" if col_type == "string[pyarrow]" else col_type
+        for col, col_type in HANDS_SCHEMA.items()
+    }
+    return pd.read_csv(hands_path, engine="c", dtype=dtype, usecols=columns)
+
+
+def required_columns(args: argparse.Namespace) -> Optional[List[str]]:
+    """Work out which hand details columns the requested analyses read.
+
+    Args:
+        args: Parsed arguments
+
+    Returns:
+        Column names to load, or None to load every column
+    """
+    if args.all or args.create_plots:
+        return None
+
+    columns = ["game_number"]
+    for report, report_columns in REQUIRED_COLS.items():
+        if getattr(args, report):
+            columns.extend(col for col in report_columns if col not in columns)
+    return columns
+
+
+def read_parquet_cache(
+    parquet_path: Path, hands_path: Path, columns: Optional[List[str]] = None
+) -> Optional["pd.DataFrame"]:
+    """Read the Parquet sidecar of a hand details CSV if it is up to date.
+
+    The sidecar holds the columns of the run that wrote it, so it only counts
+    as a hit when it has every column asked for.
+
+    Args:
+        parquet_path: Path to the Parquet sidecar
+        hands_path: Path to the hand details CSV it was written from
+        columns: Columns to read, or None for all of the CSV's columns
+
+    Returns:
+        Hand details dataframe, or None if there is no usable cache
+    """
+    import pandas as pd
+    import pyarrow.parquet as pq
+
+    if not parquet_path.exists():
+        return None
+    if parquet_path.stat().st_mtime < hands_path.stat().st_mtime:
+        return None
+
+    try:
+        if columns is None:
+            with open(hands_path, newline="", encoding="utf-8") as f:
+                wanted = next(csv.reader(f), [])
+        else:
+            wanted = columns
+        if not set(wanted) <= set(pq.read_schema(parquet_path).names):
+            return None
+        return pd.read_parquet(parquet_path, columns=columns)
+    except (OSError, ValueError) as e:
+        print(f"Warning: Could not read Parquet cache {parquet_path}: {e}")
+        return None
+
+
+def write_parquet_cache(hands_df: "pd.DataFrame", parquet_path: Path) -> None:
+    """Write the hand details to a Parquet sidecar for later runs.
+
+    Args:
+        hands_df: Hand details dataframe, as read from the CSV
+        parquet_path: Path to the Parquet sidecar
+    """
+    try:
+        hands_df.to_parquet(parquet_path, compression="zstd", index=False)
+    except (ImportError, OSError, ValueError) as e:
+        print(f"Warning: Could not write Parquet cache {parquet_path}: {e}")
+        parquet_path.unlink(missing_ok=True)
+
+
+def load_data(
+    hands_csv: str,
+    summary_csv: str = None,
+    io_backend: str = "pyarrow",
+    cache_parquet: bool = True,
+    columns: Optional[List[str]] = None,
+) -> tuple:
     """Load simulation data from CSV files.
 
+    With cache_parquet and pyarrow installed, the hand details are read from
+    a Parquet file next to the CSV when one newer than the CSV holds the
+    needed columns, and the columns parsed from the CSV are written there
+    otherwise.
+
     Args:
         hands_csv: Path to hand details CSV
         summary_csv: Optional path to game summary CSV
+        io_backend: CSV parser engine for the hand details CSV
+        cache_parquet: Whether to read/write the Parquet sidecar cache
+        columns: Hand details columns the analyses need (None for all)
 
     Returns:
         Tuple of (hands_df, summary_df)
     """
+    import pandas as pd
+
     hands_path = Path(hands_csv)
     if not hands_path.exists():
         print(f"Error: Hand details CSV not found: {hands_path}")
         sys.exit(1)
 
-    print(f"Loading hand details from: {hands_path}")
-    hands_df = pd.read_csv(hands_path)
+    parquet_path = hands_path.with_suffix(".parquet")
+    # The cache is read and written with pyarrow; without it, just parse the CSV
+    cache_parquet = cache_parquet and importlib.util.find_spec("pyarrow") is not None
+    hands_df = None
+    if cache_parquet:
+        hands_df = read_parquet_cache(parquet_path, hands_path, columns)
+        if hands_df is not None:
+            print(f"Loading hand details from cache: {parquet_path}")
+
+    if hands_df is None:
+        print(f"Loading hand details from: {hands_path}")
+        hands_df = read_hands_csv(hands_path, io_backend, columns)
+        if cache_parquet:
+            write_parquet_cache(hands_df, parquet_path)
+
+    # Encode the dealer once so analyses don't repeat the string compare
+    if "dealer" in hands_df.columns:
+        hands_df["_is_p1_dealer"] = (hands_df["dealer"] == "Player 1").to_numpy()
+    # Dealer totals are hand + crib, so add the crib to each hand once
+    if {"p1_hand_score", "p2_hand_score", "crib_score"} <= set(hands_df.columns):
+        hands_df["_p1_total"] = hands_df["p1_hand_score"] + hands_df["crib_score"]
+        hands_df["_p2_total"] = hands_df["p2_hand_score"] + hands_df["crib_score"]
     print(f"Loaded {len(hands_df):,} hands")
 
     summary_df = None
@@ -143,29 +414,48 @@ def main():
         args = parse_args()
 
         # Load data
-        hands_df, summary_df = load_data(args.hands_csv, args.summary_csv)
+        hands_df, summary_df = load_data(
+            args.hands_csv,
+            args.summary_csv,
+            args.io_backend,
+            cache_parquet=args.cache_parquet,
+            columns=required_columns(args),
+        )
 
-        print("\n" + "=" * 80)
+        from src.analysis._derived_columns import count_games
+
+        print("\n" + _SEP80)
         print("CRIBBAGE DATA ANALYSIS")
-        print("=" * 80)
+        print(_SEP80)
         print(f"Total hands analyzed: {len(hands_df):,}")
-        print(f"Total games: {hands_df['game_number'].nunique():,}")
-        print("=" * 80)
+        print(f"Total games: {count_games(hands_df):,}")
+        print(_SEP80)
 
         # Run requested analyses
         if args.all or args.best_hands:
+            from src.analysis.best_hands import print_best_hands_report
+
             print_best_hands_report(hands_df, top_n=args.top_n)
 
         if args.all or args.scoring_dist:
+            from src.analysis.scoring_distribution import (
+                plot_score_distribution,
+                print_scoring_distribution_report,
+            )
+
             print_scoring_distribution_report(hands_df)
             if args.plot:
                 output_path = Path(args.hands_csv).parent / "score_distribution.png"
                 plot_score_distribution(hands_df, output_path)
 
         if args.all or args.dealer_adv:
+            from src.analysis.dealer_advantage import print_dealer_advantage_report
+
             print_dealer_advantage_report(hands_df, summary_df)
 
         if args.all or args.card_values:
+            from src.analysis.card_values import print_card_values_report
+
             print_card_values_report(hands_df)
 
         # Generate comprehensive markdown report with plots if requested
@@ -175,7 +465,9 @@ def main():
             output_dir = Path(args.hands_csv).parent
             print("\nGenerating comprehensive markdown report with plots...")
             print(f"Output directory: {output_dir}")
-            report_path = generate_markdown_report(hands_df, output_dir, summary_df)
+            report_path = generate_markdown_report(
+                hands_df, output_dir, summary_df, plot_workers=args.plot_workers
+            )
             print(f"\nReport complete! Open {report_path} to view the analysis.")
 
         print("\nAnalysis complete!")
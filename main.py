@@ -1,25 +1,28 @@
 """Main entry point for cribbage game simulator.
 
 Usage:
-    python main.py --n_games N [--no_track_states] [--verbosity {0,1,2}] [--debug]
+    python main.py --n_games N [--no_track_states] [--verbosity {0,1,2}]
+        [--workers N] [--debug]
 
 Arguments:
     --n_games: Number of games to simulate (required, must be > 0)
     --no_track_states: Disable random state tracking (default: tracking enabled)
     --verbosity: Verbosity level - 0 (silent), 1 (normal), 2 (detailed) (default: 1)
+    --workers: Processes to simulate games in at verbosity 0 (default: CPU count)
     --debug: Enable debug mode with detailed internal logging (default: False)
 """
 
 import argparse
+import contextlib
+import multiprocessing
+import os
 import sys
+from typing import Dict, List, Optional, Tuple
 
-from tqdm import tqdm
-
-from src.game.game import Game
-from src.utils.csv_exporter import CSVExporter
-from src.utils.hand_details_exporter import HandDetailsExporter
-from src.utils.log_manager import LogManager
-from src.utils.state_tracker import StateTracker
+# Separator lines for the run header, per-game summaries and final stats
+_SEP70 = "=" * 70
+_DASH70 = "-" * 70
+_GAME_SEPARATOR = "\n" + _DASH70 + "\n\n"
 
 
 def parse_args():
@@ -55,6 +58,14 @@ def parse_args():
         help="Verbosity level: 0 (silent), 1 (normal), 2 (detailed)",
     )
 
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of processes to simulate games in at verbosity 0 "
+        "(default: CPU count)",
+    )
+
     parser.add_argument(
         "--debug",
         action="store_true",
@@ -67,12 +78,88 @@ def parse_args():
     # Validate n_games
     if args.n_games <= 0:
         parser.error("--n_games must be greater than 0")
+    if args.workers <= 0:
+        parser.error("--workers must be greater than 0")
 
     return args
 
 
+class _HandRecordBuffer:
+    """Collects a game's hand records in place of a HandDetailsExporter."""
+
+    def __init__(self):
+        """Initialize an empty buffer."""
+        self.records: List[Tuple] = []
+
+    def write_record(self, record: Tuple) -> None:
+        """Keep a hand record.
+
+        Args:
+            record: Hand details, as built by HandDetailsExporter
+        """
+        self.records.append(record)
+
+
+def play_one_game(
+    game_args: Tuple[int, Optional[int], str, int, bool, str],
+) -> Tuple[Dict, List[Tuple], Dict[str, int]]:
+    """Play a single game; runs in the main process or a pool worker.
+
+    Args:
+        game_args: Tuple of (game_num, seed, timestamp, verbosity, debug,
+            log_file). A seed of None plays with a fresh random state.
+
+    Returns:
+        Tuple of (csv_record, hand_records, scores) for the game
+    """
+    import numpy as np
+
+    from src.game.game import Game
+    from src.utils.csv_exporter import CSVExporter
+
+    game_num, seed, timestamp, verbosity, debug, log_file = game_args
+    hand_buffer = _HandRecordBuffer()
+
+    # Create and play game
+    game = Game(
+        player1_name="Player 1",
+        player2_name="Player 2",
+        rng=np.random.default_rng(seed),
+        verbosity=verbosity,
+        debug=debug,
+        log_file=log_file,
+        hand_details_exporter=hand_buffer,
+    )
+    game.game_number = game_num  # Set game number for hand tracking
+
+    winner = game.play_game()
+
+    # Create CSV record for this game
+    csv_record = CSVExporter.create_game_record(
+        game_number=game_num,
+        timestamp=timestamp,
+        winner_name=winner.name,
+        player1_name="Player 1",
+        player1_score=game.players[0].get_score(),
+        player1_play_points=game.players[0].get_play_points(),
+        player1_count_points=game.players[0].get_count_points(),
+        player2_name="Player 2",
+        player2_score=game.players[1].get_score(),
+        player2_play_points=game.players[1].get_play_points(),
+        player2_count_points=game.players[1].get_count_points(),
+        hands_played=game.hand_number,
+        random_seed=seed,
+    )
+
+    return csv_record, hand_buffer.records, game.get_scores()
+
+
 def run_simulation(
-    n_games: int, track_states: bool, verbosity: int, debug: bool
+    n_games: int,
+    track_states: bool,
+    verbosity: int,
+    debug: bool,
+    workers: int = 1,
 ) -> None:
     """Run the cribbage simulation.
 
@@ -81,7 +168,16 @@ def run_simulation(
         track_states: Whether to track random states
         verbosity: Verbosity level (0-2)
         debug: Whether to enable debug mode
+        workers: Number of processes to play games in (used at verbosity 0
+            without debug, where games produce no output of their own)
     """
+    # Deferred so that --help and argument errors don't pay for numpy et al.
+    from src.utils.background_writer import BackgroundWriter
+    from src.utils.csv_exporter import CSVExporter
+    from src.utils.hand_details_exporter import HandDetailsExporter
+    from src.utils.log_manager import LogManager
+    from src.utils.state_tracker import StateTracker
+
     # Initialize state tracker (tracking enabled by default)
     state_tracker = StateTracker(track_states=track_states)
 
@@ -93,149 +189,175 @@ def run_simulation(
         HandDetailsExporter.FIELDNAMES, suffix="_hands"
     )
 
-    # Initialize CSV exporters
-    csv_exporter = CSVExporter(csv_file_path)
-    hand_details_exporter = HandDetailsExporter(hand_details_path)
+    # Initialize CSV exporters; rows are written on background threads so
+    # disk I/O overlaps with simulating the next games
+    csv_exporter = BackgroundWriter(CSVExporter(csv_file_path))
+    hand_details_exporter = BackgroundWriter(HandDetailsExporter(hand_details_path))
 
     # Statistics tracking
     player1_wins = 0
     player2_wins = 0
     total_hands = 0
 
-    # Print and log header
-    header_lines = [
-        f"\n{'=' * 70}",
-        "CRIBBAGE SIMULATOR",
-        f"{'=' * 70}",
-        f"Simulating {n_games} game{'s' if n_games > 1 else ''}",
-        f"Verbosity: {verbosity}, Debug: {debug}, Track States: {track_states}",
-        f"Log file: {log_file_path}",
-        f"CSV file (summary): {csv_file_path}",
-        f"CSV file (hands): {hand_details_path}",
-        f"{'=' * 70}\n",
-    ]
-
-    for line in header_lines:
-        print(line)
-
-    # Write header to log file
-    with open(log_file_path, "w") as f:
-        f.write("\n".join(header_lines) + "\n")
-
-    # Use tqdm progress bar for verbosity 0, otherwise plain loop
-    game_iterator = range(1, n_games + 1)
-    if verbosity == 0:
-        game_iterator = tqdm(game_iterator, desc="Simulating games", unit="game")
-
-    for game_num in game_iterator:
-        # Initialize random state for this game
-        random_state = state_tracker.initialize_random_state()
-
-        # Create and play game
-        game = Game(
-            player1_name="Player 1",
-            player2_name="Player 2",
-            random_state=random_state,
-            verbosity=verbosity,
-            debug=debug,
-            log_file=str(log_file_path),
-            hand_details_exporter=hand_details_exporter,
-        )
-        game.game_number = game_num  # Set game number for hand tracking
-
-        winner = game.play_game()
-
-        # Track statistics
-        if winner.name == "Player 1":
-            player1_wins += 1
-        else:
-            player2_wins += 1
-
-        total_hands += game.hand_number
-
-        # Record seed for reproducibility
-        state_tracker.record_game_seed()
-
-        # Create CSV record for this game
-        csv_record = CSVExporter.create_game_record(
-            game_number=game_num,
-            timestamp=log_manager.get_timestamp_str(),
-            winner_name=winner.name,
-            player1_name="Player 1",
-            player1_score=game.players[0].get_score(),
-            player1_play_points=game.players[0].get_play_points(),
-            player1_count_points=game.players[0].get_count_points(),
-            player2_name="Player 2",
-            player2_score=game.players[1].get_score(),
-            player2_play_points=game.players[1].get_play_points(),
-            player2_count_points=game.players[1].get_count_points(),
-            hands_played=game.hand_number,
-            random_seed=state_tracker.get_current_seed() if track_states else None,
-        )
-
-        # Write CSV record immediately
-        csv_exporter.write_record(csv_record)
-
-        # Print game summary
-        if verbosity >= 1:
-            print(f"\nGame {game_num} complete:")
-            scores = game.get_scores()
-            for name, score in scores.items():
-                print(f"  {name}: {score}")
-            print(f"  Winner: {winner.name}")
-            print(f"  Hands played: {game.hand_number}")
-
-            # Print seed if tracking
+    # Single buffered handle for the run's own log lines. Append mode keeps
+    # writes at end-of-file since games append to the same log file.
+    with open(log_file_path, "a", buffering=1 << 20, encoding="utf-8") as log_f:
+        log_f.truncate(0)
+
+        def emit(lines: List[str]) -> None:
+            """Print lines and write them to the simulation log in one block."""
+            block = "\n".join(lines) + "\n"
+            sys.stdout.write(block)
+            log_f.write(block)
+
+        try:
+            # Print and log header
+            header_lines = [
+                "\n" + _SEP70,
+                "CRIBBAGE SIMULATOR",
+                _SEP70,
+                f"Simulating {n_games} game{'s' if n_games > 1 else ''}",
+                f"Verbosity: {verbosity}, Debug: {debug}, Track States: {track_states}",
+                f"Log file: {log_file_path}",
+                f"CSV file (summary): {csv_file_path}",
+                f"CSV file (hands): {hand_details_path}",
+                _SEP70 + "\n",
+            ]
+
+            emit(header_lines)
+
+            # Game logs append to the same file; make sure the header lands first
+            log_f.flush()
+
+            # Seeds are drawn up front so each game can be replayed from its seed
+            # alone, whichever process plays it
+            seeds = [state_tracker.next_seed() for _ in range(n_games)]
+            timestamp = log_manager.get_timestamp_str()
+            game_args = [
+                (game_num, seed, timestamp, verbosity, debug, str(log_file_path))
+                for game_num, seed in enumerate(seeds, 1)
+            ]
+
+            # Games are independent, so play them in worker processes when they
+            # don't print or log as they go (that output would interleave)
+            n_workers = min(workers, n_games) if verbosity == 0 and not debug else 1
+
+            with contextlib.ExitStack() as stack:
+                if n_workers > 1:
+                    # Spawned workers don't inherit the CSV writer threads
+                    pool = stack.enter_context(
+                        multiprocessing.get_context("spawn").Pool(n_workers)
+                    )
+                    chunksize = max(1, min(64, n_games // (n_workers * 4)))
+                    # imap keeps results (and CSV rows) in game order
+                    results = pool.imap(play_one_game, game_args, chunksize=chunksize)
+                else:
+                    results = map(play_one_game, game_args)
+
+                # Use tqdm progress bar for verbosity 0, otherwise plain loop
+                if verbosity == 0:
+                    from tqdm import tqdm
+
+                    results = tqdm(
+                        results, total=n_games, desc="Simulating games", unit="game"
+                    )
+
+                for csv_record, hand_records, scores in results:
+                    game_num = csv_record["game_number"]
+                    winner_name = csv_record["winner"]
+                    hands_played = csv_record["hands_played"]
+
+                    # Track statistics
+                    if winner_name == "Player 1":
+                        player1_wins += 1
+                    else:
+                        player2_wins += 1
+
+                    total_hands += hands_played
+
+                    # Record seed for reproducibility
+                    state_tracker.record_game_seed(seeds[game_num - 1])
+
+                    # Queue CSV records for the writer threads
+                    csv_exporter.write_record(csv_record)
+                    for hand_record in hand_records:
+                        hand_details_exporter.write_record(hand_record)
+
+                    # Print game summary
+                    if verbosity >= 1:
+                        lines = [f"\nGame {game_num} complete:"]
+                        lines += [
+                            f"  {name}: {score}" for name, score in scores.items()
+                        ]
+                        lines += [
+                            f"  Winner: {winner_name}",
+                            f"  Hands played: {hands_played}",
+                        ]
+
+                        # Print seed if tracking
+                        if track_states:
+                            lines.append(
+                                f"  {state_tracker.print_seed_report(game_num)}"
+                            )
+
+                        sys.stdout.write("\n".join(lines) + "\n")
+
+                    # Separator between games
+                    if verbosity >= 1 and game_num < n_games:
+                        sys.stdout.write(_GAME_SEPARATOR)
+
+            # Finish writing queued CSV rows before reporting the files
+            csv_exporter.close()
+            hand_details_exporter.close()
+
+            # Print final statistics
+            final_stats = [
+                "\n" + _SEP70,
+                "SIMULATION COMPLETE",
+                _SEP70,
+                f"Games played: {n_games}",
+                f"Player 1 wins: {player1_wins} ({player1_wins / n_games * 100:.1f}%)",
+                f"Player 2 wins: {player2_wins} ({player2_wins / n_games * 100:.1f}%)",
+                f"Average hands per game: {total_hands / n_games:.1f}",
+            ]
+
+            emit(final_stats)
+
+            # Only print seeds for verbosity >= 1 (avoid flooding output for large runs)
+            if track_states and verbosity >= 1:
+                lines = ["\nAll game seeds (for reproducibility):"]
+                lines += [
+                    f"  Game {i}: {seed}"
+                    for i, seed in enumerate(state_tracker.get_all_seeds(), 1)
+                ]
+                sys.stdout.write("\n".join(lines) + "\n")
+
+            if verbosity == 0:
+                # For verbosity 0, show file paths
+                print("\nResults saved to:")
+                print(f"  Log: {log_file_path}")
+                print(f"  CSV (summary): {csv_file_path}")
+                print(f"  CSV (hands): {hand_details_path}")
+            else:
+                # For verbosity 1+, show file paths without extra newline
+                print("\nResults saved to:")
+                print(f"  Log: {log_file_path}")
+                print(f"  CSV (summary): {csv_file_path}")
+                print(f"  CSV (hands): {hand_details_path}")
+
+            print(_SEP70 + "\n")
+
+            # Write seeds to log file
             if track_states:
-                seed_report = state_tracker.print_seed_report(game_num)
-                print(f"  {seed_report}")
-
-        # Separator between games
-        if verbosity >= 1 and game_num < n_games:
-            print(f"\n{'-' * 70}\n")
-
-    # Print final statistics
-    final_stats = [
-        f"\n{'=' * 70}",
-        "SIMULATION COMPLETE",
-        f"{'=' * 70}",
-        f"Games played: {n_games}",
-        f"Player 1 wins: {player1_wins} ({player1_wins / n_games * 100:.1f}%)",
-        f"Player 2 wins: {player2_wins} ({player2_wins / n_games * 100:.1f}%)",
-        f"Average hands per game: {total_hands / n_games:.1f}",
-    ]
-
-    for stat in final_stats:
-        print(stat)
-
-    # Only print seeds for verbosity >= 1 (avoid flooding output for large runs)
-    if track_states and verbosity >= 1:
-        print("\nAll game seeds (for reproducibility):")
-        for i, seed in enumerate(state_tracker.get_all_seeds(), 1):
-            print(f"  Game {i}: {seed}")
-
-    if verbosity == 0:
-        # For verbosity 0, show file paths
-        print("\nResults saved to:")
-        print(f"  Log: {log_file_path}")
-        print(f"  CSV (summary): {csv_file_path}")
-        print(f"  CSV (hands): {hand_details_path}")
-    else:
-        # For verbosity 1+, show file paths without extra newline
-        print("\nResults saved to:")
-        print(f"  Log: {log_file_path}")
-        print(f"  CSV (summary): {csv_file_path}")
-        print(f"  CSV (hands): {hand_details_path}")
-
-    print(f"{'=' * 70}\n")
-
-    # Write final stats to log file
-    with open(log_file_path, "a") as f:
-        f.write("\n".join(final_stats) + "\n")
-        if track_states:
-            f.write("\nAll game seeds (for reproducibility):\n")
-            for i, seed in enumerate(state_tracker.get_all_seeds(), 1):
-                f.write(f"  Game {i}: {seed}\n")
+                log_f.write("\nAll game seeds (for reproducibility):\n")
+                for i, seed in enumerate(state_tracker.get_all_seeds(), 1):
+                    log_f.write(f"  Game {i}: {seed}\n")
+        finally:
+            # Close both writers even if the first reports a write error
+            try:
+                csv_exporter.close()
+            finally:
+                hand_details_exporter.close()
 
 
 def main():
@@ -247,6 +369,7 @@ def main():
             track_states=not args.no_track_states,  # Invert the flag
             verbosity=args.verbosity,
             debug=args.debug,
+            workers=args.workers,
         )
     except KeyboardInterrupt:
         print("\n\nSimulation interrupted by user.")
@@ -0,0 +1,86 @@
+"""Histogram kernels for score distributions.
+
+Counts how often each score occurs in one pass over the raw (often int8)
+score array, without the intp copy np.bincount makes first. Uses numba when
+it is installed and falls back to NumPy otherwise. Large inputs are split
+across threads, each counting into its own partial histogram.
+"""
+
+import numpy as np
+
+from src.analysis._numba_support import jit, parallel_threads, prange
+
+
+def _score_counts_loop(scores: np.ndarray, n_bins: int) -> np.ndarray:
+    """Count each score in one sweep (numba kernel).
+
+    Args:
+        scores: Integer scores
+        n_bins: Number of counted scores (0 to n_bins - 1)
+
+    Returns:
+        Array of n_bins + 1 counts; the last counts scores outside the range
+    """
+    counts = np.zeros(n_bins + 1, np.int64)
+    for i in range(scores.shape[0]):
+        v = scores[i]
+        if 0 <= v < n_bins:
+            counts[v] += 1
+        else:
+            counts[n_bins] += 1
+    return counts
+
+
+def _score_counts_chunked(scores: np.ndarray, n_bins: int, n_chunks: int) -> np.ndarray:
+    """Count each score over chunks of scores, then reduce (numba kernel).
+
+    Args:
+        scores: Integer scores
+        n_bins: Number of counted scores (0 to n_bins - 1)
+        n_chunks: Number of chunks (typically the thread count)
+
+    Returns:
+        Array of n_bins + 1 counts; the last counts scores outside the range
+    """
+    n_rows = scores.shape[0]
+    chunk_size = (n_rows + n_chunks - 1) // n_chunks
+
+    part_counts = np.zeros((n_chunks, n_bins + 1), np.int64)
+    for c in prange(n_chunks):
+        for i in range(c * chunk_size, min(n_rows, (c + 1) * chunk_size)):
+            v = scores[i]
+            if 0 <= v < n_bins:
+                part_counts[c, v] += 1
+            else:
+                part_counts[c, n_bins] += 1
+
+    return part_counts.sum(axis=0)
+
+
+_score_counts_serial = jit(_score_counts_loop)
+_score_counts_parallel = jit(_score_counts_chunked, parallel=True)
+
+
+def score_counts(scores: np.ndarray, n_bins: int) -> np.ndarray:
+    """Count how often each score occurs, like np.bincount(scores, minlength=n_bins).
+
+    Args:
+        scores: Non-negative integer scores
+        n_bins: Minimum number of counts to return
+
+    Returns:
+        int64 counts, at least n_bins long
+    """
+    if _score_counts_serial is None:
+        return np.bincount(scores, minlength=n_bins)
+
+    n_threads = parallel_threads(len(scores))
+    if n_threads > 1:
+        counts = _score_counts_parallel(scores, n_bins, n_threads)
+    else:
+        counts = _score_counts_serial(scores, n_bins)
+
+    # Scores outside the expected range: let NumPy size (or reject) them
+    if counts[n_bins]:
+        return np.bincount(scores, minlength=n_bins)
+    return counts[:n_bins]
@@ -0,0 +1,100 @@
+"""Columns derived from the hand details and shared between analyses."""
+
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.analysis._frame_cache import cached_per_frame
+
+
+def p1_dealer_mask(df: pd.DataFrame) -> np.ndarray:
+    """Get a boolean mask of hands where Player 1 dealt.
+
+    Uses the _is_p1_dealer column when load_data added it; otherwise the
+    dealer strings are compared once per dataframe and the mask is cached.
+
+    Args:
+        df: Hand details dataframe
+
+    Returns:
+        Boolean array, True where Player 1 is the dealer
+    """
+    if "_is_p1_dealer" in df.columns:
+        return df["_is_p1_dealer"].to_numpy()
+    return cached_per_frame(
+        "p1_dealer", df, lambda df: (df["dealer"] == "Player 1").to_numpy()
+    )
+
+
+def stacked_hand_scores(df: pd.DataFrame) -> np.ndarray:
+    """Get both players' hand scores in one array, built once per dataframe.
+
+    Args:
+        df: Hand details dataframe
+
+    Returns:
+        Array of length 2 * len(df): Player 1's hand scores, then Player 2's
+    """
+    return cached_per_frame(
+        "stacked_hand_scores",
+        df,
+        lambda df: np.concatenate(
+            (df["p1_hand_score"].to_numpy(), df["p2_hand_score"].to_numpy())
+        ),
+    )
+
+
+def _build_hand_totals(df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+    """Add the crib score to each player's hand score.
+
+    Args:
+        df: Hand details dataframe
+
+    Returns:
+        Tuple of (Player 1 hand + crib, Player 2 hand + crib) arrays
+    """
+    # Hand + crib is at most 58, so int8 scores cannot overflow
+    crib_scores = df["crib_score"].to_numpy()
+    return (
+        df["p1_hand_score"].to_numpy() + crib_scores,
+        df["p2_hand_score"].to_numpy() + crib_scores,
+    )
+
+
+def hand_totals(df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+    """Get each player's hand + crib score, as counted when they deal.
+
+    Uses the _p1_total/_p2_total columns when load_data added them;
+    otherwise the sums are computed once per dataframe and cached.
+
+    Args:
+        df: Hand details dataframe
+
+    Returns:
+        Tuple of (Player 1 hand + crib, Player 2 hand + crib) arrays
+    """
+    if "_p1_total" in df.columns and "_p2_total" in df.columns:
+        return df["_p1_total"].to_numpy(), df["_p2_total"].to_numpy()
+    return cached_per_frame("hand_totals", df, _build_hand_totals)
+
+
+def count_games(hands_df: pd.DataFrame) -> int:
+    """Count distinct games in the hand details.
+
+    The simulator writes hands in game order, so for sorted game numbers the
+    count is the number of boundaries between games, found without hashing.
+
+    Args:
+        hands_df: Hand details dataframe
+
+    Returns:
+        Number of distinct games
+    """
+    game_numbers = hands_df["game_number"]
+    if len(game_numbers) == 0:
+        return 0
+    if game_numbers.is_monotonic_increasing:
+        values = game_numbers.to_numpy()
+        return int((values[1:] != values[:-1]).sum()) + 1
+    return game_numbers.nunique()
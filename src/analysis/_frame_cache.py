@@ -0,0 +1,37 @@
+"""Per-dataframe cache for intermediate results shared between analyses."""
+
+import weakref
+from typing import Any, Callable, Dict, Tuple
+
+import pandas as pd
+
+# Cached results keyed by (kind, id(df)). Entries hold a weak reference to the
+# source dataframe and are evicted when it is garbage collected, so a
+# recycled id() can never return stale data.
+_frame_cache: Dict[Tuple[str, int], Tuple[weakref.ref, Any]] = {}
+
+
+def cached_per_frame(
+    kind: str, df: pd.DataFrame, builder: Callable[[pd.DataFrame], Any]
+) -> Any:
+    """Return the result of builder(df), building it on first use.
+
+    Args:
+        kind: Cache namespace (e.g., "dealt" or "rank_codes")
+        df: Hand details dataframe
+        builder: Function that builds the result from df
+
+    Returns:
+        Cached result for df
+    """
+    key = (kind, id(df))
+    entry = _frame_cache.get(key)
+    if entry is not None and entry[0]() is df:
+        return entry[1]
+
+    result = builder(df)
+    _frame_cache[key] = (
+        weakref.ref(df, lambda _, key=key: _frame_cache.pop(key, None)),
+        result,
+    )
+    return result
@@ -0,0 +1,149 @@
+"""Group-by aggregation kernels for hand analyses.
+
+Computes per-group sum, count, min and max of a score array in a single
+pass over integer group codes. Uses numba when it is installed and falls
+back to NumPy otherwise. Large inputs with comparatively few groups are
+split across threads, each accumulating into its own partial buckets.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+from src.analysis._numba_support import jit, parallel_threads, prange
+
+
+def _group_stats_loop(
+    codes: np.ndarray, scores: np.ndarray, n_groups: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Accumulate sum/count/min/max per group in one sweep (numba kernel).
+
+    Args:
+        codes: Group code for each row (0 <= code < n_groups)
+        scores: Integer score for each row
+        n_groups: Number of distinct groups
+
+    Returns:
+        Tuple of (sums, counts, mins, maxes) arrays of length n_groups
+    """
+    sums = np.zeros(n_groups, np.int64)
+    counts = np.zeros(n_groups, np.int64)
+    mins = np.full(n_groups, np.iinfo(np.int64).max, np.int64)
+    maxes = np.full(n_groups, np.iinfo(np.int64).min, np.int64)
+
+    for i in range(codes.shape[0]):
+        k = codes[i]
+        v = scores[i]
+        sums[k] += v
+        counts[k] += 1
+        if v < mins[k]:
+            mins[k] = v
+        if v > maxes[k]:
+            maxes[k] = v
+
+    return sums, counts, mins, maxes
+
+
+def _group_stats_numpy(
+    codes: np.ndarray, scores: np.ndarray, n_groups: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Accumulate sum/count/min/max per group with NumPy ufuncs.
+
+    Args:
+        codes: Group code for each row (0 <= code < n_groups)
+        scores: Integer score for each row
+        n_groups: Number of distinct groups
+
+    Returns:
+        Tuple of (sums, counts, mins, maxes) arrays of length n_groups
+    """
+    scores = scores.astype(np.int64, copy=False)
+    sums = np.zeros(n_groups, np.int64)
+    np.add.at(sums, codes, scores)
+    counts = np.bincount(codes, minlength=n_groups).astype(np.int64)
+    mins = np.full(n_groups, np.iinfo(np.int64).max, np.int64)
+    np.minimum.at(mins, codes, scores)
+    maxes = np.full(n_groups, np.iinfo(np.int64).min, np.int64)
+    np.maximum.at(maxes, codes, scores)
+
+    return sums, counts, mins, maxes
+
+
+def _group_stats_chunked(
+    codes: np.ndarray, scores: np.ndarray, n_groups: int, n_chunks: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Accumulate per-group stats over row chunks, then reduce (numba kernel).
+
+    Each chunk of rows is handled by one thread that writes only to its own
+    row of the partial bucket arrays, so no synchronisation is needed.
+
+    Args:
+        codes: Group code for each row (0 <= code < n_groups)
+        scores: Integer score for each row
+        n_groups: Number of distinct groups
+        n_chunks: Number of row chunks (typically the thread count)
+
+    Returns:
+        Tuple of (sums, counts, mins, maxes) arrays of length n_groups
+    """
+    n_rows = codes.shape[0]
+    chunk_size = (n_rows + n_chunks - 1) // n_chunks
+
+    part_sums = np.zeros((n_chunks, n_groups), np.int64)
+    part_counts = np.zeros((n_chunks, n_groups), np.int64)
+    part_mins = np.full((n_chunks, n_groups), np.iinfo(np.int64).max, np.int64)
+    part_maxes = np.full((n_chunks, n_groups), np.iinfo(np.int64).min, np.int64)
+
+    for c in prange(n_chunks):
+        for i in range(c * chunk_size, min(n_rows, (c + 1) * chunk_size)):
+            k = codes[i]
+            v = scores[i]
+            part_sums[c, k] += v
+            part_counts[c, k] += 1
+            if v < part_mins[c, k]:
+                part_mins[c, k] = v
+            if v > part_maxes[c, k]:
+                part_maxes[c, k] = v
+
+    sums = np.zeros(n_groups, np.int64)
+    counts = np.zeros(n_groups, np.int64)
+    mins = np.full(n_groups, np.iinfo(np.int64).max, np.int64)
+    maxes = np.full(n_groups, np.iinfo(np.int64).min, np.int64)
+
+    for k in prange(n_groups):
+        for c in range(n_chunks):
+            sums[k] += part_sums[c, k]
+            counts[k] += part_counts[c, k]
+            mins[k] = min(mins[k], part_mins[c, k])
+            maxes[k] = max(maxes[k], part_maxes[c, k])
+
+    return sums, counts, mins, maxes
+
+
+_group_stats_serial = jit(_group_stats_loop, fallback=_group_stats_numpy)
+_group_stats_parallel = jit(_group_stats_chunked, parallel=True)
+
+
+def group_stats(
+    codes: np.ndarray, scores: np.ndarray, n_groups: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Compute per-group sum, count, min and max of scores.
+
+    Uses the multithreaded kernel for large inputs when the per-thread
+    buckets stay small relative to the data (e.g. kept hands, which repeat
+    often); mostly-unique keys such as dealt hands run single-threaded.
+
+    Args:
+        codes: Group code for each row (0 <= code < n_groups)
+        scores: Integer score for each row
+        n_groups: Number of distinct groups
+
+    Returns:
+        Tuple of (sums, counts, mins, maxes) arrays of length n_groups
+    """
+    n_rows = codes.shape[0]
+    n_threads = parallel_threads(n_rows)
+    if n_threads > 1 and n_threads * n_groups <= n_rows:
+        return _group_stats_parallel(codes, scores, n_groups, n_threads)
+
+    return _group_stats_serial(codes, scores, n_groups)
@@ -0,0 +1,50 @@
+"""Optional numba support shared by the analysis kernels.
+
+Kernels are written as plain loops over NumPy arrays and compiled with numba
+when it is installed; without it, each kernel module falls back to NumPy.
+"""
+
+from typing import Callable, Optional
+
+try:
+    import numba
+except ImportError:  # numba is optional
+    numba = None
+
+prange = numba.prange if numba is not None else range
+
+# Minimum rows before a multithreaded kernel is worth its startup cost
+PARALLEL_MIN_ROWS = 1_000_000
+
+
+def jit(
+    kernel: Callable, parallel: bool = False, fallback: Optional[Callable] = None
+) -> Optional[Callable]:
+    """Compile a kernel with numba, caching the machine code on disk.
+
+    Args:
+        kernel: Kernel function to compile
+        parallel: Whether to compile its prange loops to run across threads
+        fallback: What to return instead when numba is not installed
+
+    Returns:
+        The compiled kernel, or fallback without numba
+    """
+    if numba is None:
+        return fallback
+    return numba.njit(parallel=parallel, cache=True)(kernel)
+
+
+def parallel_threads(n_rows: int) -> int:
+    """Number of threads to split n_rows across.
+
+    Args:
+        n_rows: Number of rows the kernel will process
+
+    Returns:
+        numba's thread count for large inputs, or 1 when the serial kernel
+        should run (small inputs, or no numba)
+    """
+    if numba is None or n_rows < PARALLEL_MIN_ROWS:
+        return 1
+    return numba.get_num_threads()
@@ -0,0 +1,68 @@
+"""Reusable figure skeletons for plots that are regenerated repeatedly.
+
+A plot builds its figure, axes and bar artists once; later calls with the
+same layout (the same number of bars per panel) reuse them and only update
+bar heights, tick labels and titles.
+"""
+
+from typing import Any, Dict, Hashable, Sequence, Tuple
+
+import numpy as np
+from matplotlib.container import BarContainer
+from matplotlib.figure import Figure, SubplotParams
+
+# Cached skeletons by plot name
+_figures: Dict[str, Dict[str, Any]] = {}
+
+
+def reusable_figure(
+    name: str, figsize: Tuple[float, float], layout: Hashable
+) -> Tuple[Figure, np.ndarray, Dict[str, Any], bool]:
+    """Get the cached 2x2 figure for a plot, or a new one if the layout changed.
+
+    Args:
+        name: Plot name the skeleton is cached under
+        figsize: Figure size in inches
+        layout: Value that must match for the cached skeleton to be reused
+
+    Returns:
+        Tuple of (figure, 2x2 axes array, artists dict, reused). The artists
+        dict is where the plot keeps its bar containers between calls.
+    """
+    entry = _figures.get(name)
+    if entry is not None and entry["layout"] == layout:
+        # Start tight_layout from the default spacing, as a new figure would
+        defaults = SubplotParams()
+        entry["fig"].subplots_adjust(
+            left=defaults.left,
+            bottom=defaults.bottom,
+            right=defaults.right,
+            top=defaults.top,
+            wspace=defaults.wspace,
+            hspace=defaults.hspace,
+        )
+        return entry["fig"], entry["axes"], entry["artists"], True
+
+    fig = Figure(figsize=figsize)
+    axes = fig.subplots(2, 2)
+    entry = {"fig": fig, "axes": axes, "artists": {}, "layout": layout}
+    _figures[name] = entry
+    return fig, axes, entry["artists"], False
+
+
+def update_bars(
+    ax, bars: BarContainer, labels: Sequence[str], heights: Sequence[float]
+) -> None:
+    """Set bar heights and tick labels, then rescale the y axis to fit.
+
+    Args:
+        ax: Axes holding the bars
+        bars: Bars drawn at x = 0, 1, ...
+        labels: Tick label for each bar
+        heights: New height for each bar
+    """
+    for rect, height in zip(bars, heights):
+        rect.set_height(height)
+    ax.set_xticks(range(len(labels)), labels)
+    ax.relim()
+    ax.autoscale_view()
@@ -0,0 +1,103 @@
+"""Rank parsing kernels for comma-separated card strings.
+
+Turns hand strings such as "5♥,A♠,10♣,J♥" into a matrix of rank codes by
+scanning their UTF-8 bytes, without building a Python string per card. Uses
+numba when it is installed and falls back to NumPy otherwise.
+"""
+
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.analysis._numba_support import jit, prange
+
+_COMMA = ord(",")
+_SPACE = ord(" ")
+
+
+def _rank_codes_loop(
+    buf: np.ndarray, rank_by_byte: np.ndarray, out: np.ndarray
+) -> None:
+    """Write the rank code of each card in each row (numba kernel).
+
+    Rows that don't hold exactly out.shape[1] cards get -1 in column 0.
+
+    Args:
+        buf: UTF-8 bytes of each hand string, zero padded, shape (n, width)
+        rank_by_byte: Rank code for each possible first byte of a card (-1 if none)
+        out: Output rank codes, shape (n, n_cards), prefilled with -1
+    """
+    n_cards = out.shape[1]
+    for i in prange(buf.shape[0]):
+        card = 0
+        at_start = True
+        for j in range(buf.shape[1]):
+            b = buf[i, j]
+            if b == 0:
+                break
+            if b == _COMMA:
+                at_start = True
+            elif at_start and b != _SPACE:
+                if card < n_cards:
+                    out[i, card] = rank_by_byte[b]
+                card += 1
+                at_start = False
+        if card != n_cards:
+            out[i, 0] = -1
+
+
+def _rank_codes_numpy(
+    buf: np.ndarray, rank_by_byte: np.ndarray, out: np.ndarray
+) -> None:
+    """Write the rank code of each card in each row with NumPy indexing.
+
+    Assumes no whitespace around cards. Rows that don't hold exactly
+    out.shape[1] cards leave -1 in column 0.
+
+    Args:
+        buf: UTF-8 bytes of each hand string, zero padded, shape (n, width)
+        rank_by_byte: Rank code for each possible first byte of a card (-1 if none)
+        out: Output rank codes, shape (n, n_cards), prefilled with -1
+    """
+    n_rows, n_cards = out.shape
+    is_comma = buf == _COMMA
+    if not (is_comma.sum(axis=1) == n_cards - 1).all():
+        return
+
+    # Cards start at byte 0 and just after each comma
+    starts = np.zeros((n_rows, n_cards), dtype=np.intp)
+    starts[:, 1:] = np.nonzero(is_comma)[1].reshape(n_rows, n_cards - 1) + 1
+    out[:] = rank_by_byte[buf[np.arange(n_rows)[:, None], starts]]
+
+
+_rank_codes = jit(_rank_codes_loop, parallel=True, fallback=_rank_codes_numpy)
+
+
+def hand_rank_codes(cards: pd.Series, ranks: List[str]) -> Optional[np.ndarray]:
+    """Parse hand strings into a matrix of rank codes.
+
+    Args:
+        cards: Series of comma-separated hands, all with the same card count
+        ranks: Rank names, indexed by code; their first characters must differ
+
+    Returns:
+        int8 array of shape (len(cards), n_cards) with codes into ranks, or
+        None if the strings aren't in the expected format
+    """
+    if len(cards) == 0:
+        return None
+
+    rank_by_byte = np.full(256, -1, dtype=np.int8)
+    for code, rank in enumerate(ranks):
+        rank_by_byte[ord(rank[0])] = code
+
+    encoded = cards.str.encode("utf-8").to_numpy().astype(np.bytes_)
+    buf = encoded.view(np.uint8).reshape(len(encoded), -1)
+    n_cards = int((buf[0] == _COMMA).sum()) + 1
+
+    out = np.full((len(encoded), n_cards), -1, dtype=np.int8)
+    _rank_codes(buf, rank_by_byte, out)
+    if (out < 0).any():
+        return None
+    return out
@@ -1,55 +1,267 @@
 """Analyze best cribbage hands from simulation data."""
 
+from typing import Dict, Optional
+
+import numpy as np
 import pandas as pd
 
+from src.analysis._derived_columns import p1_dealer_mask, stacked_hand_scores
+from src.analysis._frame_cache import cached_per_frame
+from src.analysis._groupby_kernels import group_stats
 
-def analyze_best_dealt_hands(df: pd.DataFrame, top_n: int = 10) -> pd.DataFrame:
-    """Find the best 6-card dealt hands.
+# Separator lines for the printed report
+_SEP80 = "=" * 80
+_DASH80 = "-" * 80
+
+
+def _combine_dealt_totals(df: pd.DataFrame) -> pd.DataFrame:
+    """Combine both players' dealt hands with their total score.
 
     Args:
         df: Hand details dataframe
-        top_n: Number of top hands to return
 
     Returns:
-        DataFrame with top dealt hands and their average scores
+        DataFrame with dealt_cards and total_score (hand + crib if dealer)
     """
-    # Calculate total value for each player (hand + crib if dealer)
-    p1_total = df.copy()
-    p1_total["is_dealer"] = df["dealer"] == "Player 1"
-    p1_total["total_score"] = p1_total["p1_hand_score"] + p1_total.apply(
-        lambda row: row["crib_score"] if row["is_dealer"] else 0, axis=1
+    # Calculate total value for each player (hand + crib if dealer).
+    # Scores may be int8; hand + crib is at most 58 so the sum cannot overflow.
+    is_p1_dealer = p1_dealer_mask(df)
+    crib = df["crib_score"].to_numpy()
+    p1_total_score = df["p1_hand_score"].to_numpy() + np.where(is_p1_dealer, crib, 0)
+    p2_total_score = df["p2_hand_score"].to_numpy() + np.where(~is_p1_dealer, crib, 0)
+
+    # Combine both players (categorical keys so groupby hashes int codes)
+    return pd.DataFrame(
+        {
+            "dealt_cards": pd.Categorical(
+                np.concatenate(
+                    [df["p1_dealt_cards"].to_numpy(), df["p2_dealt_cards"].to_numpy()]
+                )
+            ),
+            "total_score": np.concatenate([p1_total_score, p2_total_score]),
+        }
     )
-    p1_total["dealt_cards"] = p1_total["p1_dealt_cards"]
 
-    p2_total = df.copy()
-    p2_total["is_dealer"] = df["dealer"] == "Player 2"
-    p2_total["total_score"] = p2_total["p2_hand_score"] + p2_total.apply(
-        lambda row: row["crib_score"] if row["is_dealer"] else 0, axis=1
+
+def _combine_kept_totals(df: pd.DataFrame) -> pd.DataFrame:
+    """Combine both players' kept hands with their hand score.
+
+    Args:
+        df: Hand details dataframe
+
+    Returns:
+        DataFrame with kept_cards and hand_score
+    """
+    # Build just the two stacked columns rather than copying column subsets
+    return pd.DataFrame(
+        {
+            "kept_cards": pd.Categorical(
+                np.concatenate(
+                    [df["p1_kept_cards"].to_numpy(), df["p2_kept_cards"].to_numpy()]
+                )
+            ),
+            "hand_score": stacked_hand_scores(df),
+        }
     )
-    p2_total["dealt_cards"] = p2_total["p2_dealt_cards"]
-
-    # Combine both players
-    all_hands = pd.concat(
-        [
-            p1_total[["dealt_cards", "total_score"]],
-            p2_total[["dealt_cards", "total_score"]],
-        ]
+
+
+def _aggregate_scores(
+    keys: pd.Series, scores: pd.Series, key_name: str
+) -> pd.DataFrame:
+    """Aggregate scores per distinct key in a single pass.
+
+    Args:
+        keys: Group key for each row (e.g. a hand's cards)
+        scores: Integer score for each row
+        key_name: Name of the key column in the result
+
+    Returns:
+        DataFrame with key_name, avg_score, min_score, max_score and count,
+        one row per key in order of first appearance
+    """
+    codes, uniques = pd.factorize(keys, sort=False)
+    scores = scores.to_numpy()
+    # Missing keys get code -1; drop their rows, as groupby does by default
+    present = codes >= 0
+    if not present.all():
+        codes, scores = codes[present], scores[present]
+    sums, counts, mins, maxes = group_stats(codes, scores, len(uniques))
+
+    return pd.DataFrame(
+        {
+            key_name: uniques,
+            "avg_score": sums / counts,
+            "min_score": mins,
+            "max_score": maxes,
+            "count": counts,
+        }
     )
 
-    # Group by dealt cards and calculate stats
-    best_hands = (
-        all_hands.groupby("dealt_cards")
-        .agg(
-            avg_score=("total_score", "mean"),
-            max_score=("total_score", "max"),
-            count=("total_score", "count"),
+
+def _build_dealt_totals(df: pd.DataFrame) -> pd.DataFrame:
+    """Get the combined dealt-hand totals for df (cached per dataframe).
+
+    Args:
+        df: Hand details dataframe
+
+    Returns:
+        DataFrame with dealt_cards and total_score columns
+    """
+    return cached_per_frame("dealt", df, _combine_dealt_totals)
+
+
+def _build_kept_totals(df: pd.DataFrame) -> pd.DataFrame:
+    """Get the combined kept-hand scores for df (cached per dataframe).
+
+    Args:
+        df: Hand details dataframe
+
+    Returns:
+        DataFrame with kept_cards and hand_score columns
+    """
+    return cached_per_frame("kept", df, _combine_kept_totals)
+
+
+def _dealt_hand_stats(df: pd.DataFrame) -> pd.DataFrame:
+    """Get per-hand stats for 6-card dealt hands (cached per dataframe).
+
+    Args:
+        df: Hand details dataframe
+
+    Returns:
+        DataFrame with dealt_cards, avg_score, min_score, max_score and count
+    """
+
+    def build(df: pd.DataFrame) -> pd.DataFrame:
+        all_hands = _build_dealt_totals(df)
+        return _aggregate_scores(
+            all_hands["dealt_cards"], all_hands["total_score"], "dealt_cards"
         )
-        .reset_index()
-        .sort_values("avg_score", ascending=False)
-        .head(top_n)
+
+    return cached_per_frame("dealt_stats", df, build)
+
+
+def _kept_hand_stats(df: pd.DataFrame) -> pd.DataFrame:
+    """Get per-hand stats for 4-card kept hands (cached per dataframe).
+
+    Args:
+        df: Hand details dataframe
+
+    Returns:
+        DataFrame with kept_cards, avg_score, min_score, max_score and count
+    """
+
+    def build(df: pd.DataFrame) -> pd.DataFrame:
+        all_kept = _build_kept_totals(df)
+        return _aggregate_scores(
+            all_kept["kept_cards"], all_kept["hand_score"], "kept_cards"
+        )
+
+    return cached_per_frame("kept_stats", df, build)
+
+
+def _best_tier(hand_stats: pd.DataFrame, key: str, n: int) -> pd.DataFrame:
+    """Select the n hands with the highest average score.
+
+    Args:
+        hand_stats: Aggregated per-hand stats
+        key: Name of the hand column
+        n: Number of hands to return
+
+    Returns:
+        DataFrame with key, avg_score, max_score and count
+    """
+    return hand_stats[[key, "avg_score", "max_score", "count"]].nlargest(n, "avg_score")
+
+
+def _worst_tier(hand_stats: pd.DataFrame, key: str, n: int) -> pd.DataFrame:
+    """Select the n hands with the lowest average score.
+
+    Args:
+        hand_stats: Aggregated per-hand stats
+        key: Name of the hand column
+        n: Number of hands to return
+
+    Returns:
+        DataFrame with key, avg_score, min_score and count
+    """
+    return hand_stats[[key, "avg_score", "min_score", "count"]].nsmallest(
+        n, "avg_score"
     )
 
-    return best_hands
+
+def _middle_tier(hand_stats: pd.DataFrame, key: str, n: int) -> pd.DataFrame:
+    """Select the n hands around the median average score.
+
+    Args:
+        hand_stats: Aggregated per-hand stats
+        key: Name of the hand column
+        n: Number of hands to return
+
+    Returns:
+        DataFrame with key, avg_score, min_score, max_score and count
+    """
+    ranked = hand_stats[
+        [key, "avg_score", "min_score", "max_score", "count"]
+    ].sort_values("avg_score", ascending=False)
+
+    # Get middle section
+    total_count = len(ranked)
+    middle_start = (total_count // 2) - (n // 2)
+    middle_end = middle_start + n
+
+    return ranked.iloc[middle_start:middle_end]
+
+
+def analyze_dealt_hands_tiers(df: pd.DataFrame, n: int = 10) -> Dict[str, pd.DataFrame]:
+    """Find the best, worst and middle-tier 6-card dealt hands in one pass.
+
+    Args:
+        df: Hand details dataframe
+        n: Number of hands in each tier
+
+    Returns:
+        Dictionary with "best", "worst" and "middle" DataFrames
+    """
+    hand_stats = _dealt_hand_stats(df)
+
+    return {
+        "best": _best_tier(hand_stats, "dealt_cards", n),
+        "worst": _worst_tier(hand_stats, "dealt_cards", n),
+        "middle": _middle_tier(hand_stats, "dealt_cards", n),
+    }
+
+
+def analyze_kept_hands_tiers(df: pd.DataFrame, n: int = 10) -> Dict[str, pd.DataFrame]:
+    """Find the best, worst and middle-tier 4-card kept hands in one pass.
+
+    Args:
+        df: Hand details dataframe
+        n: Number of hands in each tier
+
+    Returns:
+        Dictionary with "best", "worst" and "middle" DataFrames
+    """
+    hand_stats = _kept_hand_stats(df)
+
+    return {
+        "best": _best_tier(hand_stats, "kept_cards", n),
+        "worst": _worst_tier(hand_stats, "kept_cards", n),
+        "middle": _middle_tier(hand_stats, "kept_cards", n),
+    }
+
+
+def analyze_best_dealt_hands(df: pd.DataFrame, top_n: int = 10) -> pd.DataFrame:
+    """Find the best 6-card dealt hands.
+
+    Args:
+        df: Hand details dataframe
+        top_n: Number of top hands to return
+
+    Returns:
+        DataFrame with top dealt hands and their average scores
+    """
+    return _best_tier(_dealt_hand_stats(df), "dealt_cards", top_n)
 
 
 def analyze_best_kept_hands(df: pd.DataFrame, top_n: int = 10) -> pd.DataFrame:
@@ -62,34 +274,31 @@ def analyze_best_kept_hands(df: pd.DataFrame, top_n: int = 10) -> pd.DataFrame:
     Returns:
         DataFrame with top kept hands and their average scores
     """
-    # Combine both players' kept hands
-    p1_hands = df[["p1_kept_cards", "p1_hand_score"]].rename(
-        columns={"p1_kept_cards": "kept_cards", "p1_hand_score": "hand_score"}
-    )
-    p2_hands = df[["p2_kept_cards", "p2_hand_score"]].rename(
-        columns={"p2_kept_cards": "kept_cards", "p2_hand_score": "hand_score"}
-    )
+    return _best_tier(_kept_hand_stats(df), "kept_cards", top_n)
 
-    all_kept = pd.concat([p1_hands, p2_hands])
 
-    # Group by kept cards and calculate stats
-    best_kept = (
-        all_kept.groupby("kept_cards")
-        .agg(
-            avg_score=("hand_score", "mean"),
-            max_score=("hand_score", "max"),
-            count=("hand_score", "count"),
-        )
-        .reset_index()
-        .sort_values("avg_score", ascending=False)
-        .head(top_n)
-    )
+def build_dealt_index(df: pd.DataFrame) -> Dict[str, Dict[str, np.ndarray]]:
+    """Index the row positions of each dealt hand, per player.
+
+    Build once and pass to analyze_discard_strategy when querying many hands.
+
+    Args:
+        df: Hand details dataframe
 
-    return best_kept
+    Returns:
+        Dict with "p1" and "p2" mappings of dealt hand string to row positions
+    """
+    return {
+        player: df.groupby(f"{player}_dealt_cards", observed=True, sort=False).indices
+        for player in ("p1", "p2")
+    }
 
 
 def analyze_discard_strategy(
-    df: pd.DataFrame, dealt_hand: str, top_n: int = 5
+    df: pd.DataFrame,
+    dealt_hand: str,
+    top_n: int = 5,
+    dealt_index: Optional[Dict[str, Dict[str, np.ndarray]]] = None,
 ) -> pd.DataFrame:
     """Analyze discard strategies for a specific dealt hand.
 
@@ -97,38 +306,41 @@ def analyze_discard_strategy(
         df: Hand details dataframe
         dealt_hand: Specific 6-card dealt hand to analyze
         top_n: Number of top discard strategies to return
+        dealt_index: Optional index from build_dealt_index(df); without it
+            the dealt hand columns are scanned
 
     Returns:
         DataFrame with discard strategies and their outcomes
     """
     # Filter for this specific dealt hand
-    p1_mask = df["p1_dealt_cards"] == dealt_hand
-    p2_mask = df["p2_dealt_cards"] == dealt_hand
-
-    p1_discards = df[p1_mask][["p1_discards", "p1_hand_score"]].rename(
+    if dealt_index is not None:
+        no_rows = np.empty(0, dtype=np.intp)
+        p1_rows = df.iloc[dealt_index["p1"].get(dealt_hand, no_rows)]
+        p2_rows = df.iloc[dealt_index["p2"].get(dealt_hand, no_rows)]
+    else:
+        p1_rows = df[df["p1_dealt_cards"] == dealt_hand]
+        p2_rows = df[df["p2_dealt_cards"] == dealt_hand]
+
+    p1_discards = p1_rows[["p1_discards", "p1_hand_score"]].rename(
         columns={"p1_discards": "discards", "p1_hand_score": "hand_score"}
     )
-    p2_discards = df[p2_mask][["p2_discards", "p2_hand_score"]].rename(
+    p2_discards = p2_rows[["p2_discards", "p2_hand_score"]].rename(
         columns={"p2_discards": "discards", "p2_hand_score": "hand_score"}
     )
 
     all_discards = pd.concat([p1_discards, p2_discards])
+    all_discards["discards"] = all_discards["discards"].astype("category")
 
     if len(all_discards) == 0:
         return pd.DataFrame()
 
-    # Group by discard strategy
-    strategy_analysis = (
-        all_discards.groupby("discards")
-        .agg(
-            avg_score=("hand_score", "mean"),
-            max_score=("hand_score", "max"),
-            count=("hand_score", "count"),
-        )
-        .reset_index()
-        .sort_values("avg_score", ascending=False)
-        .head(top_n)
+    # Aggregate stats per discard strategy
+    hand_stats = _aggregate_scores(
+        all_discards["discards"], all_discards["hand_score"], "discards"
     )
+    strategy_analysis = hand_stats[
+        ["discards", "avg_score", "max_score", "count"]
+    ].nlargest(top_n, "avg_score")
 
     return strategy_analysis
 
@@ -143,43 +355,7 @@ def analyze_worst_dealt_hands(df: pd.DataFrame, bottom_n: int = 10) -> pd.DataFr
     Returns:
         DataFrame with worst dealt hands and their average scores
     """
-    # Calculate total value for each player (hand + crib if dealer)
-    p1_total = df.copy()
-    p1_total["is_dealer"] = df["dealer"] == "Player 1"
-    p1_total["total_score"] = p1_total["p1_hand_score"] + p1_total.apply(
-        lambda row: row["crib_score"] if row["is_dealer"] else 0, axis=1
-    )
-    p1_total["dealt_cards"] = p1_total["p1_dealt_cards"]
-
-    p2_total = df.copy()
-    p2_total["is_dealer"] = df["dealer"] == "Player 2"
-    p2_total["total_score"] = p2_total["p2_hand_score"] + p2_total.apply(
-        lambda row: row["crib_score"] if row["is_dealer"] else 0, axis=1
-    )
-    p2_total["dealt_cards"] = p2_total["p2_dealt_cards"]
-
-    # Combine both players
-    all_hands = pd.concat(
-        [
-            p1_total[["dealt_cards", "total_score"]],
-            p2_total[["dealt_cards", "total_score"]],
-        ]
-    )
-
-    # Group by dealt cards and calculate stats
-    worst_hands = (
-        all_hands.groupby("dealt_cards")
-        .agg(
-            avg_score=("total_score", "mean"),
-            min_score=("total_score", "min"),
-            count=("total_score", "count"),
-        )
-        .reset_index()
-        .sort_values("avg_score", ascending=True)
-        .head(bottom_n)
-    )
-
-    return worst_hands
+    return _worst_tier(_dealt_hand_stats(df), "dealt_cards", bottom_n)
 
 
 def analyze_worst_kept_hands(df: pd.DataFrame, bottom_n: int = 10) -> pd.DataFrame:
@@ -192,30 +368,7 @@ def analyze_worst_kept_hands(df: pd.DataFrame, bottom_n: int = 10) -> pd.DataFra
     Returns:
         DataFrame with worst kept hands and their average scores
     """
-    # Combine both players' kept hands
-    p1_hands = df[["p1_kept_cards", "p1_hand_score"]].rename(
-        columns={"p1_kept_cards": "kept_cards", "p1_hand_score": "hand_score"}
-    )
-    p2_hands = df[["p2_kept_cards", "p2_hand_score"]].rename(
-        columns={"p2_kept_cards": "kept_cards", "p2_hand_score": "hand_score"}
-    )
-
-    all_kept = pd.concat([p1_hands, p2_hands])
-
-    # Group by kept cards and calculate stats
-    worst_kept = (
-        all_kept.groupby("kept_cards")
-        .agg(
-            avg_score=("hand_score", "mean"),
-            min_score=("hand_score", "min"),
-            count=("hand_score", "count"),
-        )
-        .reset_index()
-        .sort_values("avg_score", ascending=True)
-        .head(bottom_n)
-    )
-
-    return worst_kept
+    return _worst_tier(_kept_hand_stats(df), "kept_cards", bottom_n)
 
 
 def analyze_middle_dealt_hands(df: pd.DataFrame, n: int = 10) -> pd.DataFrame:
@@ -228,50 +381,7 @@ def analyze_middle_dealt_hands(df: pd.DataFrame, n: int = 10) -> pd.DataFrame:
     Returns:
         DataFrame with middle-tier dealt hands and their average scores
     """
-    # Calculate total value for each player (hand + crib if dealer)
-    p1_total = df.copy()
-    p1_total["is_dealer"] = df["dealer"] == "Player 1"
-    p1_total["total_score"] = p1_total["p1_hand_score"] + p1_total.apply(
-        lambda row: row["crib_score"] if row["is_dealer"] else 0, axis=1
-    )
-    p1_total["dealt_cards"] = p1_total["p1_dealt_cards"]
-
-    p2_total = df.copy()
-    p2_total["is_dealer"] = df["dealer"] == "Player 2"
-    p2_total["total_score"] = p2_total["p2_hand_score"] + p2_total.apply(
-        lambda row: row["crib_score"] if row["is_dealer"] else 0, axis=1
-    )
-    p2_total["dealt_cards"] = p2_total["p2_dealt_cards"]
-
-    # Combine both players
-    all_hands = pd.concat(
-        [
-            p1_total[["dealt_cards", "total_score"]],
-            p2_total[["dealt_cards", "total_score"]],
-        ]
-    )
-
-    # Group by dealt cards and calculate stats
-    all_dealt = (
-        all_hands.groupby("dealt_cards")
-        .agg(
-            avg_score=("total_score", "mean"),
-            min_score=("total_score", "min"),
-            max_score=("total_score", "max"),
-            count=("total_score", "count"),
-        )
-        .reset_index()
-        .sort_values("avg_score", ascending=False)
-    )
-
-    # Get middle section
-    total_count = len(all_dealt)
-    middle_start = (total_count // 2) - (n // 2)
-    middle_end = middle_start + n
-
-    middle_hands = all_dealt.iloc[middle_start:middle_end]
-
-    return middle_hands
+    return _middle_tier(_dealt_hand_stats(df), "dealt_cards", n)
 
 
 def analyze_middle_kept_hands(df: pd.DataFrame, n: int = 10) -> pd.DataFrame:
@@ -284,37 +394,7 @@ def analyze_middle_kept_hands(df: pd.DataFrame, n: int = 10) -> pd.DataFrame:
     Returns:
         DataFrame with middle-tier kept hands and their average scores
     """
-    # Combine both players' kept hands
-    p1_hands = df[["p1_kept_cards", "p1_hand_score"]].rename(
-        columns={"p1_kept_cards": "kept_cards", "p1_hand_score": "hand_score"}
-    )
-    p2_hands = df[["p2_kept_cards", "p2_hand_score"]].rename(
-        columns={"p2_kept_cards": "kept_cards", "p2_hand_score": "hand_score"}
-    )
-
-    all_kept = pd.concat([p1_hands, p2_hands])
-
-    # Group by kept cards and calculate stats
-    all_kept_grouped = (
-        all_kept.groupby("kept_cards")
-        .agg(
-            avg_score=("hand_score", "mean"),
-            min_score=("hand_score", "min"),
-            max_score=("hand_score", "max"),
-            count=("hand_score", "count"),
-        )
-        .reset_index()
-        .sort_values("avg_score", ascending=False)
-    )
-
-    # Get middle section
-    total_count = len(all_kept_grouped)
-    middle_start = (total_count // 2) - (n // 2)
-    middle_end = middle_start + n
-
-    middle_hands = all_kept_grouped.iloc[middle_start:middle_end]
-
-    return middle_hands
+    return _middle_tier(_kept_hand_stats(df), "kept_cards", n)
 
 
 def print_best_hands_report(df: pd.DataFrame, top_n: int = 10) -> None:
@@ -324,32 +404,40 @@ def print_best_hands_report(df: pd.DataFrame, top_n: int = 10) -> None:
         df: Hand details dataframe
         top_n: Number of top hands to show
     """
-    print("\n" + "=" * 80)
+    print("\n" + _SEP80)
     print("BEST HANDS ANALYSIS")
-    print("=" * 80)
+    print(_SEP80)
 
     # Best dealt hands
     print(f"\nTop {top_n} Best 6-Card Dealt Hands:")
-    print("-" * 80)
+    print(_DASH80)
     best_dealt = analyze_best_dealt_hands(df, top_n)
-    for idx, row in best_dealt.iterrows():
-        print(
-            f"{idx + 1:2d}. {row['dealt_cards']:30s} | "
-            f"Avg: {row['avg_score']:5.2f} | "
-            f"Max: {row['max_score']:2.0f} | "
-            f"Count: {row['count']:4.0f}"
+    lines = [
+        f"{idx + 1:2d}. {cards:30s} | "
+        f"Avg: {avg_score:5.2f} | "
+        f"Max: {max_score:2.0f} | "
+        f"Count: {count:4.0f}"
+        for idx, cards, avg_score, max_score, count in best_dealt.itertuples(
+            index=True, name=None
         )
+    ]
+    if lines:
+        print("\n".join(lines))
 
     # Best kept hands
     print(f"\nTop {top_n} Best 4-Card Kept Hands:")
-    print("-" * 80)
+    print(_DASH80)
     best_kept = analyze_best_kept_hands(df, top_n)
-    for idx, row in best_kept.iterrows():
-        print(
-            f"{idx + 1:2d}. {row['kept_cards']:25s} | "
-            f"Avg: {row['avg_score']:5.2f} | "
-            f"Max: {row['max_score']:2.0f} | "
-            f"Count: {row['count']:4.0f}"
+    lines = [
+        f"{idx + 1:2d}. {cards:25s} | "
+        f"Avg: {avg_score:5.2f} | "
+        f"Max: {max_score:2.0f} | "
+        f"Count: {count:4.0f}"
+        for idx, cards, avg_score, max_score, count in best_kept.itertuples(
+            index=True, name=None
         )
+    ]
+    if lines:
+        print("\n".join(lines))
 
-    print("\n" + "=" * 80)
+    print("\n" + _SEP80)
@@ -1,13 +1,22 @@
 """Analyze individual card values in cribbage hands."""
 
-import matplotlib
-
-matplotlib.use("Agg")  # Non-interactive backend
+import numpy as np
 import pandas as pd
-from collections import Counter
 from pathlib import Path
 from typing import Dict, Optional
 
+from src.analysis._derived_columns import stacked_hand_scores
+from src.analysis._frame_cache import cached_per_frame
+from src.analysis._rank_kernels import hand_rank_codes
+
+RANKS = ["A", "2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K"]
+RANK_DTYPE = pd.CategoricalDtype(RANKS, ordered=True)
+FIVE_CODE = RANKS.index("5")
+
+# Separator lines for the printed report
+_SEP80 = "=" * 80
+_DASH80 = "-" * 80
+
 
 def parse_cards(card_string: str) -> list:
     """Parse comma-separated card string into list.
@@ -46,75 +55,151 @@ def analyze_card_frequency_in_high_hands(
     Returns:
         DataFrame with card frequencies
     """
-    # Collect all cards from high-scoring kept hands
-    high_hands = []
+    return _card_value_stats(df, threshold)["freq"].head(top_n)
 
-    # Player 1 high hands
-    p1_high = df[df["p1_hand_score"] >= threshold]
-    for cards_str in p1_high["p1_kept_cards"]:
-        high_hands.extend(parse_cards(cards_str))
 
-    # Player 2 high hands
-    p2_high = df[df["p2_hand_score"] >= threshold]
-    for cards_str in p2_high["p2_kept_cards"]:
-        high_hands.extend(parse_cards(cards_str))
+def _kept_hand_ranks(cards: pd.Series) -> pd.DataFrame:
+    """Split kept hand strings into one rank column per card.
 
-    # Count card ranks (not suits)
-    ranks = [extract_card_rank(card) for card in high_hands]
-    rank_counts = Counter(ranks)
+    Args:
+        cards: Series of comma-separated 4-card hands (e.g., "5♠,5♥,5♦,J♣")
 
-    # Create DataFrame
-    freq_df = pd.DataFrame(
-        [
-            {"rank": rank, "count": count, "pct": count / len(ranks) * 100}
-            for rank, count in rank_counts.most_common(top_n)
-        ]
+    Returns:
+        DataFrame with one column of ranks (e.g., "5") per card position
+    """
+    return cards.str.split(",", expand=True).apply(
+        lambda col: col.str.strip().str[:-1]  # Remove suit symbol
     )
 
-    return freq_df
 
+def _build_rank_codes(df: pd.DataFrame) -> np.ndarray:
+    """Build the matrix of rank codes for every kept hand.
 
-def analyze_average_score_by_card(df: pd.DataFrame) -> pd.DataFrame:
-    """Analyze average hand score when each card rank is present.
+    Args:
+        df: Hand details dataframe
+
+    Returns:
+        int8 array with one row per hand (Player 1's hands, then Player 2's,
+        as in stacked_hand_scores) and one code into RANKS per card
+    """
+    # Parse rank codes straight from the string bytes where the format allows
+    p1_codes = hand_rank_codes(df["p1_kept_cards"], RANKS)
+    p2_codes = hand_rank_codes(df["p2_kept_cards"], RANKS)
+    if (
+        p1_codes is not None
+        and p2_codes is not None
+        and p1_codes.shape == p2_codes.shape
+    ):
+        return np.concatenate([p1_codes, p2_codes])
+
+    p1_ranks = _kept_hand_ranks(df["p1_kept_cards"]).to_numpy()
+    p2_ranks = _kept_hand_ranks(df["p2_kept_cards"]).to_numpy()
+    ranks = np.concatenate([p1_ranks, p2_ranks])
+    codes = pd.Categorical(ranks.ravel(), dtype=RANK_DTYPE).codes
+    return codes.reshape(ranks.shape)
+
+
+def _rank_codes(df: pd.DataFrame) -> np.ndarray:
+    """Return the rank code matrix for df, built once and reused.
 
     Args:
         df: Hand details dataframe
 
     Returns:
-        DataFrame with average scores by card rank
+        Rank codes from _build_rank_codes
+    """
+    return cached_per_frame("rank_codes", df, _build_rank_codes)
+
+
+def _build_card_value_stats(df: pd.DataFrame, threshold: int) -> Dict[str, any]:
+    """Compute rank frequency, average score by rank and 5s stats together.
+
+    All three come from one pass that marks which ranks each hand holds.
+
+    Args:
+        df: Hand details dataframe
+        threshold: Score threshold for "high" hands
+
+    Returns:
+        Dict with "freq" (all ranks, most common first), "avg" and "five"
     """
-    rank_scores = {
-        rank: []
-        for rank in ["A", "2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K"]
+    codes = _rank_codes(df)
+    hand_scores = stacked_hand_scores(df)
+    n_hands = len(codes)
+
+    # Which ranks each hand holds, counting a rank once however many copies
+    holds_rank = np.zeros((n_hands, len(RANKS)), dtype=bool)
+    np.put_along_axis(holds_rank, codes.astype(np.intp), True, axis=1)
+
+    # Average score by rank, summing straight over the indicator columns
+    rank_counts = holds_rank.sum(axis=0)
+    rank_sums = hand_scores.astype(np.int64) @ holds_rank
+    with np.errstate(invalid="ignore"):
+        rank_avgs = rank_sums / rank_counts
+    score_df = pd.DataFrame(
+        {"rank": RANKS, "avg_score": rank_avgs, "count": rank_counts}
+    ).sort_values("avg_score", ascending=False)
+
+    # Hands with vs without 5s
+    has_five = holds_rank[:, FIVE_CODE]
+    with_five = hand_scores[has_five]
+    without_five = hand_scores[~has_five]
+    avg_with_five = with_five.mean()
+    avg_without_five = without_five.mean()
+    five_stats = {
+        "avg_with_five": avg_with_five,
+        "avg_without_five": avg_without_five,
+        "five_advantage": avg_with_five - avg_without_five,
+        "hands_with_five": len(with_five),
+        "hands_without_five": len(without_five),
+        "pct_with_five": len(with_five) / (len(with_five) + len(without_five)) * 100,
     }
 
-    # Analyze both players
-    for _, row in df.iterrows():
-        # Player 1
-        p1_cards = parse_cards(row["p1_kept_cards"])
-        p1_ranks = [extract_card_rank(c) for c in p1_cards]
-        for rank in set(p1_ranks):
-            rank_scores[rank].append(row["p1_hand_score"])
-
-        # Player 2
-        p2_cards = parse_cards(row["p2_kept_cards"])
-        p2_ranks = [extract_card_rank(c) for c in p2_cards]
-        for rank in set(p2_ranks):
-            rank_scores[rank].append(row["p2_hand_score"])
-
-    # Calculate averages
-    avg_scores = [
+    # Card rank frequency in high hands (every card counts)
+    high_codes = codes[hand_scores >= threshold].ravel()
+    present, first_seen, counts = np.unique(
+        high_codes, return_index=True, return_counts=True
+    )
+    # Most common first; ties keep the order ranks first appear in
+    order = np.lexsort((first_seen, -counts))
+    freq_df = pd.DataFrame(
         {
-            "rank": rank,
-            "avg_score": pd.Series(scores).mean(),
-            "count": len(scores),
+            "rank": np.asarray(RANKS, dtype=object)[present[order]],
+            "count": counts[order],
+            "pct": counts[order] / len(high_codes) * 100,
         }
-        for rank, scores in rank_scores.items()
-    ]
+    )
 
-    score_df = pd.DataFrame(avg_scores).sort_values("avg_score", ascending=False)
+    return {"freq": freq_df, "avg": score_df, "five": five_stats}
 
-    return score_df
+
+def _card_value_stats(df: pd.DataFrame, threshold: int = 15) -> Dict[str, any]:
+    """Return the combined card value stats for df, built once per threshold.
+
+    Args:
+        df: Hand details dataframe
+        threshold: Score threshold for "high" hands
+
+    Returns:
+        Stats from _build_card_value_stats
+    """
+    return cached_per_frame(
+        f"card_value_stats_{threshold}",
+        df,
+        lambda df: _build_card_value_stats(df, threshold),
+    )
+
+
+def analyze_average_score_by_card(df: pd.DataFrame) -> pd.DataFrame:
+    """Analyze average hand score when each card rank is present.
+
+    Args:
+        df: Hand details dataframe
+
+    Returns:
+        DataFrame with average scores by card rank
+    """
+    return _card_value_stats(df)["avg"].copy()
 
 
 def analyze_five_value(df: pd.DataFrame) -> Dict[str, any]:
@@ -126,37 +211,7 @@ def analyze_five_value(df: pd.DataFrame) -> Dict[str, any]:
     Returns:
         Dictionary with 5-specific statistics
     """
-    # Hands with vs without 5s
-    with_five = []
-    without_five = []
-
-    for _, row in df.iterrows():
-        # Player 1
-        p1_cards = parse_cards(row["p1_kept_cards"])
-        p1_ranks = [extract_card_rank(c) for c in p1_cards]
-        if "5" in p1_ranks:
-            with_five.append(row["p1_hand_score"])
-        else:
-            without_five.append(row["p1_hand_score"])
-
-        # Player 2
-        p2_cards = parse_cards(row["p2_kept_cards"])
-        p2_ranks = [extract_card_rank(c) for c in p2_cards]
-        if "5" in p2_ranks:
-            with_five.append(row["p2_hand_score"])
-        else:
-            without_five.append(row["p2_hand_score"])
-
-    stats = {
-        "avg_with_five": pd.Series(with_five).mean(),
-        "avg_without_five": pd.Series(without_five).mean(),
-        "five_advantage": pd.Series(with_five).mean() - pd.Series(without_five).mean(),
-        "hands_with_five": len(with_five),
-        "hands_without_five": len(without_five),
-        "pct_with_five": len(with_five) / (len(with_five) + len(without_five)) * 100,
-    }
-
-    return stats
+    return dict(_card_value_stats(df)["five"])
 
 
 def print_card_values_report(df: pd.DataFrame) -> None:
@@ -165,32 +220,36 @@ def print_card_values_report(df: pd.DataFrame) -> None:
     Args:
         df: Hand details dataframe
     """
-    print("\n" + "=" * 80)
+    print("\n" + _SEP80)
     print("CARD VALUES ANALYSIS")
-    print("=" * 80)
+    print(_SEP80)
 
     # Card frequency in high hands
     print("\nCard Rank Frequency in High-Scoring Hands (≥15 points):")
-    print("-" * 80)
+    print(_DASH80)
     freq_df = analyze_card_frequency_in_high_hands(df, threshold=15)
     print(f"{'Rank':<8} {'Count':>10} {'Percentage':>12}")
-    print("-" * 80)
-    for _, row in freq_df.iterrows():
-        print(f"{row['rank']:<8} {row['count']:>10.0f} {row['pct']:>11.2f}%")
+    print(_DASH80)
+    for rank, count, pct in freq_df[["rank", "count", "pct"]].itertuples(
+        index=False, name=None
+    ):
+        print(f"{rank:<8} {count:>10.0f} {pct:>11.2f}%")
 
     # Average score by card
     print("\nAverage Hand Score When Card is Present:")
-    print("-" * 80)
+    print(_DASH80)
     avg_df = analyze_average_score_by_card(df)
     print(f"{'Rank':<8} {'Avg Score':>12} {'Count':>10}")
-    print("-" * 80)
-    for _, row in avg_df.iterrows():
-        print(f"{row['rank']:<8} {row['avg_score']:>12.2f} {row['count']:>10.0f}")
+    print(_DASH80)
+    for rank, avg_score, count in avg_df[["rank", "avg_score", "count"]].itertuples(
+        index=False, name=None
+    ):
+        print(f"{rank:<8} {avg_score:>12.2f} {count:>10.0f}")
 
     # Special analysis for 5s
     five_stats = analyze_five_value(df)
     print("\nSpecial Analysis: The Value of 5s:")
-    print("-" * 80)
+    print(_DASH80)
     print(f"Avg score with 5:       {five_stats['avg_with_five']:6.2f}")
     print(f"Avg score without 5:    {five_stats['avg_without_five']:6.2f}")
     print(f"Five advantage:         {five_stats['five_advantage']:+6.2f} points")
@@ -199,75 +258,127 @@ def print_card_values_report(df: pd.DataFrame) -> None:
     )
     print(f"Hands without 5:        {five_stats['hands_without_five']:6.0f}")
 
-    print("\n" + "=" * 80)
+    print("\n" + _SEP80)
 
 
-def plot_card_values(df: pd.DataFrame, output_path: Optional[Path] = None) -> None:
-    """Create visualization of card values.
+def _draw_card_values_skeleton(axes, bars: Dict, n_freq: int, n_ranks: int) -> None:
+    """Draw the static parts of the card values figure with zero-height bars.
 
     Args:
-        df: Hand details dataframe
-        output_path: Optional path to save plot
+        axes: 2x2 axes array of a new figure
+        bars: Dict to store the bar containers in, by panel
+        n_freq: Number of ranks in the high-hand frequency panel
+        n_ranks: Number of ranks in the average score and count panels
     """
-    import matplotlib.pyplot as plt
-
-    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
-
-    # Card frequency in high hands
-    freq_df = analyze_card_frequency_in_high_hands(df, threshold=15)
-    if len(freq_df) > 0:
-        axes[0, 0].bar(
-            freq_df["rank"], freq_df["pct"], alpha=0.7, color="purple", edgecolor="black"
+    if n_freq > 0:
+        bars["freq"] = axes[0, 0].bar(
+            range(n_freq),
+            np.zeros(n_freq),
+            alpha=0.7,
+            color="purple",
+            edgecolor="black",
         )
         axes[0, 0].set_xlabel("Card Rank")
         axes[0, 0].set_ylabel("Percentage (%)")
-        axes[0, 0].set_title("Card Frequency in High-Scoring Hands (≥15 points)")
         axes[0, 0].grid(True, alpha=0.3, axis="y")
     else:
-        axes[0, 0].text(0.5, 0.5, "No hands ≥15 points\nin dataset",
-                       ha="center", va="center", transform=axes[0, 0].transAxes,
-                       fontsize=12)
-        axes[0, 0].set_title("Card Frequency in High-Scoring Hands (≥15 points)")
+        axes[0, 0].text(
+            0.5,
+            0.5,
+            "No hands ≥15 points\nin dataset",
+            ha="center",
+            va="center",
+            transform=axes[0, 0].transAxes,
+            fontsize=12,
+        )
+    axes[0, 0].set_title("Card Frequency in High-Scoring Hands (≥15 points)")
 
-    # Average score by card rank
-    avg_df = analyze_average_score_by_card(df)
-    axes[0, 1].bar(
-        avg_df["rank"], avg_df["avg_score"], alpha=0.7, color="green", edgecolor="black"
+    bars["avg"] = axes[0, 1].bar(
+        range(n_ranks), np.zeros(n_ranks), alpha=0.7, color="green", edgecolor="black"
     )
     axes[0, 1].set_xlabel("Card Rank")
     axes[0, 1].set_ylabel("Average Hand Score")
     axes[0, 1].set_title("Average Hand Score When Card is Present")
     axes[0, 1].grid(True, alpha=0.3, axis="y")
 
-    # Value of 5s comparison
-    five_stats = analyze_five_value(df)
-    categories = ["With 5", "Without 5"]
-    values = [five_stats["avg_with_five"], five_stats["avg_without_five"]]
-
-    axes[1, 0].bar(categories, values, alpha=0.7, color=["darkgreen", "darkred"], edgecolor="black")
-    axes[1, 0].set_ylabel("Average Hand Score")
-    axes[1, 0].set_title(
-        f"The Value of 5s\n(Advantage: {five_stats['five_advantage']:+.2f} points)"
+    bars["five"] = axes[1, 0].bar(
+        range(2),
+        np.zeros(2),
+        alpha=0.7,
+        color=["darkgreen", "darkred"],
+        edgecolor="black",
     )
+    axes[1, 0].set_ylabel("Average Hand Score")
     axes[1, 0].grid(True, alpha=0.3, axis="y")
 
-    # Card rank occurrence counts (sorted by count descending)
-    count_sorted_df = avg_df.sort_values("count", ascending=False)
-    axes[1, 1].bar(
-        count_sorted_df["rank"], count_sorted_df["count"], alpha=0.7, color="orange", edgecolor="black"
+    bars["count"] = axes[1, 1].bar(
+        range(n_ranks), np.zeros(n_ranks), alpha=0.7, color="orange", edgecolor="black"
     )
     axes[1, 1].set_xlabel("Card Rank")
     axes[1, 1].set_ylabel("Occurrences")
     axes[1, 1].set_title("Card Rank Occurrence in All Hands")
     axes[1, 1].grid(True, alpha=0.3, axis="y")
 
-    plt.tight_layout()
+
+def plot_card_values(df: pd.DataFrame, output_path: Optional[Path] = None) -> None:
+    """Create visualization of card values.
+
+    The figure and its bars are built on the first call and reused by later
+    calls with the same bar counts, which only update heights and labels.
+
+    Args:
+        df: Hand details dataframe
+        output_path: Optional path to save plot
+    """
+    # Imported here so report-only runs don't load matplotlib
+    from src.analysis._plot_cache import reusable_figure, update_bars
+
+    freq_df = analyze_card_frequency_in_high_hands(df, threshold=15)
+    avg_df = analyze_average_score_by_card(df)
+    five_stats = analyze_five_value(df)
+    count_sorted_df = avg_df.sort_values("count", ascending=False)
+
+    fig, axes, bars, reused = reusable_figure(
+        "card_values", (14, 10), (len(freq_df), len(avg_df))
+    )
+    if not reused:
+        _draw_card_values_skeleton(axes, bars, len(freq_df), len(avg_df))
+
+    # Card frequency in high hands
+    if len(freq_df) > 0:
+        update_bars(
+            axes[0, 0], bars["freq"], freq_df["rank"].astype(str), freq_df["pct"]
+        )
+
+    # Average score by card rank
+    update_bars(
+        axes[0, 1], bars["avg"], avg_df["rank"].astype(str), avg_df["avg_score"]
+    )
+
+    # Value of 5s comparison
+    update_bars(
+        axes[1, 0],
+        bars["five"],
+        ["With 5", "Without 5"],
+        [five_stats["avg_with_five"], five_stats["avg_without_five"]],
+    )
+    axes[1, 0].set_title(
+        f"The Value of 5s\n(Advantage: {five_stats['five_advantage']:+.2f} points)"
+    )
+
+    # Card rank occurrence counts (sorted by count descending)
+    update_bars(
+        axes[1, 1],
+        bars["count"],
+        count_sorted_df["rank"].astype(str),
+        count_sorted_df["count"],
+    )
+
+    fig.tight_layout()
 
     if output_path:
-        plt.savefig(output_path, dpi=150, bbox_inches="tight")
+        fig.savefig(output_path, dpi=150)
         print(f"Plot saved to: {output_path}")
     else:
-        plt.savefig("card_values.png", dpi=150, bbox_inches="tight")
+        fig.savefig("card_values.png", dpi=150)
         print("Plot saved to: card_values.png")
-
-    plt.close()
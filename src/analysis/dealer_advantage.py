@@ -1,53 +1,108 @@
 """Analyze dealer advantage in cribbage."""
 
-import matplotlib
-
-matplotlib.use("Agg")  # Non-interactive backend
+import numpy as np
 import pandas as pd
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
+from src.analysis._derived_columns import (
+    hand_totals,
+    p1_dealer_mask,
+    stacked_hand_scores,
+)
+from src.analysis._frame_cache import cached_per_frame
 
-def analyze_dealer_advantage(
-    df: pd.DataFrame, summary_df: pd.DataFrame = None
-) -> Dict[str, any]:
-    """Analyze dealer vs non-dealer advantage.
+# Game positions, in the order the positional report lists them
+POSITIONS = ["ahead", "behind", "tied"]
+
+# Histogram bin edges for crib scores
+CRIB_BINS = range(0, 30)
+
+# Separator lines for the printed report
+_SEP80 = "=" * 80
+_DASH80 = "-" * 80
+
+
+def _build_dealer_hand_scores(df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+    """Split each hand's scores into the dealer's and the non-dealer's.
 
     Args:
         df: Hand details dataframe
-        summary_df: Optional game summary dataframe for win rate analysis
 
     Returns:
-        Dictionary with dealer advantage statistics
+        Tuple of (dealer hand + crib scores, non-dealer hand scores)
+    """
+    is_p1_dealer = p1_dealer_mask(df)
+    p1_totals, p2_totals = hand_totals(df)
+
+    dealer_scores = np.where(is_p1_dealer, p1_totals, p2_totals)
+    non_dealer_scores = np.where(
+        is_p1_dealer, df["p2_hand_score"].to_numpy(), df["p1_hand_score"].to_numpy()
+    )
+
+    return dealer_scores, non_dealer_scores
+
+
+def _dealer_hand_scores(df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the dealer and non-dealer scores for df, split once and reused.
+
+    Args:
+        df: Hand details dataframe
+
+    Returns:
+        Tuple of (dealer hand + crib scores, non-dealer hand scores)
+    """
+    return cached_per_frame("dealer_hand_scores", df, _build_dealer_hand_scores)
+
+
+def _hand_dealer_stats(df: pd.DataFrame) -> Dict[str, any]:
+    """Compute crib and dealer vs non-dealer scoring stats from the hands.
+
+    Args:
+        df: Hand details dataframe
+
+    Returns:
+        Dictionary with crib and scoring statistics
     """
     # Calculate average crib value
+    crib = df["crib_score"].agg(["mean", "median", "max"])
     crib_stats = {
-        "mean_crib_score": df["crib_score"].mean(),
-        "median_crib_score": df["crib_score"].median(),
-        "max_crib_score": df["crib_score"].max(),
+        "mean_crib_score": crib["mean"],
+        "median_crib_score": crib["median"],
+        "max_crib_score": crib["max"],
     }
 
     # Dealer hand + crib vs non-dealer hand
-    dealer_scores = []
-    non_dealer_scores = []
-
-    for _, row in df.iterrows():
-        if row["dealer"] == "Player 1":
-            dealer_scores.append(row["p1_hand_score"] + row["crib_score"])
-            non_dealer_scores.append(row["p2_hand_score"])
-        else:
-            dealer_scores.append(row["p2_hand_score"] + row["crib_score"])
-            non_dealer_scores.append(row["p1_hand_score"])
-
-    dealer_series = pd.Series(dealer_scores)
-    non_dealer_series = pd.Series(non_dealer_scores)
+    dealer_scores, non_dealer_scores = _dealer_hand_scores(df)
+    dealer_avg = dealer_scores.mean()
+    non_dealer_avg = non_dealer_scores.mean()
 
     scoring_stats = {
-        "dealer_avg": dealer_series.mean(),
-        "non_dealer_avg": non_dealer_series.mean(),
-        "dealer_advantage_points": dealer_series.mean() - non_dealer_series.mean(),
+        "dealer_avg": dealer_avg,
+        "non_dealer_avg": non_dealer_avg,
+        "dealer_advantage_points": dealer_avg - non_dealer_avg,
     }
 
+    return {**crib_stats, **scoring_stats}
+
+
+def analyze_dealer_advantage(
+    df: pd.DataFrame, summary_df: pd.DataFrame = None
+) -> Dict[str, any]:
+    """Analyze dealer vs non-dealer advantage.
+
+    The hand-level stats are computed once per dataframe and shared by the
+    report and the plot.
+
+    Args:
+        df: Hand details dataframe
+        summary_df: Optional game summary dataframe for win rate analysis
+
+    Returns:
+        Dictionary with dealer advantage statistics
+    """
+    hand_stats = cached_per_frame("dealer_advantage", df, _hand_dealer_stats)
+
     # Win rate analysis (if summary data provided)
     win_stats = {}
     if summary_df is not None:
@@ -55,11 +110,11 @@ def analyze_dealer_advantage(
         # For now, we'll skip detailed win rate analysis
         pass
 
-    return {**crib_stats, **scoring_stats, **win_stats}
+    return {**hand_stats, **win_stats}
 
 
-def analyze_first_dealer_impact(df: pd.DataFrame) -> Dict[str, any]:
-    """Analyze impact of dealing first.
+def _first_dealer_stats(df: pd.DataFrame) -> Dict[str, any]:
+    """Compute first hand dealer vs non-dealer stats.
 
     Args:
         df: Hand details dataframe
@@ -67,33 +122,39 @@ def analyze_first_dealer_impact(df: pd.DataFrame) -> Dict[str, any]:
     Returns:
         Statistics on first dealer advantage
     """
-    # Group by game and find first hand dealer
-    first_hand = df[df["hand_number"] == 1]
+    # Select each game's first hand from the full-frame score arrays
+    is_first_hand = df["hand_number"].to_numpy() == 1
+    dealer_scores, non_dealer_scores = _dealer_hand_scores(df)
 
     # Calculate average points scored in first hand by dealer vs non-dealer
-    dealer_first_hand = []
-    non_dealer_first_hand = []
-
-    for _, row in first_hand.iterrows():
-        if row["dealer"] == "Player 1":
-            dealer_first_hand.append(row["p1_hand_score"] + row["crib_score"])
-            non_dealer_first_hand.append(row["p2_hand_score"])
-        else:
-            dealer_first_hand.append(row["p2_hand_score"] + row["crib_score"])
-            non_dealer_first_hand.append(row["p1_hand_score"])
+    dealer_first_hand = dealer_scores[is_first_hand]
+    non_dealer_first_hand = non_dealer_scores[is_first_hand]
+    dealer_first_avg = dealer_first_hand.mean()
+    non_dealer_first_avg = non_dealer_first_hand.mean()
 
     stats = {
-        "dealer_first_hand_avg": pd.Series(dealer_first_hand).mean(),
-        "non_dealer_first_hand_avg": pd.Series(non_dealer_first_hand).mean(),
-        "first_hand_advantage": pd.Series(dealer_first_hand).mean()
-        - pd.Series(non_dealer_first_hand).mean(),
+        "dealer_first_hand_avg": dealer_first_avg,
+        "non_dealer_first_hand_avg": non_dealer_first_avg,
+        "first_hand_advantage": dealer_first_avg - non_dealer_first_avg,
     }
 
     return stats
 
 
-def analyze_positional_scoring(df: pd.DataFrame) -> pd.DataFrame:
-    """Analyze scoring by game position (ahead/behind/tied).
+def analyze_first_dealer_impact(df: pd.DataFrame) -> Dict[str, any]:
+    """Analyze impact of dealing first.
+
+    Args:
+        df: Hand details dataframe
+
+    Returns:
+        Statistics on first dealer advantage
+    """
+    return dict(cached_per_frame("first_dealer_impact", df, _first_dealer_stats))
+
+
+def _positional_stats(df: pd.DataFrame) -> pd.DataFrame:
+    """Compute scoring stats by game position (ahead/behind/tied).
 
     Args:
         df: Hand details dataframe
@@ -102,42 +163,25 @@ def analyze_positional_scoring(df: pd.DataFrame) -> pd.DataFrame:
         DataFrame with positional scoring statistics
     """
     # Calculate position before each hand
-    positions = []
-
-    for _, row in df.iterrows():
-        p1_before = row["p1_score_before"]
-        p2_before = row["p2_score_before"]
-
-        if p1_before > p2_before:
-            p1_pos = "ahead"
-            p2_pos = "behind"
-        elif p1_before < p2_before:
-            p1_pos = "behind"
-            p2_pos = "ahead"
-        else:
-            p1_pos = "tied"
-            p2_pos = "tied"
-
-        positions.append(
-            {
-                "position": p1_pos,
-                "hand_score": row["p1_hand_score"],
-                "is_dealer": row["dealer"] == "Player 1",
-            }
-        )
-        positions.append(
-            {
-                "position": p2_pos,
-                "hand_score": row["p2_hand_score"],
-                "is_dealer": row["dealer"] == "Player 2",
-            }
-        )
-
-    pos_df = pd.DataFrame(positions)
+    # Position codes into POSITIONS, looked up by sign(p1 - p2) + 1
+    score_sign = np.sign(
+        df["p1_score_before"].to_numpy() - df["p2_score_before"].to_numpy()
+    )
+    p1_pos = np.array([1, 2, 0], dtype=np.int8)[score_sign + 1]
+    p2_pos = np.array([0, 2, 1], dtype=np.int8)[score_sign + 1]
+
+    pos_df = pd.DataFrame(
+        {
+            "position": pd.Categorical.from_codes(
+                np.concatenate([p1_pos, p2_pos]), categories=POSITIONS
+            ),
+            "hand_score": stacked_hand_scores(df),
+        }
+    )
 
     # Group by position and calculate average scores
     positional_stats = (
-        pos_df.groupby("position")["hand_score"]
+        pos_df.groupby("position", observed=True)["hand_score"]
         .agg(["mean", "median", "count"])
         .reset_index()
     )
@@ -145,6 +189,18 @@ def analyze_positional_scoring(df: pd.DataFrame) -> pd.DataFrame:
     return positional_stats
 
 
+def analyze_positional_scoring(df: pd.DataFrame) -> pd.DataFrame:
+    """Analyze scoring by game position (ahead/behind/tied).
+
+    Args:
+        df: Hand details dataframe
+
+    Returns:
+        DataFrame with positional scoring statistics
+    """
+    return cached_per_frame("positional_scoring", df, _positional_stats).copy()
+
+
 def print_dealer_advantage_report(
     df: pd.DataFrame, summary_df: pd.DataFrame = None
 ) -> None:
@@ -154,14 +210,14 @@ def print_dealer_advantage_report(
         df: Hand details dataframe
         summary_df: Optional game summary dataframe
     """
-    print("\n" + "=" * 80)
+    print("\n" + _SEP80)
     print("DEALER ADVANTAGE ANALYSIS")
-    print("=" * 80)
+    print(_SEP80)
 
     # Dealer advantage
     adv_stats = analyze_dealer_advantage(df, summary_df)
     print("\nDealer vs Non-Dealer Scoring:")
-    print("-" * 80)
+    print(_DASH80)
     print(f"Average crib score:         {adv_stats['mean_crib_score']:6.2f}")
     print(f"Median crib score:          {adv_stats['median_crib_score']:6.1f}")
     print(f"Max crib score:             {adv_stats['max_crib_score']:6.0f}")
@@ -174,7 +230,7 @@ def print_dealer_advantage_report(
     # First dealer impact
     first_dealer = analyze_first_dealer_impact(df)
     print("\nFirst Hand Impact:")
-    print("-" * 80)
+    print(_DASH80)
     print(f"Dealer first hand avg:      {first_dealer['dealer_first_hand_avg']:6.2f}")
     print(
         f"Non-dealer first hand avg:  {first_dealer['non_dealer_first_hand_avg']:6.2f}"
@@ -186,83 +242,138 @@ def print_dealer_advantage_report(
     # Positional scoring
     positional = analyze_positional_scoring(df)
     print("\nScoring by Position:")
-    print("-" * 80)
+    print(_DASH80)
     print(f"{'Position':<15} {'Avg Score':>12} {'Median':>10} {'Count':>10}")
-    print("-" * 80)
-    for _, row in positional.iterrows():
+    print(_DASH80)
+    for position, mean, median, count in positional[
+        ["position", "mean", "median", "count"]
+    ].itertuples(index=False, name=None):
         print(
-            f"{row['position'].capitalize():<15} "
-            f"{row['mean']:>12.2f} "
-            f"{row['median']:>10.1f} "
-            f"{row['count']:>10.0f}"
+            f"{position.capitalize():<15} "
+            f"{mean:>12.2f} "
+            f"{median:>10.1f} "
+            f"{count:>10.0f}"
         )
 
-    print("\n" + "=" * 80)
+    print("\n" + _SEP80)
+
+
+def _draw_dealer_advantage_skeleton(axes, bars: Dict, n_positions: int) -> None:
+    """Draw the static parts of the dealer advantage figure with empty bars.
+
+    Args:
+        axes: 2x2 axes array of a new figure
+        bars: Dict to store the bar containers in, by panel
+        n_positions: Number of game positions in the positional panel
+    """
+    bars["dealer"] = axes[0, 0].bar(
+        range(2), np.zeros(2), alpha=0.7, color=["green", "blue"], edgecolor="black"
+    )
+    axes[0, 0].set_ylabel("Average Points")
+    axes[0, 0].grid(True, alpha=0.3, axis="y")
+
+    _, _, bars["crib"] = axes[0, 1].hist(
+        [], bins=CRIB_BINS, alpha=0.7, color="purple", edgecolor="black"
+    )
+    axes[0, 1].set_xlabel("Crib Score")
+    axes[0, 1].set_ylabel("Frequency")
+    axes[0, 1].grid(True, alpha=0.3)
+
+    bars["first"] = axes[1, 0].bar(
+        range(2),
+        np.zeros(2),
+        alpha=0.7,
+        color=["darkgreen", "darkblue"],
+        edgecolor="black",
+    )
+    axes[1, 0].set_ylabel("Average Points")
+    axes[1, 0].grid(True, alpha=0.3, axis="y")
+
+    bars["positional"] = axes[1, 1].bar(
+        range(n_positions),
+        np.zeros(n_positions),
+        alpha=0.7,
+        color="orange",
+        edgecolor="black",
+    )
+    axes[1, 1].set_xlabel("Position")
+    axes[1, 1].set_ylabel("Average Hand Score")
+    axes[1, 1].set_title("Average Score by Game Position")
+    axes[1, 1].grid(True, alpha=0.3, axis="y")
 
 
 def plot_dealer_advantage(df: pd.DataFrame, output_path: Optional[Path] = None) -> None:
     """Create visualization of dealer advantage.
 
+    The figure and its bars are built on the first call and reused by later
+    calls with the same number of positions, which only update heights and
+    labels.
+
     Args:
         df: Hand details dataframe
         output_path: Optional path to save plot
     """
-    import matplotlib.pyplot as plt
+    # Imported here so report-only runs don't load matplotlib
+    from src.analysis._plot_cache import reusable_figure, update_bars
 
-    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
-
-    # Dealer vs non-dealer average scores
     adv_stats = analyze_dealer_advantage(df)
-    categories = ["Dealer\n(Hand + Crib)", "Non-Dealer\n(Hand Only)"]
-    values = [adv_stats["dealer_avg"], adv_stats["non_dealer_avg"]]
+    first_dealer = analyze_first_dealer_impact(df)
+    positional = analyze_positional_scoring(df)
 
-    axes[0, 0].bar(categories, values, alpha=0.7, color=["green", "blue"], edgecolor="black")
-    axes[0, 0].set_ylabel("Average Points")
+    fig, axes, bars, reused = reusable_figure(
+        "dealer_advantage", (14, 10), len(positional)
+    )
+    if not reused:
+        _draw_dealer_advantage_skeleton(axes, bars, len(positional))
+
+    # Dealer vs non-dealer average scores
+    update_bars(
+        axes[0, 0],
+        bars["dealer"],
+        ["Dealer\n(Hand + Crib)", "Non-Dealer\n(Hand Only)"],
+        [adv_stats["dealer_avg"], adv_stats["non_dealer_avg"]],
+    )
     axes[0, 0].set_title(
         f"Dealer vs Non-Dealer Scoring\n(Advantage: {adv_stats['dealer_advantage_points']:+.2f} points)"
     )
-    axes[0, 0].grid(True, alpha=0.3, axis="y")
 
     # Crib score distribution
-    crib_scores = df["crib_score"]
-    axes[0, 1].hist(crib_scores, bins=range(0, 30), alpha=0.7, color="purple", edgecolor="black")
-    axes[0, 1].set_xlabel("Crib Score")
-    axes[0, 1].set_ylabel("Frequency")
+    counts, _ = np.histogram(df["crib_score"], bins=CRIB_BINS)
+    for patch, count in zip(bars["crib"], counts):
+        patch.set_height(count)
+    axes[0, 1].relim()
+    axes[0, 1].autoscale_view()
     axes[0, 1].set_title(
         f"Crib Score Distribution\n(Mean: {adv_stats['mean_crib_score']:.2f}, Median: {adv_stats['median_crib_score']:.1f})"
     )
-    axes[0, 1].grid(True, alpha=0.3)
 
     # First hand advantage
-    first_dealer = analyze_first_dealer_impact(df)
-    categories_first = ["Dealer\nFirst Hand", "Non-Dealer\nFirst Hand"]
-    values_first = [first_dealer["dealer_first_hand_avg"], first_dealer["non_dealer_first_hand_avg"]]
-
-    axes[1, 0].bar(categories_first, values_first, alpha=0.7, color=["darkgreen", "darkblue"], edgecolor="black")
-    axes[1, 0].set_ylabel("Average Points")
+    update_bars(
+        axes[1, 0],
+        bars["first"],
+        ["Dealer\nFirst Hand", "Non-Dealer\nFirst Hand"],
+        [
+            first_dealer["dealer_first_hand_avg"],
+            first_dealer["non_dealer_first_hand_avg"],
+        ],
+    )
     axes[1, 0].set_title(
         f"First Hand Advantage\n(Difference: {first_dealer['first_hand_advantage']:+.2f} points)"
     )
-    axes[1, 0].grid(True, alpha=0.3, axis="y")
 
     # Positional scoring
-    positional = analyze_positional_scoring(df)
-    positions = positional["position"].tolist()
-    means = positional["mean"].tolist()
-
-    axes[1, 1].bar(positions, means, alpha=0.7, color="orange", edgecolor="black")
-    axes[1, 1].set_xlabel("Position")
-    axes[1, 1].set_ylabel("Average Hand Score")
-    axes[1, 1].set_title("Average Score by Game Position")
-    axes[1, 1].grid(True, alpha=0.3, axis="y")
+    update_bars(
+        axes[1, 1],
+        bars["positional"],
+        positional["position"].astype(str),
+        positional["mean"],
+    )
 
-    plt.tight_layout()
+    fig.tight_layout()
 
     if output_path:
-        plt.savefig(output_path, dpi=150, bbox_inches="tight")
+        fig.savefig(output_path, dpi=150)
         print(f"Plot saved to: {output_path}")
     else:
-        plt.savefig("dealer_advantage.png", dpi=150, bbox_inches="tight")
+        fig.savefig("dealer_advantage.png", dpi=150)
         print("Plot saved to: dealer_advantage.png")
-
-    plt.close()
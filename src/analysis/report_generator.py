@@ -1,22 +1,25 @@
 """Generate comprehensive markdown reports with plots and analysis."""
 
-import pandas as pd
+import contextlib
+import io
+import multiprocessing
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
 
+from src.analysis._derived_columns import count_games
 from src.analysis.best_hands import (
-    analyze_best_dealt_hands,
-    analyze_best_kept_hands,
-    analyze_worst_dealt_hands,
-    analyze_worst_kept_hands,
-    analyze_middle_dealt_hands,
-    analyze_middle_kept_hands,
+    analyze_dealt_hands_tiers,
+    analyze_kept_hands_tiers,
 )
 from src.analysis.scoring_distribution import (
     analyze_hand_score_distribution,
     analyze_crib_score_distribution,
-    analyze_scoring_breakdown,
     plot_score_distribution,
+    summarize_scoring_breakdown,
 )
 from src.analysis.dealer_advantage import (
     analyze_dealer_advantage,
@@ -29,6 +32,9 @@ from src.analysis.card_values import (
     plot_card_values,
 )
 
+# Unicode suit symbols to their ASCII letters, for str.translate
+_SUIT_TABLE = str.maketrans({"♣": "C", "♦": "D", "♥": "H", "♠": "S"})
+
 
 def convert_unicode_suits_to_ascii(card_string: str) -> str:
     """Convert Unicode suit symbols to ASCII notation for markdown compatibility.
@@ -39,22 +45,93 @@ def convert_unicode_suits_to_ascii(card_string: str) -> str:
     Returns:
         String with ASCII suit notation (C, D, H, S)
     """
-    replacements = {
-        "♣": "C",
-        "♦": "D",
-        "♥": "H",
-        "♠": "S"
-    }
-    result = card_string
-    for unicode_suit, ascii_suit in replacements.items():
-        result = result.replace(unicode_suit, ascii_suit)
-    return result
+    return card_string.translate(_SUIT_TABLE)
+
+
+def _hand_table(
+    tier_df: pd.DataFrame, cards_col: str, score_cols: Dict[str, str]
+) -> List[str]:
+    """Format a hand tier as a markdown table.
+
+    Rows are numbered from the tier's index, as in the printed reports. The
+    table is formatted by hand rather than with DataFrame.to_markdown, which
+    needs tabulate and pads cells differently.
+
+    Args:
+        tier_df: Hand tier dataframe (e.g., from analyze_dealt_hands_tiers)
+        cards_col: Column holding the hand's cards
+        score_cols: Header for each whole-number column to show after the
+            average score, by column name
+
+    Returns:
+        Header, separator and one "| rank | cards | avg | ... | count |" line
+        per hand
+    """
+    headers = ["Rank", "Cards", "Avg Score", *score_cols.values(), "Count"]
+    rows = [
+        "| " + " | ".join(headers) + " |",
+        "|" + "|".join("-" * (len(header) + 2) for header in headers) + "|",
+    ]
+
+    cards = tier_df[cards_col].str.translate(_SUIT_TABLE)
+    values = [tier_df[col].to_numpy() for col in ["avg_score", *score_cols, "count"]]
+    for number, hand, avg_score, *whole in zip(tier_df.index + 1, cards, *values):
+        whole_cells = " | ".join(f"{v:.0f}" for v in whole)
+        rows.append(f"| {number} | {hand} | {avg_score:.2f} | {whole_cells} |")
+    return rows
+
+
+def _run_plot(job: Tuple[Callable, pd.DataFrame, Path, Dict[str, Any]]) -> str:
+    """Render one plot in a worker process.
+
+    Args:
+        job: Tuple of (plot function, hand details dataframe, output path,
+            extra keyword arguments)
+
+    Returns:
+        Text the plot function printed, for the parent to echo in order
+    """
+    plot_fn, df, output_path, kwargs = job
+    printed = io.StringIO()
+    with contextlib.redirect_stdout(printed):
+        plot_fn(df, output_path, **kwargs)
+    return printed.getvalue()
+
+
+def _generate_plots(
+    df: pd.DataFrame,
+    jobs: List[Tuple[Callable, Path, Dict[str, Any]]],
+    workers: int = 1,
+) -> None:
+    """Render the report plots, across worker processes when workers > 1.
+
+    Args:
+        df: Hand details dataframe
+        jobs: List of (plot function, output path, extra keyword arguments)
+            tuples
+        workers: Maximum number of plot processes
+    """
+    n_workers = min(workers, len(jobs))
+    if n_workers <= 1:
+        for plot_fn, output_path, kwargs in jobs:
+            plot_fn(df, output_path, **kwargs)
+        return
+
+    # Spawned rather than forked: forking after numba's parallel kernels
+    # have started their thread pool can hang the parent on exit
+    with ProcessPoolExecutor(
+        n_workers, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        plot_jobs = [(plot_fn, df, path, kwargs) for plot_fn, path, kwargs in jobs]
+        for printed in executor.map(_run_plot, plot_jobs):
+            sys.stdout.write(printed)
 
 
 def generate_markdown_report(
     df: pd.DataFrame,
     output_dir: Path,
     summary_df: Optional[pd.DataFrame] = None,
+    plot_workers: int = 1,
 ) -> Path:
     """Generate comprehensive markdown report with plots.
 
@@ -62,6 +139,7 @@ def generate_markdown_report(
         df: Hand details dataframe
         output_dir: Directory to save report and plots
         summary_df: Optional game summary dataframe
+        plot_workers: Maximum number of processes to render plots in
 
     Returns:
         Path to the generated markdown file
@@ -74,26 +152,53 @@ def generate_markdown_report(
     dealer_adv_path = output_dir / "dealer_advantage.png"
     card_values_path = output_dir / "card_values.png"
 
+    # Shared with the score distribution plot, so worker processes don't
+    # recompute them
+    hand_stats, hand_scores = analyze_hand_score_distribution(df)
+    crib_stats, crib_scores = analyze_crib_score_distribution(df)
+    breakdown = summarize_scoring_breakdown(df)
+
     print("Generating plots...")
-    plot_score_distribution(df, score_dist_path)
-    plot_dealer_advantage(df, dealer_adv_path)
-    plot_card_values(df, card_values_path)
+    _generate_plots(
+        df,
+        [
+            (
+                plot_score_distribution,
+                score_dist_path,
+                {
+                    "hand_stats": hand_stats,
+                    "hand_scores": hand_scores,
+                    "crib_stats": crib_stats,
+                    "crib_scores": crib_scores,
+                    "breakdown": breakdown,
+                },
+            ),
+            (plot_dealer_advantage, dealer_adv_path, {}),
+            (plot_card_values, card_values_path, {}),
+        ],
+        plot_workers,
+    )
 
     # Run all analyses
     print("Running analyses...")
-    hand_stats, _ = analyze_hand_score_distribution(df)
-    crib_stats, _ = analyze_crib_score_distribution(df)
-    breakdown = analyze_scoring_breakdown(df)
-    best_dealt = analyze_best_dealt_hands(df, top_n=5)
-    best_kept = analyze_best_kept_hands(df, top_n=5)
-    worst_dealt = analyze_worst_dealt_hands(df, bottom_n=5)
-    worst_kept = analyze_worst_kept_hands(df, bottom_n=5)
-    middle_dealt = analyze_middle_dealt_hands(df, n=5)
-    middle_kept = analyze_middle_kept_hands(df, n=5)
+    dealt_tiers = analyze_dealt_hands_tiers(df, n=5)
+    kept_tiers = analyze_kept_hands_tiers(df, n=5)
+    best_dealt, worst_dealt, middle_dealt = (
+        dealt_tiers["best"],
+        dealt_tiers["worst"],
+        dealt_tiers["middle"],
+    )
+    best_kept, worst_kept, middle_kept = (
+        kept_tiers["best"],
+        kept_tiers["worst"],
+        kept_tiers["middle"],
+    )
     dealer_stats = analyze_dealer_advantage(df, summary_df)
     first_dealer_stats = analyze_first_dealer_impact(df)
     avg_by_card = analyze_average_score_by_card(df)
     five_stats = analyze_five_value(df)
+    n_hands = len(df)
+    n_games = count_games(df)
 
     # Build markdown content
     md_lines = []
@@ -103,8 +208,8 @@ def generate_markdown_report(
         [
             "# Cribbage Simulation Analysis Report",
             "",
-            f"**Total Hands Analyzed:** {len(df):,}",
-            f"**Total Games:** {df['game_number'].nunique():,}",
+            f"**Total Hands Analyzed:** {n_hands:,}",
+            f"**Total Games:** {n_games:,}",
             "",
             "---",
             "",
@@ -136,10 +241,13 @@ def generate_markdown_report(
             f"1. **{top_card['rank']}** - Average hand score of {top_card['avg_score']:.2f} when present",
         ]
     )
-    for idx, row in avg_by_card.iloc[1:3].iterrows():
-        md_lines.append(
-            f"{idx + 1}. **{row['rank']}** - Average hand score of {row['avg_score']:.2f} when present"
+    runners_up = avg_by_card.iloc[1:3]
+    md_lines.extend(
+        f"{idx + 1}. **{rank}** - Average hand score of {avg_score:.2f} when present"
+        for idx, rank, avg_score in zip(
+            runners_up.index, runners_up["rank"], runners_up["avg_score"]
         )
+    )
     md_lines.extend(["", "---", ""])
 
     # Scoring Distribution
@@ -172,10 +280,10 @@ def generate_markdown_report(
             "|----------|------------|-----------|",
         ]
     )
-    for cat in breakdown.keys():
-        avg_pts = breakdown[cat].mean()
-        freq_pct = (breakdown[cat] > 0).sum() / len(breakdown[cat]) * 100
-        md_lines.append(f"| {cat.capitalize()} | {avg_pts:.2f} | {freq_pct:.1f}% |")
+    md_lines.extend(
+        f"| {cat.capitalize()} | {avg_pts:.2f} | {freq_pct:.1f}% |"
+        for cat, avg_pts, freq_pct in breakdown.itertuples(index=False, name=None)
+    )
     md_lines.extend(["", f"![Score Distribution]({score_dist_path.name})", "", "---", ""])
 
     # Dealer Advantage
@@ -226,10 +334,12 @@ def generate_markdown_report(
             "|------|-----------|-------------|",
         ]
     )
-    for _, row in avg_by_card.iterrows():
-        md_lines.append(
-            f"| {row['rank']} | {row['avg_score']:.2f} | {row['count']:.0f} |"
-        )
+    md_lines.extend(
+        f"| {rank} | {avg_score:.2f} | {count:.0f} |"
+        for rank, avg_score, count in avg_by_card[
+            ["rank", "avg_score", "count"]
+        ].itertuples(index=False, name=None)
+    )
 
     md_lines.extend(
         [
@@ -264,28 +374,18 @@ def generate_markdown_report(
             "",
             "### Top 5 Best Dealt Hands (6 cards)",
             "",
-            "| Rank | Cards | Avg Score | Max Score | Count |",
-            "|------|-------|-----------|-----------|-------|",
         ]
     )
-    for idx, row in best_dealt.iterrows():
-        md_lines.append(
-            f"| {idx + 1} | {convert_unicode_suits_to_ascii(row['dealt_cards'])} | {row['avg_score']:.2f} | {row['max_score']:.0f} | {row['count']:.0f} |"
-        )
+    md_lines.extend(_hand_table(best_dealt, "dealt_cards", {"max_score": "Max Score"}))
 
     md_lines.extend(
         [
             "",
             "### Top 5 Best Kept Hands (4 cards)",
             "",
-            "| Rank | Cards | Avg Score | Max Score | Count |",
-            "|------|-------|-----------|-----------|-------|",
         ]
     )
-    for idx, row in best_kept.iterrows():
-        md_lines.append(
-            f"| {idx + 1} | {convert_unicode_suits_to_ascii(row['kept_cards'])} | {row['avg_score']:.2f} | {row['max_score']:.0f} | {row['count']:.0f} |"
-        )
+    md_lines.extend(_hand_table(best_kept, "kept_cards", {"max_score": "Max Score"}))
 
     # Worst Hands
     md_lines.extend(
@@ -293,28 +393,18 @@ def generate_markdown_report(
             "",
             "### Bottom 5 Worst Dealt Hands (6 cards)",
             "",
-            "| Rank | Cards | Avg Score | Min Score | Count |",
-            "|------|-------|-----------|-----------|-------|",
         ]
     )
-    for idx, row in worst_dealt.iterrows():
-        md_lines.append(
-            f"| {idx + 1} | {convert_unicode_suits_to_ascii(row['dealt_cards'])} | {row['avg_score']:.2f} | {row['min_score']:.0f} | {row['count']:.0f} |"
-        )
+    md_lines.extend(_hand_table(worst_dealt, "dealt_cards", {"min_score": "Min Score"}))
 
     md_lines.extend(
         [
             "",
             "### Bottom 5 Worst Kept Hands (4 cards)",
             "",
-            "| Rank | Cards | Avg Score | Min Score | Count |",
-            "|------|-------|-----------|-----------|-------|",
         ]
     )
-    for idx, row in worst_kept.iterrows():
-        md_lines.append(
-            f"| {idx + 1} | {convert_unicode_suits_to_ascii(row['kept_cards'])} | {row['avg_score']:.2f} | {row['min_score']:.0f} | {row['count']:.0f} |"
-        )
+    md_lines.extend(_hand_table(worst_kept, "kept_cards", {"min_score": "Min Score"}))
 
     # Middle-tier Hands
     md_lines.extend(
@@ -322,28 +412,24 @@ def generate_markdown_report(
             "",
             "### Middle 5 Dealt Hands (6 cards)",
             "",
-            "| Rank | Cards | Avg Score | Min | Max | Count |",
-            "|------|-------|-----------|-----|-----|-------|",
         ]
     )
-    for idx, row in middle_dealt.iterrows():
-        md_lines.append(
-            f"| {idx + 1} | {convert_unicode_suits_to_ascii(row['dealt_cards'])} | {row['avg_score']:.2f} | {row['min_score']:.0f} | {row['max_score']:.0f} | {row['count']:.0f} |"
+    md_lines.extend(
+        _hand_table(
+            middle_dealt, "dealt_cards", {"min_score": "Min", "max_score": "Max"}
         )
+    )
 
     md_lines.extend(
         [
             "",
             "### Middle 5 Kept Hands (4 cards)",
             "",
-            "| Rank | Cards | Avg Score | Min | Max | Count |",
-            "|------|-------|-----------|-----|-----|-------|",
         ]
     )
-    for idx, row in middle_kept.iterrows():
-        md_lines.append(
-            f"| {idx + 1} | {convert_unicode_suits_to_ascii(row['kept_cards'])} | {row['avg_score']:.2f} | {row['min_score']:.0f} | {row['max_score']:.0f} | {row['count']:.0f} |"
-        )
+    md_lines.extend(
+        _hand_table(middle_kept, "kept_cards", {"min_score": "Min", "max_score": "Max"})
+    )
 
     md_lines.extend(["", "---", ""])
 
@@ -353,9 +439,9 @@ def generate_markdown_report(
             "## Analysis Details",
             "",
             f"- **Analysis Date:** {pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            f"- **Total Hands:** {len(df):,}",
-            f"- **Total Games:** {df['game_number'].nunique():,}",
-            f"- **Average Hands per Game:** {len(df) / df['game_number'].nunique():.1f}",
+            f"- **Total Hands:** {n_hands:,}",
+            f"- **Total Games:** {n_games:,}",
+            f"- **Average Hands per Game:** {n_hands / n_games:.1f}",
             "",
             "*Generated by Cribbage Simulator Analysis Tool*",
         ]
@@ -363,8 +449,7 @@ def generate_markdown_report(
 
     # Write markdown file
     report_path = output_dir / "analysis_report.md"
-    with open(report_path, "w") as f:
-        f.write("\n".join(md_lines))
+    report_path.write_text("\n".join(md_lines))
 
     print(f"\nMarkdown report generated: {report_path}")
     return report_path
@@ -1,160 +1,353 @@
 """Analyze scoring distributions in cribbage hands."""
 
+import numpy as np
 import pandas as pd
-import matplotlib
-
-matplotlib.use("Agg")  # Non-interactive backend
-import matplotlib.pyplot as plt
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional, Tuple
 
+from src.analysis._count_kernels import score_counts
+from src.analysis._derived_columns import stacked_hand_scores
+from src.analysis._frame_cache import cached_per_frame
 
-def analyze_hand_score_distribution(df: pd.DataFrame) -> Dict[str, any]:
-    """Analyze distribution of hand scores.
+# Hand scoring categories, in report order
+CATEGORIES = ["fifteens", "pairs", "runs", "flush", "nobs"]
+
+# Histogram bins for hand and crib scores
+SCORE_BINS = range(0, 30)
+
+# Separator lines for the printed report
+_SEP80 = "=" * 80
+_DASH80 = "-" * 80
+
+
+def _count_stats(scores: np.ndarray) -> Dict[str, any]:
+    """Compute summary stats of integer scores from one histogram pass.
+
+    Args:
+        scores: Non-negative integer scores
+
+    Returns:
+        Dictionary with mean, median, std (sample), min, max, zero_count,
+        zero_pct and the per-score counts
+    """
+    counts = score_counts(scores, 30)
+    values = np.arange(len(counts))
+    total = len(scores)
+    if total == 0:
+        # No scores: NaN stats, as pandas gives for an empty series
+        return {
+            "mean": np.nan,
+            "median": np.nan,
+            "std": np.nan,
+            "min": np.nan,
+            "max": np.nan,
+            "zero_count": 0,
+            "zero_pct": np.nan,
+            "counts": counts,
+        }
+
+    mean = (counts @ values) / total
+    # Median of the sorted scores, averaging the middle pair when total is even
+    cum_counts = counts.cumsum()
+    lower = np.searchsorted(cum_counts, (total - 1) // 2, side="right")
+    upper = np.searchsorted(cum_counts, total // 2, side="right")
+    present = np.flatnonzero(counts)
+    # A single score has no sample std (NaN, as in pandas)
+    with np.errstate(invalid="ignore"):
+        std = np.sqrt((counts @ (values - mean) ** 2) / (total - 1))
+
+    return {
+        "mean": mean,
+        "median": (lower + upper) / 2,
+        "std": std,
+        "min": present[0],
+        "max": present[-1],
+        "zero_count": counts[0],
+        "zero_pct": counts[0] / total * 100,
+        "counts": counts,
+    }
+
+
+def _hand_score_distribution(df: pd.DataFrame) -> Tuple[Dict[str, any], np.ndarray]:
+    """Compute hand score distribution stats from both players' hands.
 
     Args:
         df: Hand details dataframe
 
     Returns:
-        Dictionary with distribution statistics
+        Tuple of (distribution statistics, all hand scores)
     """
     # Combine all hand scores (excluding cribs)
-    all_hand_scores = pd.concat([df["p1_hand_score"], df["p2_hand_score"]])
-
-    stats = {
-        "mean": all_hand_scores.mean(),
-        "median": all_hand_scores.median(),
-        "std": all_hand_scores.std(),
-        "min": all_hand_scores.min(),
-        "max": all_hand_scores.max(),
-        "zero_count": (all_hand_scores == 0).sum(),
-        "zero_pct": (all_hand_scores == 0).sum() / len(all_hand_scores) * 100,
-        "perfect_29_count": (all_hand_scores == 29).sum(),
-        "perfect_29_pct": (all_hand_scores == 29).sum() / len(all_hand_scores) * 100,
-    }
+    all_hand_scores = stacked_hand_scores(df)
+
+    stats = _count_stats(all_hand_scores)
+    counts = stats.pop("counts")
+    stats["perfect_29_count"] = counts[29]
+    total = len(all_hand_scores)
+    stats["perfect_29_pct"] = counts[29] / total * 100 if total else np.nan
 
     return stats, all_hand_scores
 
 
-def analyze_crib_score_distribution(df: pd.DataFrame) -> Dict[str, any]:
-    """Analyze distribution of crib scores.
+def _crib_score_distribution(df: pd.DataFrame) -> Tuple[Dict[str, any], np.ndarray]:
+    """Compute crib score distribution stats.
 
     Args:
         df: Hand details dataframe
 
     Returns:
-        Dictionary with distribution statistics
+        Tuple of (distribution statistics, crib scores)
     """
-    crib_scores = df["crib_score"]
-
-    stats = {
-        "mean": crib_scores.mean(),
-        "median": crib_scores.median(),
-        "std": crib_scores.std(),
-        "min": crib_scores.min(),
-        "max": crib_scores.max(),
-        "zero_count": (crib_scores == 0).sum(),
-        "zero_pct": (crib_scores == 0).sum() / len(crib_scores) * 100,
-    }
+    crib_scores = df["crib_score"].to_numpy()
+
+    stats = _count_stats(crib_scores)
+    del stats["counts"]
 
     return stats, crib_scores
 
 
-def analyze_scoring_breakdown(df: pd.DataFrame) -> Dict[str, pd.Series]:
-    """Analyze contribution of each scoring category.
+def _breakdown_points(df: pd.DataFrame) -> np.ndarray:
+    """Combine both players' points for each scoring category.
 
     Args:
         df: Hand details dataframe
 
     Returns:
-        Dictionary of Series for each scoring category
+        Array of shape (len(CATEGORIES), 2 * len(df)) with one row per
+        category: Player 1's hands, then Player 2's
     """
-    # Combine both players' scoring breakdowns
-    all_fifteens = pd.concat([df["p1_hand_fifteens"], df["p2_hand_fifteens"]])
-    all_pairs = pd.concat([df["p1_hand_pairs"], df["p2_hand_pairs"]])
-    all_runs = pd.concat([df["p1_hand_runs"], df["p2_hand_runs"]])
-    all_flush = pd.concat([df["p1_hand_flush"], df["p2_hand_flush"]])
-    all_nobs = pd.concat([df["p1_hand_nobs"], df["p2_hand_nobs"]])
-
-    breakdown = {
-        "fifteens": all_fifteens,
-        "pairs": all_pairs,
-        "runs": all_runs,
-        "flush": all_flush,
-        "nobs": all_nobs,
-    }
+    return np.concatenate(
+        (
+            df[[f"p1_hand_{cat}" for cat in CATEGORIES]].to_numpy().T,
+            df[[f"p2_hand_{cat}" for cat in CATEGORIES]].to_numpy().T,
+        ),
+        axis=1,
+    )
 
-    return breakdown
 
+def _breakdown_summary(df: pd.DataFrame) -> pd.DataFrame:
+    """Reduce every scoring category at once to its average and frequency.
 
-def plot_score_distribution(df: pd.DataFrame, output_path: Path = None) -> None:
-    """Create visualization of score distributions.
+    Args:
+        df: Hand details dataframe
+
+    Returns:
+        DataFrame with category, avg_points and freq_pct columns
+    """
+    points = cached_per_frame("breakdown_points", df, _breakdown_points)
+    if points.shape[1] == 0:
+        # No hands: NaN averages, as pandas gives for an empty series
+        empty = np.full(len(CATEGORIES), np.nan)
+        return pd.DataFrame(
+            {"category": CATEGORIES, "avg_points": empty, "freq_pct": empty}
+        )
+    return pd.DataFrame(
+        {
+            "category": CATEGORIES,
+            "avg_points": points.mean(axis=1),
+            "freq_pct": (points > 0).mean(axis=1) * 100,
+        }
+    )
+
+
+def analyze_hand_score_distribution(
+    df: pd.DataFrame,
+) -> Tuple[Dict[str, any], np.ndarray]:
+    """Analyze distribution of hand scores.
+
+    The stats are computed once per dataframe and shared by the report and
+    the plot.
 
     Args:
         df: Hand details dataframe
-        output_path: Optional path to save plot
+
+    Returns:
+        Tuple of (distribution statistics, all hand scores)
     """
-    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+    stats, all_hand_scores = cached_per_frame(
+        "hand_score_distribution", df, _hand_score_distribution
+    )
+    return dict(stats), all_hand_scores
 
-    # Hand score distribution
-    hand_stats, hand_scores = analyze_hand_score_distribution(df)
-    axes[0, 0].hist(hand_scores, bins=range(0, 30), alpha=0.7, edgecolor="black")
+
+def analyze_crib_score_distribution(
+    df: pd.DataFrame,
+) -> Tuple[Dict[str, any], np.ndarray]:
+    """Analyze distribution of crib scores.
+
+    The stats are computed once per dataframe and shared by the report and
+    the plot.
+
+    Args:
+        df: Hand details dataframe
+
+    Returns:
+        Tuple of (distribution statistics, crib scores)
+    """
+    stats, crib_scores = cached_per_frame(
+        "crib_score_distribution", df, _crib_score_distribution
+    )
+    return dict(stats), crib_scores
+
+
+def analyze_scoring_breakdown(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """Analyze contribution of each scoring category.
+
+    The combined category scores are built once per dataframe and shared by
+    the report and the plot.
+
+    Args:
+        df: Hand details dataframe
+
+    Returns:
+        Dictionary of point arrays for each scoring category
+    """
+    points = cached_per_frame("breakdown_points", df, _breakdown_points)
+    return dict(zip(CATEGORIES, points))
+
+
+def summarize_scoring_breakdown(df: pd.DataFrame) -> pd.DataFrame:
+    """Summarize each scoring category's average points and frequency.
+
+    Args:
+        df: Hand details dataframe
+
+    Returns:
+        DataFrame with category, avg_points (per hand) and freq_pct (% of
+        hands scoring any points in the category) columns, in report order
+    """
+    return cached_per_frame("breakdown_summary", df, _breakdown_summary).copy()
+
+
+def _draw_score_distribution_skeleton(axes, bars: Dict) -> None:
+    """Draw the static parts of the score distribution figure with empty bars.
+
+    Args:
+        axes: 2x2 axes array of a new figure
+        bars: Dict to store the bar containers in, by panel
+    """
+    _, _, bars["hand"] = axes[0, 0].hist(
+        [], bins=SCORE_BINS, alpha=0.7, edgecolor="black"
+    )
     axes[0, 0].set_xlabel("Hand Score")
     axes[0, 0].set_ylabel("Frequency")
-    axes[0, 0].set_title(
-        f"Hand Score Distribution\n(Mean: {hand_stats['mean']:.2f}, Median: {hand_stats['median']:.1f})"
-    )
     axes[0, 0].grid(True, alpha=0.3)
 
-    # Crib score distribution
-    crib_stats, crib_scores = analyze_crib_score_distribution(df)
-    axes[0, 1].hist(
-        crib_scores, bins=range(0, 30), alpha=0.7, color="green", edgecolor="black"
+    _, _, bars["crib"] = axes[0, 1].hist(
+        [], bins=SCORE_BINS, alpha=0.7, color="green", edgecolor="black"
     )
     axes[0, 1].set_xlabel("Crib Score")
     axes[0, 1].set_ylabel("Frequency")
-    axes[0, 1].set_title(
-        f"Crib Score Distribution\n(Mean: {crib_stats['mean']:.2f}, Median: {crib_stats['median']:.1f})"
-    )
     axes[0, 1].grid(True, alpha=0.3)
 
-    # Scoring breakdown contributions
-    breakdown = analyze_scoring_breakdown(df)
-    categories = list(breakdown.keys())
-    avg_contributions = [breakdown[cat].mean() for cat in categories]
-
-    axes[1, 0].bar(
-        categories, avg_contributions, alpha=0.7, color="purple", edgecolor="black"
+    n_categories = len(CATEGORIES)
+    bars["avg"] = axes[1, 0].bar(
+        range(n_categories),
+        np.zeros(n_categories),
+        alpha=0.7,
+        color="purple",
+        edgecolor="black",
     )
     axes[1, 0].set_xlabel("Scoring Category")
     axes[1, 0].set_ylabel("Average Points Per Hand")
     axes[1, 0].set_title("Average Contribution by Scoring Category")
     axes[1, 0].grid(True, alpha=0.3, axis="y")
 
-    # Scoring breakdown frequency (% of hands with points from each category)
-    freq_contributions = [
-        (breakdown[cat] > 0).sum() / len(breakdown[cat]) * 100 for cat in categories
-    ]
-
-    axes[1, 1].bar(
-        categories, freq_contributions, alpha=0.7, color="orange", edgecolor="black"
+    bars["freq"] = axes[1, 1].bar(
+        range(n_categories),
+        np.zeros(n_categories),
+        alpha=0.7,
+        color="orange",
+        edgecolor="black",
     )
     axes[1, 1].set_xlabel("Scoring Category")
     axes[1, 1].set_ylabel("% of Hands")
     axes[1, 1].set_title("Frequency of Points from Each Category")
     axes[1, 1].grid(True, alpha=0.3, axis="y")
 
-    plt.tight_layout()
+
+def _update_histogram(ax, patches, scores: np.ndarray) -> None:
+    """Set histogram bar heights to the scores' counts and rescale the y axis.
+
+    Args:
+        ax: Axes holding the histogram
+        patches: Histogram bars drawn over SCORE_BINS
+        scores: Scores to count
+    """
+    counts, _ = np.histogram(scores, bins=SCORE_BINS)
+    for patch, count in zip(patches, counts):
+        patch.set_height(count)
+    ax.relim()
+    ax.autoscale_view()
+
+
+def plot_score_distribution(
+    df: pd.DataFrame,
+    output_path: Path = None,
+    *,
+    hand_stats: Optional[Dict[str, any]] = None,
+    hand_scores: Optional[np.ndarray] = None,
+    crib_stats: Optional[Dict[str, any]] = None,
+    crib_scores: Optional[np.ndarray] = None,
+    breakdown: Optional[pd.DataFrame] = None,
+) -> None:
+    """Create visualization of score distributions.
+
+    Precomputed analyses can be passed in; only the missing ones are computed
+    from df. The figure and its bars are built on the first call and reused
+    by later calls, which only update heights and titles.
+
+    Args:
+        df: Hand details dataframe
+        output_path: Optional path to save plot
+        hand_stats: Hand score statistics from analyze_hand_score_distribution
+        hand_scores: All hand scores from analyze_hand_score_distribution
+        crib_stats: Crib score statistics from analyze_crib_score_distribution
+        crib_scores: Crib scores from analyze_crib_score_distribution
+        breakdown: Category summary from summarize_scoring_breakdown
+    """
+    # Imported here so report-only runs don't load matplotlib
+    from src.analysis._plot_cache import reusable_figure, update_bars
+
+    if hand_stats is None or hand_scores is None:
+        hand_stats, hand_scores = analyze_hand_score_distribution(df)
+    if crib_stats is None or crib_scores is None:
+        crib_stats, crib_scores = analyze_crib_score_distribution(df)
+    if breakdown is None:
+        breakdown = summarize_scoring_breakdown(df)
+
+    fig, axes, bars, reused = reusable_figure("score_distribution", (14, 10), None)
+    if not reused:
+        _draw_score_distribution_skeleton(axes, bars)
+
+    # Hand score distribution
+    _update_histogram(axes[0, 0], bars["hand"], hand_scores)
+    axes[0, 0].set_title(
+        f"Hand Score Distribution\n(Mean: {hand_stats['mean']:.2f}, Median: {hand_stats['median']:.1f})"
+    )
+
+    # Crib score distribution
+    _update_histogram(axes[0, 1], bars["crib"], crib_scores)
+    axes[0, 1].set_title(
+        f"Crib Score Distribution\n(Mean: {crib_stats['mean']:.2f}, Median: {crib_stats['median']:.1f})"
+    )
+
+    # Scoring breakdown contributions
+    categories = breakdown["category"].tolist()
+    update_bars(axes[1, 0], bars["avg"], categories, breakdown["avg_points"])
+
+    # Scoring breakdown frequency (% of hands with points from each category)
+    update_bars(axes[1, 1], bars["freq"], categories, breakdown["freq_pct"])
+
+    fig.tight_layout()
 
     if output_path:
-        plt.savefig(output_path, dpi=150, bbox_inches="tight")
+        fig.savefig(output_path, dpi=150)
         print(f"Plot saved to: {output_path}")
     else:
-        plt.savefig("score_distribution.png", dpi=150, bbox_inches="tight")
+        fig.savefig("score_distribution.png", dpi=150)
         print("Plot saved to: score_distribution.png")
 
-    plt.close()
-
 
 def print_scoring_distribution_report(df: pd.DataFrame) -> None:
     """Print formatted scoring distribution report.
@@ -162,14 +355,14 @@ def print_scoring_distribution_report(df: pd.DataFrame) -> None:
     Args:
         df: Hand details dataframe
     """
-    print("\n" + "=" * 80)
+    print("\n" + _SEP80)
     print("SCORING DISTRIBUTION ANALYSIS")
-    print("=" * 80)
+    print(_SEP80)
 
     # Hand scores
     hand_stats, _ = analyze_hand_score_distribution(df)
     print("\nHand Score Statistics:")
-    print("-" * 80)
+    print(_DASH80)
     print(f"Mean:                {hand_stats['mean']:6.2f}")
     print(f"Median:              {hand_stats['median']:6.1f}")
     print(f"Std Dev:             {hand_stats['std']:6.2f}")
@@ -185,7 +378,7 @@ def print_scoring_distribution_report(df: pd.DataFrame) -> None:
     # Crib scores
     crib_stats, _ = analyze_crib_score_distribution(df)
     print("\nCrib Score Statistics:")
-    print("-" * 80)
+    print(_DASH80)
     print(f"Mean:                {crib_stats['mean']:6.2f}")
     print(f"Median:              {crib_stats['median']:6.1f}")
     print(f"Std Dev:             {crib_stats['std']:6.2f}")
@@ -196,14 +389,12 @@ def print_scoring_distribution_report(df: pd.DataFrame) -> None:
     )
 
     # Scoring breakdown
-    breakdown = analyze_scoring_breakdown(df)
+    summary = summarize_scoring_breakdown(df)
     print("\nScoring Category Breakdown:")
-    print("-" * 80)
+    print(_DASH80)
     print(f"{'Category':<15} {'Avg Points':>12} {'Frequency':>12}")
-    print("-" * 80)
-    for cat in breakdown.keys():
-        avg_pts = breakdown[cat].mean()
-        freq_pct = (breakdown[cat] > 0).sum() / len(breakdown[cat]) * 100
+    print(_DASH80)
+    for cat, avg_pts, freq_pct in summary.itertuples(index=False, name=None):
         print(f"{cat.capitalize():<15} {avg_pts:>12.2f} {freq_pct:>11.1f}%")
 
-    print("\n" + "=" * 80)
+    print("\n" + _SEP80)
@@ -7,9 +7,16 @@ class Card:
     In cribbage, face cards (J, Q, K) count as 10, and Aces count as 1.
     """
 
+    __slots__ = ("rank", "suit", "value", "rank_value", "suit_idx", "card_id")
+
     RANKS = ["A", "2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K"]
     SUITS = ["♠", "♥", "♦", "♣"]
 
+    # Lookup tables by rank: counting value (A=1, J/Q/K=10) and rank order
+    VALUES = {rank: min(i + 1, 10) for i, rank in enumerate(RANKS)}
+    RANK_VALUES = {rank: i + 1 for i, rank in enumerate(RANKS)}
+    SUIT_CODES = {suit: i for i, suit in enumerate(SUITS)}
+
     def __init__(self, rank: str, suit: str):
         """Initialize a card with rank and suit.
 
@@ -20,36 +27,22 @@ class Card:
         Raises:
             ValueError: If rank or suit is invalid
         """
-        if rank not in self.RANKS:
+        if rank not in self.RANK_VALUES:
             raise ValueError(f"Invalid rank: {rank}. Must be one of {self.RANKS}")
         if suit not in self.SUITS:
             raise ValueError(f"Invalid suit: {suit}. Must be one of {self.SUITS}")
 
         self.rank = rank
         self.suit = suit
-
-    @property
-    def value(self) -> int:
-        """Get the numerical value of the card for counting to 31.
-
-        Returns:
-            int: Card value (Ace=1, 2-10=face value, J/Q/K=10)
-        """
-        if self.rank == "A":
-            return 1
-        elif self.rank in ["J", "Q", "K"]:
-            return 10
-        else:
-            return int(self.rank)
-
-    @property
-    def rank_value(self) -> int:
-        """Get the rank value for scoring purposes (A=1, 2=2, ..., K=13).
-
-        Returns:
-            int: Rank value from 1-13
-        """
-        return self.RANKS.index(self.rank) + 1
+        # Value for counting to 31 (Ace=1, 2-10=face value, J/Q/K=10)
+        self.value = self.VALUES[rank]
+        # Rank value for scoring runs (A=1, 2=2, ..., K=13)
+        self.rank_value = self.RANK_VALUES[rank]
+        # Suit as an int (0-3), for suit comparisons in scoring
+        self.suit_idx = self.SUIT_CODES[suit]
+        # Unique id 0-51 (suit-major; the card's index in CARDS), used for
+        # hashing and equality
+        self.card_id = self.suit_idx * 13 + self.rank_value - 1
 
     def __str__(self) -> str:
         """String representation of the card."""
@@ -63,8 +56,13 @@ class Card:
         """Check if two cards are equal (same rank and suit)."""
         if not isinstance(other, Card):
             return False
-        return self.rank == other.rank and self.suit == other.suit
+        return self.card_id == other.card_id
 
     def __hash__(self) -> int:
         """Make cards hashable for use in sets and dicts."""
-        return hash((self.rank, self.suit))
+        return self.card_id
+
+
+# The 52 cards, built once at import and indexed by card_id. Card objects are
+# never modified, so decks and hands share these instead of creating their own
+CARDS = tuple(Card(rank, suit) for suit in Card.SUITS for rank in Card.RANKS)
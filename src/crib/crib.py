@@ -33,7 +33,7 @@ class Crib:
 
     def clear(self) -> None:
         """Remove all cards from the crib."""
-        self.cards = []
+        self.cards.clear()
 
     def size(self) -> int:
         """Get the number of cards in the crib.
@@ -54,10 +54,13 @@ class Crib:
     def get_cards(self) -> List[Card]:
         """Get all cards in the crib.
 
+        Returns the crib's own list rather than a copy, so callers must not
+        modify it or keep it past the current hand (clear() empties it).
+
         Returns:
             List of Card objects
         """
-        return self.cards.copy()
+        return self.cards
 
     def __len__(self) -> int:
         """Return the number of cards in the crib."""
@@ -2,40 +2,45 @@
 
 import numpy as np
 from typing import List, Optional
-from src.card.card import Card
+from src.card.card import CARDS, Card
 
 
 class Deck:
     """Represents a standard 52-card deck for cribbage.
 
-    Handles shuffling and dealing cards with support for numpy random states
-    for reproducibility.
+    Handles shuffling and dealing cards with support for numpy random
+    generators for reproducibility.
     """
 
-    def __init__(self, random_state: Optional[np.random.RandomState] = None):
+    def __init__(self, rng: Optional[np.random.Generator] = None):
         """Initialize a standard 52-card deck.
 
         Args:
-            random_state: Optional numpy RandomState for reproducible shuffling
+            rng: Optional numpy Generator for reproducible shuffling
         """
-        self.random_state = (
-            random_state if random_state is not None else np.random.RandomState()
-        )
+        self.rng = rng if rng is not None else np.random.default_rng()
         self.cards: List[Card] = []
         self.dealt_cards: List[Card] = []
+        # Index of the next card to deal; cards before it have been dealt
+        self.pos = 0
         self._create_deck()
 
     def _create_deck(self) -> None:
         """Create a fresh 52-card deck."""
-        self.cards = []
-        for suit in Card.SUITS:
-            for rank in Card.RANKS:
-                self.cards.append(Card(rank, suit))
-        self.dealt_cards = []
+        # Refill the existing lists in place to reuse their storage
+        self.cards[:] = CARDS
+        self.dealt_cards.clear()
+        self.pos = 0
 
     def shuffle(self) -> None:
-        """Shuffle the deck using the random state."""
-        self.random_state.shuffle(self.cards)
+        """Shuffle the remaining cards using the random generator."""
+        if self.pos:
+            # Drop the dealt cards so only the undealt ones are shuffled
+            del self.cards[: self.pos]
+            self.pos = 0
+        # Shuffling the Card list itself measures faster than permuting an
+        # index array and looking cards up on deal
+        self.rng.shuffle(self.cards)
 
     def deal(self, n: int = 1) -> List[Card]:
         """Deal n cards from the top of the deck.
@@ -49,13 +54,12 @@ class Deck:
         Raises:
             ValueError: If not enough cards remain in deck
         """
-        if n > len(self.cards):
-            raise ValueError(
-                f"Cannot deal {n} cards. Only {len(self.cards)} cards remain."
-            )
+        remaining = len(self.cards) - self.pos
+        if n > remaining:
+            raise ValueError(f"Cannot deal {n} cards. Only {remaining} cards remain.")
 
-        dealt = self.cards[:n]
-        self.cards = self.cards[n:]
+        dealt = self.cards[self.pos : self.pos + n]
+        self.pos += n
         self.dealt_cards.extend(dealt)
         return dealt
 
@@ -80,12 +84,12 @@ class Deck:
         Returns:
             int: Number of undealt cards
         """
-        return len(self.cards)
+        return len(self.cards) - self.pos
 
     def __len__(self) -> int:
         """Return the number of cards remaining in the deck."""
-        return len(self.cards)
+        return len(self.cards) - self.pos
 
     def __repr__(self) -> str:
         """Developer representation of the deck."""
-        return f"Deck({len(self.cards)} cards remaining)"
+        return f"Deck({len(self)} cards remaining)"
@@ -6,8 +6,12 @@ from src.card.card import Card
 from src.deck.deck import Deck
 from src.player.player import Player
 from src.crib.crib import Crib
-from src.score.scorer import Scorer
+from src.score.scorer import HandBreakdown, Scorer
 from src.rules.rules import Rules
+from src.utils.hand_details_exporter import HandDetailsExporter
+
+# Banner line around games and hands in the log
+_SEPARATOR = "=" * 60
 
 
 class Game:
@@ -26,7 +30,7 @@ class Game:
         self,
         player1_name: str = "Player 1",
         player2_name: str = "Player 2",
-        random_state: Optional[np.random.RandomState] = None,
+        rng: Optional[np.random.Generator] = None,
         verbosity: int = 1,
         debug: bool = False,
         log_file: Optional[str] = None,
@@ -37,31 +41,31 @@ class Game:
         Args:
             player1_name: Name for player 1
             player2_name: Name for player 2
-            random_state: Optional numpy RandomState for reproducibility
+            rng: Optional numpy Generator for reproducibility
             verbosity: Verbosity level (0=silent, 1=normal, 2=detailed)
             debug: Whether to enable debug logging
             log_file: Optional path to log file for writing game logs
             hand_details_exporter: Optional HandDetailsExporter for hand-level CSV tracking
         """
-        self.random_state = (
-            random_state if random_state is not None else np.random.RandomState()
-        )
+        self.rng = rng if rng is not None else np.random.default_rng()
         self.verbosity = verbosity
         self.debug = debug
         self.log_file = log_file
+        # Log file handle, opened on the first logged message
+        self._log_fh = None
         self.hand_details_exporter = hand_details_exporter
 
         # Initialize players
         self.players = [
-            Player(player1_name, self.random_state),
-            Player(player2_name, self.random_state),
+            Player(player1_name, self.rng),
+            Player(player2_name, self.rng),
         ]
 
         # Game state
-        self.deck = Deck(self.random_state)
+        self.deck = Deck(self.rng)
         self.crib = Crib()
         self.starter: Optional[Card] = None
-        self.dealer_idx = self.random_state.choice([0, 1])  # Random first dealer
+        self.dealer_idx = self.rng.integers(2)  # Random first dealer
         self.hand_number = 0
         self.winner: Optional[Player] = None
         self.game_number = 0  # Set by caller for tracking
@@ -75,7 +79,8 @@ class Game:
         self.his_heels = False
 
         self._log(
-            f"Game initialized. {self.players[self.dealer_idx].name} deals first.",
+            "Game initialized. %s deals first.",
+            self.players[self.dealer_idx].name,
             level=1,
         )
 
@@ -85,29 +90,35 @@ class Game:
         Returns:
             The winning player
         """
-        self._log("=" * 60, level=1)
-        self._log("STARTING NEW GAME", level=1)
-        self._log("=" * 60, level=1)
+        try:
+            self._log(_SEPARATOR, level=1)
+            self._log("STARTING NEW GAME", level=1)
+            self._log(_SEPARATOR, level=1)
 
-        while not self.winner:
-            self.play_hand()
+            while not self.winner:
+                self.play_hand()
 
-        self._log("=" * 60, level=1)
-        self._log(
-            f"GAME OVER! {self.winner.name} wins with {self.winner.score} points!",
-            level=1,
-        )
-        self._log("=" * 60, level=1)
+            self._log(_SEPARATOR, level=1)
+            self._log(
+                "GAME OVER! %s wins with %s points!",
+                self.winner.name,
+                self.winner.score,
+                level=1,
+            )
+            self._log(_SEPARATOR, level=1)
+        finally:
+            # Flush the game's log lines before the caller writes more
+            self.close_log()
 
         return self.winner
 
     def play_hand(self) -> None:
         """Play a complete hand (deal, discard, play, count)."""
         self.hand_number += 1
-        self._log(f"\n{'=' * 60}", level=1)
-        self._log(f"HAND {self.hand_number}", level=1)
-        self._log(f"Dealer: {self.players[self.dealer_idx].name}", level=1)
-        self._log(f"{'=' * 60}", level=1)
+        self._log("\n" + _SEPARATOR, level=1)
+        self._log("HAND %s", self.hand_number, level=1)
+        self._log("Dealer: %s", self.players[self.dealer_idx].name, level=1)
+        self._log(_SEPARATOR, level=1)
 
         # Reset hand state
         self._reset_hand()
@@ -143,9 +154,9 @@ class Game:
         for player in self.players:
             player.clear_hand()
 
-        # Reset hand tracking
-        self.dealt_cards = [[], []]
-        self.discarded_cards = [[], []]
+        # Reset hand tracking, emptying the lists in place
+        for cards in (*self.dealt_cards, *self.discarded_cards):
+            cards.clear()
         self.his_heels = False
 
         self._log("Deck shuffled and ready.", level=2)
@@ -158,9 +169,9 @@ class Game:
                 player.add_cards_to_hand([card])
                 self.dealt_cards[idx].append(card)
 
-        self._log(f"Dealt {Rules.INITIAL_HAND_SIZE} cards to each player.", level=2)
+        self._log("Dealt %s cards to each player.", Rules.INITIAL_HAND_SIZE, level=2)
         for player in self.players:
-            self._log(f"{player.name} hand: {player.hand}", level=2, debug_only=True)
+            self._log("%s hand: %s", player.name, player.hand, level=2, debug_only=True)
 
     def _discard_phase(self) -> None:
         """Each player discards 2 cards to the crib."""
@@ -174,21 +185,22 @@ class Game:
             player.discard_to_crib(discards)
             self.crib.add_cards(discards)
 
-            # Track discards
-            self.discarded_cards[idx] = discards
+            # Track discards in the list reused across hands
+            self.discarded_cards[idx].extend(discards)
 
-            self._log(
-                f"{player.name} discarded: {', '.join(str(c) for c in discards)}",
-                level=2,
-                debug_only=True,
-            )
+            if self._logging(level=2, debug_only=True):
+                self._log(
+                    f"{player.name} discarded: {', '.join(str(c) for c in discards)}",
+                    level=2,
+                    debug_only=True,
+                )
 
-        self._log(f"Crib: {self.crib}", level=2, debug_only=True)
+        self._log("Crib: %s", self.crib, level=2, debug_only=True)
 
     def _cut_starter(self) -> None:
         """Cut the deck for the starter card."""
         self.starter = self.deck.deal_one()
-        self._log(f"Starter card: {self.starter}", level=2)
+        self._log("Starter card: %s", self.starter, level=2)
 
         # Check for his heels (Jack as starter)
         self.his_heels = Rules.check_his_heels(self.starter)
@@ -196,7 +208,10 @@ class Game:
             dealer = self.players[self.dealer_idx]
             dealer.add_score(2, from_play=True)
             self._log(
-                f"His heels! {dealer.name} scores 2 points. ({dealer.name}: {dealer.score})",
+                "His heels! %s scores 2 points. (%s: %s)",
+                dealer.name,
+                dealer.name,
+                dealer.score,
                 level=1,
             )
 
@@ -207,52 +222,70 @@ class Game:
         """Execute the play phase (pegging to 31)."""
         self._log("\nPlay phase (pegging)...", level=2)
 
-        non_dealer_idx = 1 - self.dealer_idx
+        # Bound once: the loop below runs for every card played
+        players = self.players
+        player0, player1 = players
+        dealer_idx = self.dealer_idx
+        non_dealer_idx = 1 - dealer_idx
+        non_dealer = players[non_dealer_idx]
+        max_count = Rules.MAX_PLAY_COUNT
+        is_game_won = Rules.is_game_won
+        score_play_ranks = Scorer.score_play_ranks
+
         current_player_idx = non_dealer_idx  # Non-dealer plays first
 
-        cards_played: List[Tuple[int, Card]] = []  # (player_idx, card)
+        # Rank values of the cards played since the last reset (the key of
+        # Scorer's play-score cache), and who played the latest one
+        ranks_played: Tuple[int, ...] = ()
+        last_player_idx = current_player_idx
         current_count = 0
         consecutive_go_count = 0
 
-        while any(player.has_cards() for player in self.players):
-            player = self.players[current_player_idx]
+        while player0.has_cards() or player1.has_cards():
+            player = players[current_player_idx]
 
             # Try to play a card
             card = player.choose_play_card(current_count)
 
             if card is None:
                 # Player says "Go"
-                self._log(f"{player.name} says Go.", level=2)
+                self._log("%s says Go.", player.name, level=2)
                 consecutive_go_count += 1
 
                 # If both players say go, award go points
                 if consecutive_go_count == 2:
                     # Last player to play gets the go
-                    if cards_played:
-                        last_player_idx, _ = cards_played[-1]
-                        last_player = self.players[last_player_idx]
-                        go_points = Rules.get_go_points(True, current_count)
+                    if ranks_played:
+                        last_player = players[last_player_idx]
+                        # Rules.get_go_points for the last player to play
+                        is_31 = current_count == max_count
+                        go_points = 2 if is_31 else 1
                         last_player.add_score(go_points, from_play=True)
-                        reason = "31 for 2" if current_count == 31 else "Go for 1"
+                        reason = "31 for 2" if is_31 else "Go for 1"
                         self._log(
-                            f"{last_player.name} scores {go_points} ({reason}). ({last_player.name}: {last_player.score})",
+                            "%s scores %s (%s). (%s: %s)",
+                            last_player.name,
+                            go_points,
+                            reason,
+                            last_player.name,
+                            last_player.score,
                             level=1,
                         )
 
-                        if Rules.is_game_won(last_player.score):
+                        if is_game_won(last_player.score):
                             self.winner = last_player
                             return
 
                     # Reset for next round
-                    cards_played = []
+                    ranks_played = ()
                     current_count = 0
                     consecutive_go_count = 0
 
                     # Next player starts (non-dealer if both still have cards)
-                    if self.players[non_dealer_idx].has_cards():
+                    if non_dealer.has_cards():
                         current_player_idx = non_dealer_idx
                     else:
-                        current_player_idx = self.dealer_idx
+                        current_player_idx = dealer_idx
 
                 else:
                     # Move to next player
@@ -262,38 +295,43 @@ class Game:
                 # Play the card
                 player.play_card(card)
                 current_count += card.value
-                cards_played.append((current_player_idx, card))
+                ranks_played += (card.rank_value,)
+                last_player_idx = current_player_idx
                 consecutive_go_count = 0
 
                 self._log(
-                    f"{player.name} plays {card} (count: {current_count})", level=2
+                    "%s plays %s (count: %s)",
+                    player.name,
+                    card,
+                    current_count,
+                    level=2,
                 )
 
                 # Score the play
-                cards_in_play = [c for _, c in cards_played]
-                points, reasons = Scorer.score_play(cards_in_play, current_player_idx)
+                points, reasons = score_play_ranks(ranks_played)
 
                 if points > 0:
                     player.add_score(points, from_play=True)
-                    reason_str = ", ".join(reasons)
-                    self._log(
-                        f"{player.name} scores {points} ({reason_str}). ({player.name}: {player.score})",
-                        level=1,
-                    )
+                    if self._logging(level=1):
+                        reason_str = ", ".join(reasons)
+                        self._log(
+                            f"{player.name} scores {points} ({reason_str}). ({player.name}: {player.score})",
+                            level=1,
+                        )
 
-                    if Rules.is_game_won(player.score):
+                    if is_game_won(player.score):
                         self.winner = player
                         return
 
                 # If count is 31, reset
-                if current_count == 31:
-                    cards_played = []
+                if current_count == max_count:
+                    ranks_played = ()
                     current_count = 0
                     # Next player starts
-                    if self.players[non_dealer_idx].has_cards():
+                    if non_dealer.has_cards():
                         current_player_idx = non_dealer_idx
                     else:
-                        current_player_idx = self.dealer_idx
+                        current_player_idx = dealer_idx
                 else:
                     # Move to next player
                     current_player_idx = 1 - current_player_idx
@@ -342,11 +380,12 @@ class Game:
             return
 
         # Dealer counts crib
+        crib_cards = self.crib.get_cards()
         crib_score, crib_breakdown = Scorer.score_hand(
-            self.crib.get_cards(), self.starter, is_crib=True
+            crib_cards, self.starter, is_crib=True
         )
         self._log_and_score_hand(
-            dealer, self.crib.get_cards(), crib_score, crib_breakdown, is_crib=True
+            dealer, crib_cards, crib_score, crib_breakdown, is_crib=True
         )
 
         # Export hand details if exporter configured
@@ -372,7 +411,7 @@ class Game:
         player: Player,
         cards: List[Card],
         points: int,
-        breakdown: Dict[str, int],
+        breakdown: HandBreakdown,
         is_crib: bool = False,
     ) -> None:
         """Log and score a hand or crib.
@@ -385,20 +424,25 @@ class Game:
             is_crib: Whether this is the crib
         """
         hand_type = "crib" if is_crib else "hand"
-        self._log(
-            f"\n{player.name}'s {hand_type}: {', '.join(str(c) for c in cards)}",
-            level=1,
-        )
-        self._log(f"Starter: {self.starter}", level=1)
+        if self._logging(level=1):
+            self._log(
+                f"\n{player.name}'s {hand_type}: {', '.join(str(c) for c in cards)}",
+                level=1,
+            )
+        self._log("Starter: %s", self.starter, level=1)
 
-        if self.verbosity >= 2 or self.debug:
-            for category, pts in breakdown.items():
+        if self._logging(level=2):
+            for category, pts in zip(breakdown._fields, breakdown):
                 if pts > 0:
-                    self._log(f"  {category}: {pts}", level=2)
+                    self._log("  %s: %s", category, pts, level=2)
 
         player.add_score(points, from_play=False)
         self._log(
-            f"{player.name} scores {points} points. ({player.name}: {player.score})",
+            "%s scores %s points. (%s: %s)",
+            player.name,
+            points,
+            player.name,
+            player.score,
             level=1,
         )
 
@@ -409,9 +453,9 @@ class Game:
         self,
         p1_score_before: int,
         p2_score_before: int,
-        p1_breakdown: Dict[str, int],
-        p2_breakdown: Dict[str, int],
-        crib_breakdown: Dict[str, int],
+        p1_breakdown: HandBreakdown,
+        p2_breakdown: HandBreakdown,
+        crib_breakdown: HandBreakdown,
     ) -> None:
         """Export hand details to CSV.
 
@@ -422,7 +466,9 @@ class Game:
             p2_breakdown: Player 2 hand scoring breakdown
             crib_breakdown: Crib scoring breakdown
         """
-        from src.utils.hand_details_exporter import HandDetailsExporter
+        # Card strings are only built for an exporter that will write them
+        if not self.hand_details_exporter:
+            return
 
         # Helper to format cards
         def cards_to_str(cards):
@@ -436,7 +482,7 @@ class Game:
             p1_dealt_cards=cards_to_str(self.dealt_cards[0]),
             p1_kept_cards=cards_to_str(self.players[0].get_play_hand()),
             p1_discards=cards_to_str(self.discarded_cards[0]),
-            p1_hand_score=sum(p1_breakdown.values()),
+            p1_hand_score=sum(p1_breakdown),
             p1_hand_breakdown=p1_breakdown,
             p1_score_before=p1_score_before,
             p1_score_after=self.players[0].get_score(),
@@ -444,13 +490,13 @@ class Game:
             p2_dealt_cards=cards_to_str(self.dealt_cards[1]),
             p2_kept_cards=cards_to_str(self.players[1].get_play_hand()),
             p2_discards=cards_to_str(self.discarded_cards[1]),
-            p2_hand_score=sum(p2_breakdown.values()),
+            p2_hand_score=sum(p2_breakdown),
             p2_hand_breakdown=p2_breakdown,
             p2_score_before=p2_score_before,
             p2_score_after=self.players[1].get_score(),
             # Crib
             crib_cards=cards_to_str(self.crib.get_cards()),
-            crib_score=sum(crib_breakdown.values()),
+            crib_score=sum(crib_breakdown),
             crib_breakdown=crib_breakdown,
             # Shared
             starter_card=str(self.starter),
@@ -459,27 +505,57 @@ class Game:
 
         self.hand_details_exporter.write_record(record)
 
-    def _log(self, message: str, level: int = 1, debug_only: bool = False) -> None:
-        """Log a message based on verbosity settings.
+    def _logging(self, level: int = 1, debug_only: bool = False) -> bool:
+        """Check whether messages at a log level are output.
+
+        Callers use this to skip building expensive messages that would be
+        discarded.
 
         Args:
-            message: Message to log
             level: Minimum verbosity level required (0, 1, 2)
             debug_only: Only log if debug mode is enabled
+
+        Returns:
+            bool: True if _log would output the message
         """
         if debug_only and not self.debug:
+            return False
+        return self.verbosity >= level or self.debug
+
+    def _log(
+        self, message: str, *args, level: int = 1, debug_only: bool = False
+    ) -> None:
+        """Log a message based on verbosity settings.
+
+        Args:
+            message: Message to log, or a %-format string for args
+            *args: Values formatted into message, only if it is logged
+            level: Minimum verbosity level required (0, 1, 2)
+            debug_only: Only log if debug mode is enabled
+        """
+        if not self._logging(level, debug_only):
             return
 
-        should_log = self.verbosity >= level or self.debug
+        if args:
+            message = message % args
 
-        if should_log:
-            # Print to console
-            print(message)
+        # Print to console
+        print(message)
+
+        # Write to log file if configured
+        if self.log_file:
+            if self._log_fh is None:
+                # Stays open across messages until close_log()
+                self._log_fh = open(  # noqa: SIM115
+                    self.log_file, "a", buffering=1 << 16, encoding="utf-8"
+                )
+            self._log_fh.write(message + "\n")
 
-            # Write to log file if configured
-            if self.log_file:
-                with open(self.log_file, "a") as f:
-                    f.write(message + "\n")
+    def close_log(self) -> None:
+        """Flush and close the log file handle, if one is open."""
+        if self._log_fh is not None:
+            self._log_fh.close()
+            self._log_fh = None
 
     def get_scores(self) -> Dict[str, int]:
         """Get current scores for both players.
@@ -47,9 +47,11 @@ class Hand:
         Raises:
             ValueError: If card is not in hand
         """
-        if card not in self.cards:
-            raise ValueError(f"Card {card} not in hand")
-        self.cards.remove(card)
+        # Let the removal's own scan detect a missing card
+        try:
+            self.cards.remove(card)
+        except ValueError:
+            raise ValueError(f"Card {card} not in hand") from None
         return card
 
     def remove_cards(self, cards: List[Card]) -> List[Card]:
@@ -64,13 +66,18 @@ class Hand:
         Raises:
             ValueError: If any card is not in hand
         """
-        for card in cards:
-            if card not in self.cards:
-                raise ValueError(f"Card {card} not in hand")
-
-        for card in cards:
-            self.cards.remove(card)
-
+        # One pass over the hand instead of a find and a remove per card;
+        # matching card ids avoids calling Card.__hash__/__eq__ per lookup
+        remove_ids = {card.card_id for card in cards}
+        kept = [card for card in self.cards if card.card_id not in remove_ids]
+
+        if len(kept) + len(cards) != len(self.cards):
+            for card in cards:
+                if card not in self.cards:
+                    raise ValueError(f"Card {card} not in hand")
+            raise ValueError("Cards to remove must be distinct cards in the hand")
+
+        self.cards[:] = kept
         return cards
 
     def clear(self) -> None:
@@ -101,6 +108,18 @@ class Hand:
         """
         return self.cards.copy()
 
+    def iter_cards(self) -> List[Card]:
+        """Get the hand's cards without copying them.
+
+        Returns the hand's own list, for read-only use: callers must not
+        modify it, and it changes as cards are added or removed. Use
+        get_cards() for a copy.
+
+        Returns:
+            List of Card objects
+        """
+        return self.cards
+
     def __len__(self) -> int:
         """Return the number of cards in the hand."""
         return len(self.cards)
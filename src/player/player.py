@@ -17,12 +17,12 @@ class Player:
     - Play decisions
     """
 
-    def __init__(self, name: str, random_state: Optional[np.random.RandomState] = None):
+    def __init__(self, name: str, rng: Optional[np.random.Generator] = None):
         """Initialize a player.
 
         Args:
             name: Player's name/identifier
-            random_state: Optional numpy RandomState for reproducible decisions
+            rng: Optional numpy Generator for reproducible decisions
         """
         self.name = name
         self.hand = Hand()
@@ -30,9 +30,7 @@ class Player:
         self.score = 0
         self.play_points = 0  # Points scored during play phase
         self.count_points = 0  # Points scored during count phase
-        self.random_state = (
-            random_state if random_state is not None else np.random.RandomState()
-        )
+        self.rng = rng if rng is not None else np.random.default_rng()
 
     def add_cards_to_hand(self, cards: List[Card]) -> None:
         """Add cards to the player's hand.
@@ -57,12 +55,16 @@ class Player:
         if self.hand.size() != Rules.INITIAL_HAND_SIZE:
             raise ValueError(f"Cannot discard from hand of size {self.hand.size()}")
 
-        # Simple strategy: randomly choose 2 cards to discard
-        cards = self.hand.get_cards()
-        discard_indices = self.random_state.choice(len(cards), size=2, replace=False)
-        discards = [cards[i] for i in discard_indices]
+        # Simple strategy: randomly choose 2 distinct cards to discard. Two
+        # integer draws are much cheaper than choice(..., replace=False)
+        cards = self.hand.iter_cards()
+        n_cards = len(cards)
+        i = self.rng.integers(0, n_cards)
+        j = self.rng.integers(0, n_cards - 1)
+        if j >= i:
+            j += 1
 
-        return discards
+        return [cards[i], cards[j]]
 
     def discard_to_crib(self, cards: List[Card]) -> None:
         """Remove discarded cards from hand and save play hand.
@@ -71,7 +73,8 @@ class Player:
             cards: Cards to remove from hand
         """
         self.hand.remove_cards(cards)
-        # Save the 4-card play hand for counting phase
+        # Save the 4-card play hand for counting phase (a copy, since the
+        # hand itself is emptied during play)
         self.play_hand = self.hand.get_cards()
 
     def choose_play_card(self, current_count: int) -> Optional[Card]:
@@ -86,16 +89,14 @@ class Player:
         Returns:
             Card to play, or None if no legal play
         """
-        cards = self.hand.get_cards()
-
-        # Find all playable cards
-        playable = [card for card in cards if Rules.can_play_card(card, current_count)]
-
-        if not playable:
-            return None
-
-        # Simple strategy: play first playable card
-        return playable[0]
+        # Simple strategy: play first playable card (Rules.can_play_card,
+        # inlined as this runs for every card played)
+        max_value = Rules.MAX_PLAY_COUNT - current_count
+        for card in self.hand.iter_cards():
+            if card.value <= max_value:
+                return card
+
+        return None
 
     def play_card(self, card: Card) -> Card:
         """Play a card from hand.
@@ -22,6 +22,9 @@ class Rules:
     PLAY_HAND_SIZE = 4
     MAX_PLAY_COUNT = 31
 
+    # Rank value of a Jack, for his heels (int compare instead of string)
+    JACK_RANK_VALUE = Card.RANK_VALUES["J"]
+
     @staticmethod
     def is_game_won(score: int) -> bool:
         """Check if a score has reached the winning threshold.
@@ -129,4 +132,4 @@ class Rules:
         Returns:
             bool: True if starter is a Jack
         """
-        return starter.rank == "J"
+        return starter.rank_value == Rules.JACK_RANK_VALUE
@@ -1,10 +1,22 @@
 """Scorer class for calculating cribbage points in all scenarios."""
 
-from typing import List, Tuple, Dict
+from functools import lru_cache
+from typing import List, NamedTuple, Tuple
 from itertools import combinations
+
 from src.card.card import Card
 
 
+class HandBreakdown(NamedTuple):
+    """Points scored in each category when counting a hand or crib."""
+
+    fifteens: int
+    pairs: int
+    runs: int
+    flush: int
+    nobs: int
+
+
 class Scorer:
     """Handles all scoring calculations for cribbage.
 
@@ -13,6 +25,9 @@ class Scorer:
     - Count phase (hand/crib): 15s, pairs, runs, flush, nobs
     """
 
+    # Rank value of a Jack, for nobs
+    _JACK_RANK_VALUE = Card.RANK_VALUES["J"]
+
     @staticmethod
     def score_play(
         cards_played: List[Card], last_player_idx: int
@@ -26,14 +41,34 @@ class Scorer:
         Returns:
             Tuple of (points scored, list of scoring reasons)
         """
-        if not cards_played:
-            return 0, []
+        rank_values = tuple(card.rank_value for card in cards_played)
+        points, reasons = Scorer.score_play_ranks(rank_values)
+        return points, list(reasons)
+
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def score_play_ranks(rank_values: Tuple[int, ...]) -> Tuple[int, Tuple[str, ...]]:
+        """Score the latest play from the rank values of the cards played.
+
+        Play scoring depends only on the ranks played (a card's counting value
+        follows from its rank), so results are cached: the same sequences
+        recur across plays and games.
+
+        Args:
+            rank_values: Rank values (A=1, ..., K=13) of the cards played
+                since the last reset, in order
+
+        Returns:
+            Tuple of (points scored, tuple of scoring reasons)
+        """
+        if not rank_values:
+            return 0, ()
 
         points = 0
         reasons = []
 
-        # Calculate current count
-        count = sum(card.value for card in cards_played)
+        # Calculate current count (J/Q/K count 10)
+        count = sum(min(rank_value, 10) for rank_value in rank_values)
 
         # Check for 15
         if count == 15:
@@ -46,38 +81,38 @@ class Scorer:
             reasons.append("31 for 2")
 
         # Check for pairs/triples/quadruples (most recent cards)
-        pair_points, pair_reason = Scorer._score_play_pairs(cards_played)
+        pair_points, pair_reason = Scorer._score_play_pairs(rank_values)
         if pair_points > 0:
             points += pair_points
             reasons.append(pair_reason)
 
         # Check for runs (sequences of 3+ cards in any order)
-        run_points, run_reason = Scorer._score_play_run(cards_played)
+        run_points, run_reason = Scorer._score_play_run(rank_values)
         if run_points > 0:
             points += run_points
             reasons.append(run_reason)
 
-        return points, reasons
+        return points, tuple(reasons)
 
     @staticmethod
-    def _score_play_pairs(cards_played: List[Card]) -> Tuple[int, str]:
+    def _score_play_pairs(rank_values: Tuple[int, ...]) -> Tuple[int, str]:
         """Score pairs during play phase.
 
         Args:
-            cards_played: List of cards played in sequence
+            rank_values: Rank values of the cards played, in order
 
         Returns:
             Tuple of (points, reason string)
         """
-        if len(cards_played) < 2:
+        if len(rank_values) < 2:
             return 0, ""
 
         # Check most recent cards for pairs
-        last_rank = cards_played[-1].rank
+        last_rank = rank_values[-1]
         pair_count = 1
 
-        for i in range(len(cards_played) - 2, -1, -1):
-            if cards_played[i].rank == last_rank:
+        for i in range(len(rank_values) - 2, -1, -1):
+            if rank_values[i] == last_rank:
                 pair_count += 1
             else:
                 break
@@ -92,41 +127,46 @@ class Scorer:
         return 0, ""
 
     @staticmethod
-    def _score_play_run(cards_played: List[Card]) -> Tuple[int, str]:
+    def _score_play_run(rank_values: Tuple[int, ...]) -> Tuple[int, str]:
         """Score runs during play phase.
 
         A run is 3+ consecutive cards in any order.
 
         Args:
-            cards_played: List of cards played in sequence
+            rank_values: Rank values of the cards played, in order
 
         Returns:
             Tuple of (points, reason string)
         """
-        if len(cards_played) < 3:
+        if len(rank_values) < 3:
             return 0, ""
 
-        # Try runs of decreasing length starting from all cards
-        for run_length in range(len(cards_played), 2, -1):
-            recent_cards = cards_played[-run_length:]
-            rank_values = sorted([card.rank_value for card in recent_cards])
-
-            # Check if consecutive
-            is_run = True
-            for i in range(len(rank_values) - 1):
-                if rank_values[i + 1] - rank_values[i] != 1:
-                    is_run = False
-                    break
+        # Walk back from the latest card: the last n cards are a run when
+        # their ranks are distinct and span exactly n values. A repeated rank
+        # rules out every longer run too
+        run_length = 0
+        seen = set()
+        low = high = rank_values[-1]
+        for n_cards, rank_value in enumerate(reversed(rank_values), 1):
+            if rank_value in seen:
+                break
+            seen.add(rank_value)
+            if rank_value < low:
+                low = rank_value
+            elif rank_value > high:
+                high = rank_value
+            if n_cards >= 3 and high - low == n_cards - 1:
+                run_length = n_cards
 
-            if is_run:
-                return run_length, f"run of {run_length} for {run_length}"
+        if run_length:
+            return run_length, f"run of {run_length} for {run_length}"
 
         return 0, ""
 
     @staticmethod
     def score_hand(
         hand_cards: List[Card], starter: Card, is_crib: bool = False
-    ) -> Tuple[int, Dict[str, int]]:
+    ) -> Tuple[int, HandBreakdown]:
         """Score a hand or crib with the starter card.
 
         Args:
@@ -135,100 +175,126 @@ class Scorer:
             is_crib: Whether this is the crib (affects flush scoring)
 
         Returns:
-            Tuple of (total points, dict of scoring breakdown)
+            Tuple of (total points, scoring breakdown)
         """
-        all_cards = hand_cards + [starter]
-        breakdown = {"fifteens": 0, "pairs": 0, "runs": 0, "flush": 0, "nobs": 0}
+        # Sorted rank values of the hand and starter, without first building
+        # a combined card list
+        rank_values = [card.rank_value for card in hand_cards]
+        rank_values.append(starter.rank_value)
+        rank_values.sort()
+        fifteens, pairs, runs = Scorer._score_ranks(tuple(rank_values))
 
-        # Score 15s
-        breakdown["fifteens"] = Scorer._score_fifteens(all_cards)
+        # Flush and nobs depend on suits, so are scored per hand
+        flush = Scorer._score_flush(hand_cards, starter, is_crib)
+        nobs = Scorer._score_nobs(hand_cards, starter)
 
-        # Score pairs
-        breakdown["pairs"] = Scorer._score_pairs(all_cards)
+        total = fifteens + pairs + runs + flush + nobs
+        return total, HandBreakdown(fifteens, pairs, runs, flush, nobs)
 
-        # Score runs
-        breakdown["runs"] = Scorer._score_runs(all_cards)
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def _score_ranks(rank_values: Tuple[int, ...]) -> Tuple[int, int, int]:
+        """Score fifteens, pairs and runs, which depend only on the ranks.
 
-        # Score flush
-        breakdown["flush"] = Scorer._score_flush(hand_cards, starter, is_crib)
+        Cached: five cards have only 6175 distinct sorted rank tuples, so
+        after warm-up this is a lookup for every hand.
 
-        # Score nobs (Jack of same suit as starter)
-        breakdown["nobs"] = Scorer._score_nobs(hand_cards, starter)
+        Args:
+            rank_values: Sorted rank values (A=1, ..., K=13) of the cards
 
-        total = sum(breakdown.values())
-        return total, breakdown
+        Returns:
+            Tuple of (fifteens, pairs, runs) points
+        """
+        values = tuple(min(rank_value, 10) for rank_value in rank_values)
+
+        # Cards per rank, shared by pairs and runs; index 14 stays 0 to end a
+        # run reaching K
+        rank_counts = [0] * 15
+        for rank_value in rank_values:
+            rank_counts[rank_value] += 1
+
+        return (
+            Scorer._score_fifteens(values),
+            Scorer._score_pairs(rank_counts),
+            Scorer._score_runs(rank_counts),
+        )
 
     @staticmethod
-    def _score_fifteens(cards: List[Card]) -> int:
+    def _score_fifteens(values: Tuple[int, ...]) -> int:
         """Count all combinations that sum to 15.
 
         Args:
-            cards: List of cards to check
+            values: Counting values of the cards, sorted ascending
 
         Returns:
             Points scored (2 per fifteen)
         """
+        # No combination can reach 15 if all the cards together fall short
+        if sum(values) < 15:
+            return 0
+
         count = 0
         # Check all possible combinations of cards
-        for r in range(1, len(cards) + 1):
-            for combo in combinations(cards, r):
-                if sum(card.value for card in combo) == 15:
+        for r in range(1, len(values) + 1):
+            # Once the r lowest cards pass 15, so does every r or more cards
+            if sum(values[:r]) > 15:
+                break
+            for combo in combinations(values, r):
+                if sum(combo) == 15:
                     count += 1
 
         return count * 2
 
     @staticmethod
-    def _score_pairs(cards: List[Card]) -> int:
+    def _score_pairs(rank_counts: List[int]) -> int:
         """Count all pairs in the cards.
 
         Args:
-            cards: List of cards to check
+            rank_counts: Number of cards of each rank value
 
         Returns:
             Points scored (2 per pair)
         """
-        count = 0
-        for i, card1 in enumerate(cards):
-            for card2 in cards[i + 1 :]:
-                if card1.rank == card2.rank:
-                    count += 1
-
-        return count * 2
+        # n cards of a rank make n * (n - 1) / 2 pairs
+        return sum(count * (count - 1) for count in rank_counts)
 
     @staticmethod
-    def _score_runs(cards: List[Card]) -> int:
+    def _score_runs(rank_counts: List[int]) -> int:
         """Find the longest run(s) and score them.
 
         A run is 3+ consecutive cards. Multiple runs of the same length
         count separately (e.g., double run of 3).
 
         Args:
-            cards: List of cards to check
+            rank_counts: Number of cards of each rank value (A=1, ..., K=13),
+                ending with a zero past K
 
         Returns:
             Points scored (1 per card per run)
         """
-        # Try to find runs from longest to shortest
-        for run_length in range(len(cards), 2, -1):
-            run_count = 0
-            for combo in combinations(cards, run_length):
-                rank_values = sorted([card.rank_value for card in combo])
-
-                # Check if consecutive
-                is_run = True
-                for i in range(len(rank_values) - 1):
-                    if rank_values[i + 1] - rank_values[i] != 1:
-                        is_run = False
-                        break
-
-                if is_run:
-                    run_count += 1
-
-            # If we found run(s) of this length, return the score
-            if run_count > 0:
-                return run_length * run_count
-
-        return 0
+        # Each stretch of consecutive ranks present is a run once 3+ long,
+        # repeated once per way of picking one card of each rank. Only the
+        # longest runs score
+        best_length = 0
+        points = 0
+        run_length = 0
+        run_count = 1
+        for count in rank_counts[1:]:
+            if count:
+                run_length += 1
+                run_count *= count
+                continue
+
+            if run_length >= 3:
+                if run_length > best_length:
+                    best_length = run_length
+                    points = run_length * run_count
+                elif run_length == best_length:
+                    points += run_length * run_count
+            run_length = 0
+            run_count = 1
+
+        return points
 
     @staticmethod
     def _score_flush(hand_cards: List[Card], starter: Card, is_crib: bool) -> int:
@@ -245,24 +311,22 @@ class Scorer:
         if len(hand_cards) != 4:
             return 0
 
-        hand_suit = hand_cards[0].suit
-        all_hand_same = all(card.suit == hand_suit for card in hand_cards)
-
-        if not all_hand_same:
+        # Integer suit compares, stopping at the first card off suit
+        card0, card1, card2, card3 = hand_cards
+        hand_suit = card0.suit_idx
+        if not (
+            card1.suit_idx == hand_suit
+            and card2.suit_idx == hand_suit
+            and card3.suit_idx == hand_suit
+        ):
             return 0
 
-        # For crib, all 5 cards must match
-        if is_crib:
-            if starter.suit == hand_suit:
-                return 5
-            else:
-                return 0
-
         # For hand, 4 cards = 4 points, 5 cards = 5 points
-        if starter.suit == hand_suit:
+        if starter.suit_idx == hand_suit:
             return 5
-        else:
-            return 4
+
+        # For crib, all 5 cards must match
+        return 0 if is_crib else 4
 
     @staticmethod
     def _score_nobs(hand_cards: List[Card], starter: Card) -> int:
@@ -275,7 +339,11 @@ class Scorer:
         Returns:
             1 if hand contains Jack of starter's suit, else 0
         """
+        starter_suit = starter.suit_idx
         for card in hand_cards:
-            if card.rank == "J" and card.suit == starter.suit:
+            if (
+                card.rank_value == Scorer._JACK_RANK_VALUE
+                and card.suit_idx == starter_suit
+            ):
                 return 1
         return 0
@@ -0,0 +1,78 @@
+"""Background thread for writing CSV records off the simulation loop."""
+
+import queue
+import threading
+from typing import Any, List, Optional
+
+# Queue sentinel telling the writer thread to flush and exit
+_STOP = object()
+
+
+class BackgroundWriter:
+    """Writes exporter records on a background thread.
+
+    Exposes the same write_record() interface as the CSV exporters, so it can
+    stand in for one (e.g. as a Game's hand_details_exporter). Records are
+    queued and written in batches by a single thread, preserving their order.
+    """
+
+    def __init__(self, exporter, batch_size: int = 64, max_queued: int = 1024):
+        """Initialize and start the writer thread.
+
+        Args:
+            exporter: Exporter with write_records(records) and close() methods
+            batch_size: Number of records written per exporter call
+            max_queued: Maximum queued records before write_record blocks
+        """
+        self.exporter = exporter
+        self.batch_size = batch_size
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queued)
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def write_record(self, record: Any) -> None:
+        """Queue a record for writing.
+
+        Args:
+            record: Record to write as one CSV row, as the exporter takes it
+        """
+        if self._error is not None:
+            raise self._error
+        self._queue.put(record)
+
+    def close(self) -> None:
+        """Write any queued records, stop the writer thread and close the exporter."""
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+    def _run(self) -> None:
+        """Drain the queue, writing records in batches until stopped."""
+        batch: List[Any] = []
+        while True:
+            record = self._queue.get()
+            stop = record is _STOP
+            if not stop:
+                batch.append(record)
+
+            if batch and (stop or len(batch) >= self.batch_size):
+                # After a failure keep draining so producers never block.
+                # Any error is recorded: letting one end the thread would
+                # leave producers blocked on a full queue
+                if self._error is None:
+                    try:
+                        self.exporter.write_records(batch)
+                    except BaseException as e:  # noqa: BLE001
+                        self._error = e
+                batch = []
+
+            if stop:
+                try:
+                    self.exporter.close()
+                except BaseException as e:  # noqa: BLE001
+                    if self._error is None:
+                        self._error = e
+                return
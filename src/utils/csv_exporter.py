@@ -1,6 +1,7 @@
 """CSV export utilities for game statistics."""
 
 import csv
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -33,6 +34,9 @@ class CSVExporter:
         "random_seed",
     ]
 
+    # Pulls a record's values out in column order
+    _row = itemgetter(*FIELDNAMES)
+
     def __init__(self, csv_file_path: Path):
         """Initialize CSV exporter.
 
@@ -41,6 +45,39 @@ class CSVExporter:
         """
         self.csv_file_path = csv_file_path
         self.game_records: List[Dict] = []
+        # File handle and row writer, opened on the first write
+        self._fh = None
+        self._writer = None
+
+    def _get_writer(self):
+        """Get the CSV row writer, opening the file for appending if needed.
+
+        Returns:
+            csv.writer over the open file
+        """
+        if self._writer is None:
+            # Stays open across writes until close() (or leaving a with block)
+            self._fh = open(  # noqa: SIM115
+                self.csv_file_path, "a", newline="", buffering=1 << 20
+            )
+            self._writer = csv.writer(self._fh)
+        return self._writer
+
+    def close(self) -> None:
+        """Flush written rows and close the file."""
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+            self._writer = None
+
+    def __enter__(self) -> "CSVExporter":
+        """Use the exporter as a context manager that closes the file on exit."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Write any buffered game records, then flush and close the file."""
+        self.write_all_records()
+        self.close()
 
     def add_game_record(self, record: Dict) -> None:
         """Add a game record to the buffer.
@@ -51,24 +88,27 @@ class CSVExporter:
         self.game_records.append(record)
 
     def write_record(self, record: Dict) -> None:
-        """Write a single record immediately to CSV.
+        """Write a single record to CSV.
 
         Args:
             record: Dictionary containing game statistics
         """
-        with open(self.csv_file_path, "a", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=self.FIELDNAMES)
-            writer.writerow(record)
+        self._get_writer().writerow(self._row(record))
+
+    def write_records(self, records: List[Dict]) -> None:
+        """Write a batch of records to CSV.
+
+        Args:
+            records: Dictionaries containing game statistics
+        """
+        self._get_writer().writerows(map(self._row, records))
 
     def write_all_records(self) -> None:
         """Write all buffered records to CSV."""
         if not self.game_records:
             return
 
-        with open(self.csv_file_path, "a", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=self.FIELDNAMES)
-            writer.writerows(self.game_records)
-
+        self.write_records(self.game_records)
         self.game_records.clear()
 
     @staticmethod
@@ -2,7 +2,9 @@
 
 import csv
 from pathlib import Path
-from typing import Dict
+from typing import List, Tuple
+
+from src.score.scorer import HandBreakdown
 
 
 class HandDetailsExporter:
@@ -64,16 +66,54 @@ class HandDetailsExporter:
             csv_file_path: Path to CSV file
         """
         self.csv_file_path = csv_file_path
+        # File handle and row writer, opened on the first write
+        self._fh = None
+        self._writer = None
+
+    def _get_writer(self):
+        """Get the CSV row writer, opening the file for appending if needed.
+
+        Returns:
+            csv.writer over the open file
+        """
+        if self._writer is None:
+            # Stays open across writes until close() (or leaving a with block)
+            self._fh = open(  # noqa: SIM115
+                self.csv_file_path, "a", newline="", buffering=1 << 20
+            )
+            self._writer = csv.writer(self._fh)
+        return self._writer
+
+    def close(self) -> None:
+        """Flush written rows and close the file."""
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+            self._writer = None
+
+    def __enter__(self) -> "HandDetailsExporter":
+        """Use the exporter as a context manager that closes the file on exit."""
+        return self
 
-    def write_record(self, record: Dict) -> None:
-        """Write a single hand record immediately to CSV.
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Flush written rows and close the file."""
+        self.close()
+
+    def write_record(self, record: Tuple) -> None:
+        """Write a single hand record to CSV.
+
+        Args:
+            record: Hand details, as built by create_hand_record
+        """
+        self._get_writer().writerow(record)
+
+    def write_records(self, records: List[Tuple]) -> None:
+        """Write a batch of records to CSV.
 
         Args:
-            record: Dictionary containing hand details
+            records: Hand details, as built by create_hand_record
         """
-        with open(self.csv_file_path, "a", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=self.FIELDNAMES)
-            writer.writerow(record)
+        self._get_writer().writerows(records)
 
     @staticmethod
     def create_hand_record(
@@ -85,7 +125,7 @@ class HandDetailsExporter:
         p1_kept_cards: str,
         p1_discards: str,
         p1_hand_score: int,
-        p1_hand_breakdown: Dict[str, int],
+        p1_hand_breakdown: HandBreakdown,
         p1_score_before: int,
         p1_score_after: int,
         # Player 2
@@ -93,19 +133,22 @@ class HandDetailsExporter:
         p2_kept_cards: str,
         p2_discards: str,
         p2_hand_score: int,
-        p2_hand_breakdown: Dict[str, int],
+        p2_hand_breakdown: HandBreakdown,
         p2_score_before: int,
         p2_score_after: int,
         # Crib
         crib_cards: str,
         crib_score: int,
-        crib_breakdown: Dict[str, int],
+        crib_breakdown: HandBreakdown,
         # Shared
         starter_card: str,
         his_heels: bool,
-    ) -> Dict:
+    ) -> Tuple:
         """Create a hand details record.
 
+        Records are plain tuples in FIELDNAMES order: cheaper to build, pass
+        between processes and write than one dict per hand.
+
         Args:
             game_number: Game number
             hand_number: Hand number within game
@@ -114,62 +157,50 @@ class HandDetailsExporter:
             p1_kept_cards: Player 1's 4 kept cards
             p1_discards: Player 1's 2 discarded cards
             p1_hand_score: Player 1's hand score
-            p1_hand_breakdown: Player 1's scoring breakdown dict
+            p1_hand_breakdown: Player 1's scoring breakdown
             p1_score_before: Player 1's score before this hand
             p1_score_after: Player 1's score after this hand
             p2_dealt_cards: Player 2's 6 dealt cards
             p2_kept_cards: Player 2's 4 kept cards
             p2_discards: Player 2's 2 discarded cards
             p2_hand_score: Player 2's hand score
-            p2_hand_breakdown: Player 2's scoring breakdown dict
+            p2_hand_breakdown: Player 2's scoring breakdown
             p2_score_before: Player 2's score before this hand
             p2_score_after: Player 2's score after this hand
             crib_cards: Crib cards (4 cards)
             crib_score: Crib score
-            crib_breakdown: Crib scoring breakdown dict
+            crib_breakdown: Crib scoring breakdown
             starter_card: The starter card
             his_heels: Whether starter was Jack
 
         Returns:
-            Dictionary with hand details
+            Tuple of hand details in FIELDNAMES order
         """
-        return {
-            "game_number": game_number,
-            "hand_number": hand_number,
-            "dealer": dealer,
+        return (
+            game_number,
+            hand_number,
+            dealer,
             # Player 1
-            "p1_dealt_cards": p1_dealt_cards,
-            "p1_kept_cards": p1_kept_cards,
-            "p1_discards": p1_discards,
-            "p1_hand_score": p1_hand_score,
-            "p1_hand_fifteens": p1_hand_breakdown.get("fifteens", 0),
-            "p1_hand_pairs": p1_hand_breakdown.get("pairs", 0),
-            "p1_hand_runs": p1_hand_breakdown.get("runs", 0),
-            "p1_hand_flush": p1_hand_breakdown.get("flush", 0),
-            "p1_hand_nobs": p1_hand_breakdown.get("nobs", 0),
-            "p1_score_before": p1_score_before,
-            "p1_score_after": p1_score_after,
+            p1_dealt_cards,
+            p1_kept_cards,
+            p1_discards,
+            p1_hand_score,
+            *p1_hand_breakdown,
+            p1_score_before,
+            p1_score_after,
             # Player 2
-            "p2_dealt_cards": p2_dealt_cards,
-            "p2_kept_cards": p2_kept_cards,
-            "p2_discards": p2_discards,
-            "p2_hand_score": p2_hand_score,
-            "p2_hand_fifteens": p2_hand_breakdown.get("fifteens", 0),
-            "p2_hand_pairs": p2_hand_breakdown.get("pairs", 0),
-            "p2_hand_runs": p2_hand_breakdown.get("runs", 0),
-            "p2_hand_flush": p2_hand_breakdown.get("flush", 0),
-            "p2_hand_nobs": p2_hand_breakdown.get("nobs", 0),
-            "p2_score_before": p2_score_before,
-            "p2_score_after": p2_score_after,
+            p2_dealt_cards,
+            p2_kept_cards,
+            p2_discards,
+            p2_hand_score,
+            *p2_hand_breakdown,
+            p2_score_before,
+            p2_score_after,
             # Crib
-            "crib_cards": crib_cards,
-            "crib_score": crib_score,
-            "crib_fifteens": crib_breakdown.get("fifteens", 0),
-            "crib_pairs": crib_breakdown.get("pairs", 0),
-            "crib_runs": crib_breakdown.get("runs", 0),
-            "crib_flush": crib_breakdown.get("flush", 0),
-            "crib_nobs": crib_breakdown.get("nobs", 0),
+            crib_cards,
+            crib_score,
+            *crib_breakdown,
             # Shared
-            "starter_card": starter_card,
-            "his_heels": his_heels,
-        }
+            starter_card,
+            his_heels,
+        )
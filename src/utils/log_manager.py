@@ -1,9 +1,13 @@
 """Log file management utilities."""
 
+import csv
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+# CSV filenames for the standard suffixes
+_CSV_FILENAMES = {"": "summary.csv", "_hands": "hands.csv"}
+
 
 class LogManager:
     """Manages log file creation and organization.
@@ -24,21 +28,27 @@ class LogManager:
         self.log_file_path: Optional[Path] = None
         self.csv_file_path: Optional[Path] = None
 
-    def initialize_log_file(self) -> Path:
-        """Create log directory structure and log file.
+    def _ensure_run_dir(self) -> Path:
+        """Create the run directory (YYYY-MM-DD/HH-MM-SS/) if not already created.
 
         Returns:
-            Path to the created log file
+            Path to the run directory
         """
-        # Create run directory (YYYY-MM-DD/HH-MM-SS/)
         if self.run_dir is None:
             date_dir = self.base_dir / self.timestamp.strftime("%Y-%m-%d")
             time_dir = date_dir / self.timestamp.strftime("%H-%M-%S")
             time_dir.mkdir(parents=True, exist_ok=True)
             self.run_dir = time_dir
+        return self.run_dir
 
+    def initialize_log_file(self) -> Path:
+        """Create log directory structure and log file.
+
+        Returns:
+            Path to the created log file
+        """
         # Create log file (simulation.log)
-        self.log_file_path = self.run_dir / "simulation.log"
+        self.log_file_path = self._ensure_run_dir() / "simulation.log"
 
         # Create the log file
         self.log_file_path.touch()
@@ -55,31 +65,17 @@ class LogManager:
         Returns:
             Path to the created CSV file
         """
-        # Create run directory (YYYY-MM-DD/HH-MM-SS/) if not already created
-        if self.run_dir is None:
-            date_dir = self.base_dir / self.timestamp.strftime("%Y-%m-%d")
-            time_dir = date_dir / self.timestamp.strftime("%H-%M-%S")
-            time_dir.mkdir(parents=True, exist_ok=True)
-            self.run_dir = time_dir
+        # Determine CSV filename based on suffix; a custom suffix drops any
+        # leading underscore
+        csv_filename = _CSV_FILENAMES.get(suffix)
+        if csv_filename is None:
+            csv_filename = f"{suffix.lstrip('_')}.csv"
 
-        # Determine CSV filename based on suffix
-        if suffix == "_hands":
-            csv_filename = "hands.csv"
-        elif not suffix:
-            csv_filename = "summary.csv"
-        else:
-            # Custom suffix - remove leading underscore if present
-            clean_suffix = suffix.lstrip("_")
-            csv_filename = f"{clean_suffix}.csv"
-
-        csv_file_path = self.run_dir / csv_filename
+        csv_file_path = self._ensure_run_dir() / csv_filename
 
         # Write CSV header
-        import csv
-
         with open(csv_file_path, "w", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
+            csv.writer(f).writerow(fieldnames)
 
         # Store the summary CSV path (when suffix is empty)
         if not suffix:
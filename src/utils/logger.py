@@ -28,6 +28,15 @@ class Logger:
         self.verbosity = max(0, min(2, verbosity))  # Clamp to [0, 2]
         self.debug = debug
         self.output = output
+        self._update_levels()
+
+    def _update_levels(self) -> None:
+        """Precompute which levels are output, for a cheap check per message.
+
+        Entry i covers level i; the last entry covers every level above the
+        highest verbosity, which only debug mode outputs.
+        """
+        self._enabled_at = [self.debug or self.verbosity >= level for level in range(4)]
 
     def log(self, message: str, level: int = 1, debug_only: bool = False) -> None:
         """Log a message based on verbosity settings.
@@ -40,7 +49,8 @@ class Logger:
         if debug_only and not self.debug:
             return
 
-        if self.verbosity >= level or self.debug:
+        # Levels of 0 or below are always output, like verbosity >= level
+        if level <= 0 or self._enabled_at[min(level, 3)]:
             print(message, file=self.output)
 
     def log_debug(self, message: str) -> None:
@@ -67,6 +77,7 @@ class Logger:
             verbosity: New verbosity level (0-2)
         """
         self.verbosity = max(0, min(2, verbosity))
+        self._update_levels()
 
     def set_debug(self, debug: bool) -> None:
         """Update debug mode.
@@ -75,3 +86,4 @@ class Logger:
             debug: Enable/disable debug mode
         """
         self.debug = debug
+        self._update_levels()
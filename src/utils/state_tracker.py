@@ -1,6 +1,7 @@
 """State tracking utilities for reproducibility."""
 
-import numpy as np
+import secrets
+from typing import Optional
 
 
 class StateTracker:
@@ -20,25 +21,31 @@ class StateTracker:
         self.current_seed: int = 0
         self.game_seeds: list = []
 
-    def initialize_random_state(self) -> np.random.RandomState:
-        """Create a new random state and track its seed.
+    def next_seed(self) -> Optional[int]:
+        """Draw the seed for the next game and make it the current seed.
 
         Returns:
-            numpy RandomState object
+            Seed for the game, or None when not tracking (fresh random state)
         """
         if self.track_states:
-            # Generate a random seed to track
-            self.current_seed = np.random.randint(0, 2**31 - 1)
-            random_state = np.random.RandomState(self.current_seed)
-        else:
-            # Use default random state without tracking
-            random_state = np.random.RandomState()
-            self.current_seed = 0
-
-        return random_state
-
-    def record_game_seed(self) -> None:
-        """Record the seed for the completed game."""
+            # Generate a random seed to track (same range as before, without
+            # drawing from NumPy's global random state)
+            self.current_seed = secrets.randbelow(2**31 - 1)
+            return self.current_seed
+
+        # Use default random state without tracking
+        self.current_seed = 0
+        return None
+
+    def record_game_seed(self, seed: Optional[int] = None) -> None:
+        """Record the seed for the completed game.
+
+        Args:
+            seed: Seed the game was played with, when drawn ahead of time
+                with next_seed() (default: the current seed)
+        """
+        if seed is not None:
+            self.current_seed = seed
         if self.track_states:
             self.game_seeds.append(self.current_seed)
 
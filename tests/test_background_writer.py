@@ -0,0 +1,47 @@
+"""Tests for the background CSV writer."""
+
+import threading
+
+import pytest
+
+from src.utils.background_writer import BackgroundWriter
+
+
+class _FailingExporter:
+    """Exporter whose writes always fail."""
+
+    def __init__(self):
+        self.closed = False
+
+    def write_records(self, records):
+        raise ValueError("I/O operation on closed file")
+
+    def close(self):
+        self.closed = True
+
+
+def test_write_error_does_not_hang_producer():
+    """Any exporter error reaches the producer instead of blocking it."""
+    exporter = _FailingExporter()
+    writer = BackgroundWriter(exporter, batch_size=1, max_queued=4)
+    errors = []
+
+    def produce():
+        try:
+            for i in range(100):
+                writer.write_record(i)
+        except ValueError as e:
+            errors.append(e)
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    producer.join(timeout=5)
+
+    assert not producer.is_alive()
+    assert errors
+    with pytest.raises(ValueError):
+        writer.close()
+    # Closing again still reports the error
+    with pytest.raises(ValueError):
+        writer.close()
+    assert exporter.closed
@@ -0,0 +1,20 @@
+"""Tests for best hands analysis."""
+
+import pandas as pd
+
+from src.analysis.best_hands import _aggregate_scores
+
+
+def test_aggregate_scores_drops_missing_keys():
+    """Rows with a missing key are dropped, as groupby does by default."""
+    keys = pd.Series(["a", None, "a", "b"])
+    scores = pd.Series([1, 100, 3, 5])
+
+    stats = _aggregate_scores(keys, scores, "hand").set_index("hand")
+
+    expected = scores.groupby(keys).agg(["mean", "min", "max", "count"])
+    assert list(stats.index) == ["a", "b"]
+    assert stats["avg_score"].tolist() == expected["mean"].tolist()
+    assert stats["min_score"].tolist() == expected["min"].tolist()
+    assert stats["max_score"].tolist() == expected["max"].tolist()
+    assert stats["count"].tolist() == expected["count"].tolist()
@@ -0,0 +1,20 @@
+"""Tests for the verbosity logger."""
+
+import io
+
+import pytest
+
+from src.utils.logger import Logger
+
+
+@pytest.mark.parametrize("verbosity", [0, 1, 2])
+@pytest.mark.parametrize("debug", [False, True])
+@pytest.mark.parametrize("level", [-1, 0, 1, 2, 3, 5])
+def test_log_levels_outside_verbosity_range(verbosity, debug, level):
+    """Any int level is output exactly when verbosity >= level or debug."""
+    logger = Logger(verbosity, debug, output=io.StringIO())
+
+    logger.log("message", level=level)
+
+    logged = logger.output.getvalue() == "message\n"
+    assert logged == (verbosity >= level or debug)
@@ -0,0 +1,32 @@
+"""Tests for scoring distribution analysis."""
+
+import csv
+import math
+
+from analyze import load_data
+from src.analysis.scoring_distribution import (
+    analyze_crib_score_distribution,
+    analyze_hand_score_distribution,
+    summarize_scoring_breakdown,
+)
+from src.utils.hand_details_exporter import HandDetailsExporter
+
+
+def test_empty_hands_csv_gives_nan_stats(tmp_path):
+    """A header-only hands CSV yields NaN stats instead of raising."""
+    hands_csv = tmp_path / "hands.csv"
+    with open(hands_csv, "w", newline="") as f:
+        csv.writer(f).writerow(HandDetailsExporter.FIELDNAMES)
+    df, _ = load_data(str(hands_csv), cache_parquet=False)
+
+    hand_stats, hand_scores = analyze_hand_score_distribution(df)
+    crib_stats, crib_scores = analyze_crib_score_distribution(df)
+
+    assert len(hand_scores) == 0 and len(crib_scores) == 0
+    for stats in (hand_stats, crib_stats):
+        for key in ("mean", "median", "std", "min", "max", "zero_pct"):
+            assert math.isnan(stats[key])
+        assert stats["zero_count"] == 0
+    assert hand_stats["perfect_29_count"] == 0
+    assert math.isnan(hand_stats["perfect_29_pct"])
+    assert summarize_scoring_breakdown(df)["avg_points"].isna().all()